@@ -1,21 +1,25 @@
 import asyncio
 import sys
+from contextlib import asynccontextmanager
 
 from decouple import config
 from dotenv import load_dotenv
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 from mangum import Mangum
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from applibry_api.application.v1 import apps, auth, categories, permissions, platforms, public, roles, tags, users
-from applibry_api.application.v1 import integrations
+from applibry_api.application.v1 import integrations, internal
 from applibry_api.application.v1 import analytics
 from applibry_api.application.v1.analytics import controller
-from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.counters import run_counter_compactor
+from applibry_api.infrastructure.providers.nattypad import nattypad_client
 from applibry_api.domain.exceptions.base_exception import AppBaseException
 from applibry_api.domain.schemas.common_schema import RouteErrorResponseSchema
+from applibry_api.domain.utilities.config import settings
+from applibry_api.domain.utilities.json_response import FastJSONResponse
 
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -23,12 +27,27 @@ if sys.platform == "win32":
 load_dotenv()
 
 IS_PROD = config("IS_PROD", cast=bool, default=True)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await nattypad_client.start()
+    compactor = None
+    if settings.COUNTER_COMPACTOR_INTERVAL > 0 and not settings.IS_LAMBDA:
+        compactor = asyncio.create_task(run_counter_compactor())
+    yield
+    if compactor:
+        compactor.cancel()
+    await nattypad_client.close()
+
+
 app = FastAPI(
     title="Applibry API",
     docs_url=None if IS_PROD else "/docs",
     redoc_url=None if IS_PROD else "/redoc",
     openapi_url=None if IS_PROD else "/openapi.json",
-    dependencies=[Depends(get_db)]
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 @app.exception_handler(AppBaseException)
@@ -54,6 +73,7 @@ app.include_router(apps.controller.router, prefix="/api/v1")
 app.include_router(auth.controller.router, prefix="/api/v1")
 app.include_router(categories.controller.router, prefix="/api/v1")
 app.include_router(integrations.controller.router, prefix="/api/v1")
+app.include_router(internal.controller.router, prefix="/api/v1")
 app.include_router(permissions.controller.router, prefix="/api/v1")
 app.include_router(platforms.controller.router, prefix="/api/v1")
 app.include_router(public.controller.router, prefix="/api/v1")
@@ -61,10 +81,13 @@ app.include_router(roles.controller.router, prefix="/api/v1")
 app.include_router(analytics.controller.router, prefix="/api/v1")
 app.include_router(tags.controller.router, prefix="/api/v1")
 app.include_router(users.controller.router, prefix="/api/v1")
+app.include_router(auth.controller.well_known_router)
 
 
 @app.get("/")
 async def root():
     return {"message": "Welcome to Applibry API Documentation!"}
 
-handler = Mangum(app = app)
+# Lambda freezes the container between invocations, so there is nothing for the
+# lifespan to keep running; clients are created on first use instead.
+handler = Mangum(app = app, lifespan="off")
@@ -0,0 +1,102 @@
+"""Auth overhead per request, with and without the verified-token and principal caches.
+
+    python scripts/auth_benchmark.py --username jane [--requests 500]
+
+Times jwt.decode against the cached decode_token first, then drives
+GET /api/v1/apps and /api/v1/users/profile in-process (httpx ASGI transport)
+with both caches disabled and enabled, using an access token minted for
+--username. Needs the API's .env and a reachable database.
+"""
+import argparse
+import asyncio
+import datetime
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+from jose import jwt  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from applibry_api.application.v1.users import principal  # noqa: E402
+from applibry_api.domain.entities.user import User  # noqa: E402
+from applibry_api.domain.utilities.config import settings  # noqa: E402
+from applibry_api.infrastructure.persistence import database  # noqa: E402
+from main import app  # noqa: E402
+
+ROUTES = ("/api/v1/apps?limit=20", "/api/v1/users/profile")
+
+
+async def mint_token(username: str) -> str:
+    async with database.async_session() as session:
+        user = (await session.execute(select(User).filter(User.username == username))).scalar_one()
+    now = datetime.datetime.utcnow()
+    claims = {"sub": user.username, "sid": str(user.id), "iat": now, "nbf": now,
+              "exp": now + datetime.timedelta(hours=1), "type": "access"}
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+CACHES = (
+    (database._verified_tokens, database._VERIFIED_TOKENS_NAMESPACE, settings.TOKEN_CACHE_MAX_ENTRIES),
+    (principal._principals, principal._PRINCIPALS_NAMESPACE, settings.PRINCIPAL_CACHE_MAX_ENTRIES),
+)
+
+
+async def set_caches(enabled: bool):
+    for cache, namespace, size in CACHES:
+        await cache.invalidate(namespace)
+        cache.max_entries = size if enabled else 0
+
+
+async def decode_report(token: str, runs: int):
+    uncached = timeit.timeit(lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+                             number=runs) / runs
+    await set_caches(True)
+    await database.decode_token(token)
+    started = time.perf_counter()
+    for _ in range(runs):
+        await database.decode_token(token)
+    cached = (time.perf_counter() - started) / runs
+    print(f"jwt.decode {uncached * 1e6:8.1f} us   cached decode_token {cached * 1e6:8.1f} us")
+
+
+async def route_report(token: str, requests: int):
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        for route in ROUTES:
+            results = {}
+            for label, enabled in (("before", False), ("after", True)):
+                await set_caches(enabled)
+                await client.get(route)  # warm-up
+                timings = []
+                for _ in range(requests):
+                    started = time.perf_counter()
+                    response = await client.get(route)
+                    timings.append(time.perf_counter() - started)
+                    response.raise_for_status()
+                results[label] = timings
+            before, after = (statistics.median(results[label]) * 1000 for label in ("before", "after"))
+            print(f"{route:32} p50 before {before:7.2f} ms   after {after:7.2f} ms   saved {before - after:6.2f} ms")
+
+
+async def run(args):
+    token = await mint_token(args.username)
+    await decode_report(token, args.requests * 10)
+    await route_report(token, args.requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--requests", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
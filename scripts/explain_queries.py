@@ -0,0 +1,125 @@
+"""Query-plan report: EXPLAINs the services' hot queries and fails on sequential scans.
+
+    python scripts/explain_queries.py [--verbose]
+
+Each query is EXPLAINed with enable_seqscan off, so on a small or freshly
+seeded database the planner still picks an index whenever one can serve
+the query; a Seq Scan left in the plan means no index matches. Prints the
+scans each plan uses (--verbose prints the full plans). Uses DATABASE_URL
+from the environment/.env like the API and exits 1 if any plan still
+scans a table. tests/test_query_plans.py asserts the same plans under
+pytest when TEST_DATABASE_URL points at a migrated Postgres database.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import and_, func, or_, select, text  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from applibry_api.application.v1.apps.projection import app_projection  # noqa: E402
+# Every entity module, as migrations/env.py imports them, so string relationships resolve
+from applibry_api.domain.entities import (  # noqa: E402,F401
+    app, app_platform, app_tag, category, counter_delta, permission, platform, review, role, role_permission, tag,
+    user, user_app, user_category,
+)
+from applibry_api.domain.entities.app import App  # noqa: E402
+from applibry_api.domain.entities.app_platform import app_platforms  # noqa: E402
+from applibry_api.domain.entities.app_tag import app_tags  # noqa: E402
+from applibry_api.domain.entities.category import Category  # noqa: E402
+from applibry_api.domain.entities.user import User  # noqa: E402
+from applibry_api.domain.entities.user_app import user_apps  # noqa: E402
+from applibry_api.infrastructure.persistence.database import async_session  # noqa: E402
+
+# Values only shape the plan; they need not exist
+SAMPLE_ID = UUID(int=1)
+PAGE = 21
+
+# name -> statement, mirroring the service queries with representative values
+QUERIES = {
+    "auth: user by email": select(User).filter(func.lower(User.email) == "jane@example.com"),
+    "auth: user by username": select(User).filter(func.lower(User.username) == "jane"),
+    "auth: user by public key": select(User).filter(User.public_key == str(SAMPLE_ID)),
+    "users: admin email search": select(User).filter(User.email.ilike("%example%")),
+    "roles: users of a role": select(User.id).filter(User.role_id == SAMPLE_ID),
+    "apps: category listing": app_projection().filter(App.category_id == SAMPLE_ID).order_by(App.name).limit(PAGE),
+    "apps: personalised feed": (
+        app_projection()
+        .join(App.category)
+        .join(Category.users)
+        .filter(User.id == SAMPLE_ID)
+        .filter(~App.users.any(User.id == SAMPLE_ID))
+        .order_by(App.name)
+        .limit(PAGE)
+    ),
+    "apps: trending": (
+        app_projection().filter(App.trending.is_(True), App.is_deleted.is_not(True)).order_by(App.name).limit(PAGE)
+    ),
+    "users: library": (
+        app_projection(user_apps.c.created_at.label("subscribed_at"))
+        .join(user_apps, and_(user_apps.c.app_id == App.id, user_apps.c.user_id == SAMPLE_ID))
+        .order_by(user_apps.c.created_at.desc(), user_apps.c.app_id)
+        .limit(PAGE)
+    ),
+    "slugs: app slug allocation": select(App.slug).filter(
+        or_(App.slug == "notion", App.slug.startswith("notion-", autoescape=True))
+    ),
+    "slugs: category slug allocation": select(Category.slug).filter(
+        or_(Category.slug == "productivity", Category.slug.startswith("productivity-", autoescape=True))
+    ),
+    "tags: apps of a tag": select(app_tags.c.app_id).filter(app_tags.c.tag_id == SAMPLE_ID),
+    "platforms: apps of a platform": select(app_platforms.c.app_id).filter(app_platforms.c.platform_id == SAMPLE_ID),
+}
+
+
+def scans(plan: dict) -> list[tuple[str, str, str]]:
+    """(node type, table, index) for every scan node in the plan tree."""
+    found = []
+    if "Relation Name" in plan:
+        found.append((plan["Node Type"], plan["Relation Name"], plan.get("Index Name", "")))
+    for child in plan.get("Plans", []):
+        found += scans(child)
+    return found
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+async def explain(session, stmt) -> dict:
+    result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {compile_sql(stmt)}"))
+    plan = result.scalar_one()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+
+async def run(verbose: bool) -> int:
+    failures = 0
+    async with async_session() as session:
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+        for name, stmt in QUERIES.items():
+            plan = await explain(session, stmt)
+            nodes = scans(plan)
+            seq = [table for node, table, _ in nodes if node == "Seq Scan"]
+            failures += bool(seq)
+            print(f"{'FAIL' if seq else 'ok':4} {name}")
+            for node, table, index in nodes:
+                print(f"       {node} on {table}" + (f" using {index}" if index else ""))
+            if verbose:
+                print(json.dumps(plan, indent=2))
+        await session.rollback()
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verbose", action="store_true", help="print every plan")
+    sys.exit(asyncio.run(run(parser.parse_args().verbose)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Streams the app export in-process and checks peak RSS stays under a ceiling.
+
+    python scripts/export_benchmark.py --seed 500000 --format ndjson --max-rss-mb 200
+
+--seed inserts that many synthetic apps (named "export-bench-N", in the
+first existing category) before the run and deletes them afterwards.
+Uses DATABASE_URL from the environment/.env like the API.
+"""
+import argparse
+import asyncio
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import text  # noqa: E402
+
+from applibry_api.application.v1.apps.export import csv_lines, ndjson_lines, stream_apps  # noqa: E402
+# Every entity module, as migrations/env.py imports them, so string relationships resolve
+from applibry_api.domain.entities import (  # noqa: E402,F401
+    app, app_platform, app_tag, category, counter_delta, permission, platform, review, role, role_permission, tag,
+    user, user_app, user_category,
+)
+from applibry_api.infrastructure.persistence.database import async_session  # noqa: E402
+
+_SEED_SQL = text("""
+    INSERT INTO apps (id, name, slug, brief, description, trending, status, pricing_model, price,
+                      category_id, is_active, is_deleted, subscribers, created_at, last_updated_at)
+    SELECT gen_random_uuid(), 'export-bench-' || n, 'export-bench-' || n, 'Benchmark app ' || n,
+           repeat('Lorem ipsum dolor sit amet. ', 20), false, 'PUBLISHED', 'FREE', 0,
+           (SELECT id FROM categories ORDER BY created_at LIMIT 1), true, false, 0, now(), now()
+    FROM generate_series(1, :count) AS n
+""")
+_CLEANUP_SQL = text("DELETE FROM apps WHERE name LIKE 'export-bench-%'")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+async def _execute(statement, **params):
+    async with async_session() as session:
+        await session.execute(statement, params)
+        await session.commit()
+
+
+async def run(args) -> int:
+    if args.seed:
+        await _execute(_SEED_SQL, count=args.seed)
+    try:
+        baseline = peak_rss_mb()
+        started = time.perf_counter()
+        rows = size = 0
+
+        async def counted():
+            nonlocal rows
+            async for batch in stream_apps(batch_size=args.batch_size):
+                rows += len(batch)
+                yield batch
+
+        encode = ndjson_lines if args.format == "ndjson" else csv_lines
+        async for chunk in encode(counted()):
+            size += len(chunk)
+
+        elapsed = time.perf_counter() - started
+        peak = peak_rss_mb()
+        print(f"{rows} apps, {size / 1024 / 1024:.1f} MiB {args.format} in {elapsed:.1f}s "
+              f"({rows / elapsed:,.0f} apps/s); peak RSS {peak:.0f} MiB (baseline {baseline:.0f} MiB)")
+        return 1 if args.max_rss_mb and peak > args.max_rss_mb else 0
+    finally:
+        if args.seed:
+            await _execute(_CLEANUP_SQL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-rss-mb", type=float, default=0)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
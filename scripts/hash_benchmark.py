@@ -0,0 +1,79 @@
+"""Login/registration load on the bounded bcrypt pool.
+
+    python scripts/hash_benchmark.py [--duration 10] [--clients 64] [--verify-share 0.8]
+                                     [--workers 4] [--max-pending 32] [--executor thread|process]
+
+For --duration seconds, --clients coroutines call verify_password_async
+(or hash_password_async, for 1 - --verify-share of the calls) again as
+soon as their previous call returns; a client turned away with 429 by
+PASSWORD_HASH_MAX_PENDING waits --backoff-ms first. Prints throughput,
+p50/p99 latency of the calls that ran and the 429 count. --workers,
+--max-pending and --executor override the PASSWORD_HASH_* settings.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from applibry_api.domain.exceptions.base_exception import AppTooManyRequestsException  # noqa: E402
+from applibry_api.domain.utilities import cryptography  # noqa: E402
+from applibry_api.domain.utilities.config import settings  # noqa: E402
+
+PASSWORD = "correct horse battery staple"
+
+
+async def run(args):
+    settings.PASSWORD_HASH_WORKERS = args.workers
+    settings.PASSWORD_HASH_MAX_PENDING = args.max_pending
+    settings.PASSWORD_HASH_EXECUTOR = args.executor
+    hashed = await cryptography.hash_password_async(PASSWORD)  # also starts the pool
+
+    latencies, rejected = [], 0
+    deadline = time.perf_counter() + args.duration
+
+    async def client(index: int):
+        nonlocal rejected
+        calls = 0
+        while time.perf_counter() < deadline:
+            calls += 1
+            verify = (calls * 7 + index) % 100 < args.verify_share * 100
+            started = time.perf_counter()
+            try:
+                if verify:
+                    await cryptography.verify_password_async(PASSWORD, hashed)
+                else:
+                    await cryptography.hash_password_async(PASSWORD)
+            except AppTooManyRequestsException:
+                rejected += 1
+                await asyncio.sleep(args.backoff_ms / 1000)
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(index) for index in range(args.clients)))
+    elapsed = time.perf_counter() - started
+
+    p99 = statistics.quantiles(latencies, n=100, method="inclusive")[-1] if len(latencies) > 1 else latencies[0]
+    print(f"{args.executor} pool, {args.workers} workers, max pending {args.max_pending}, {args.clients} clients")
+    print(f"{len(latencies)} calls in {elapsed:.2f}s ({len(latencies) / elapsed:,.1f}/s)   "
+          f"p50 {statistics.median(latencies):7.1f} ms   p99 {p99:7.1f} ms   429s {rejected}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--verify-share", type=float, default=0.8)
+    parser.add_argument("--backoff-ms", type=float, default=100)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--max-pending", type=int, default=settings.PASSWORD_HASH_MAX_PENDING)
+    parser.add_argument("--executor", choices=("thread", "process"), default=settings.PASSWORD_HASH_EXECUTOR)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
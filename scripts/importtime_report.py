@@ -0,0 +1,80 @@
+"""Cold-start report for the Lambda entry point.
+
+Imports ``main`` (the module Mangum's ``handler`` lives in) in a fresh
+interpreter under ``python -X importtime`` and prints the slowest imports
+by cumulative time, plus the total wall-clock import time over a few runs.
+
+    python scripts/importtime_report.py [--module main] [--top 25] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(module: str, importtime: bool) -> subprocess.CompletedProcess:
+    flags = ["-X", "importtime"] if importtime else []
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT), os.environ.get("PYTHONPATH", "")])}
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, int, str]]:
+    """(depth, self_us, cumulative_us, module) for every ``import time:`` line, in output order."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        name = name[1:].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def by_package(rows: list[tuple[int, int, int, str]], module: str) -> dict[str, int]:
+    """Cumulative time of ``module``'s direct imports, grouped by top-level package.
+
+    ``-X importtime`` prints children before their parent, so direct imports
+    are collected until the line for ``module`` itself closes the group.
+    """
+    pending: dict[str, int] = {}
+    for depth, _, cumulative_us, name in rows:
+        if depth == 1:
+            package = name.split(".")[0]
+            pending[package] = pending.get(package, 0) + cumulative_us
+        elif depth == 0:
+            if name == module:
+                return pending
+            pending = {}
+    return pending
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = parse_importtime(_run(args.module, importtime=True).stderr)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for _, self_us, cumulative_us, name in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+    print(f"\nDirect imports of {args.module} by package:")
+    packages = by_package(rows, args.module)
+    for package, cumulative_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}  {package}")
+
+    timings = [float(_run(args.module, importtime=False).stdout.strip().splitlines()[-1]) * 1000 for _ in range(args.runs)]
+    print(f"\nimport {args.module}: median {statistics.median(timings):.1f} ms, "
+          f"min {min(timings):.1f} ms over {args.runs} runs")
+
+
+if __name__ == "__main__":
+    main()
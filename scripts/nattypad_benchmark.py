@@ -0,0 +1,104 @@
+"""NattyPad call throughput and latency: the shared pooled client against a client per call.
+
+    python scripts/nattypad_benchmark.py [--requests 500] [--concurrency 20] [--handshake-ms 30]
+
+Serves a small JSON response from a local HTTP/1.1 keep-alive server and
+sends --requests GETs, --concurrency at a time, first opening and closing
+an httpx.AsyncClient per call (as the providers used to), then through
+nattypad_client.get_client(). The server waits --handshake-ms before the
+first response on every new connection, standing in for the TCP and TLS
+handshakes a remote NattyPad costs. Prints requests/s, p50/p99 latency
+and how many connections each run opened.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+
+from applibry_api.domain.utilities.config import settings  # noqa: E402
+from applibry_api.infrastructure.providers.nattypad import nattypad_client  # noqa: E402
+
+BODY = json.dumps({"data": [{"id": index, "title": f"Article {index}"} for index in range(20)]}).encode()
+
+
+class LocalServer:
+    def __init__(self, handshake: float):
+        self.handshake = handshake
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        first = True
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                if first and self.handshake:
+                    await asyncio.sleep(self.handshake)
+                first = False
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             b"Content-Length: %d\r\n\r\n%s" % (len(BODY), BODY))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def per_call(path: str):
+    async with httpx.AsyncClient(base_url=settings.NATTYPAD_BASE_URL) as client:
+        (await client.get(path)).raise_for_status()
+
+
+async def shared(path: str):
+    (await nattypad_client.get_client().get(path)).raise_for_status()
+
+
+async def measure(call, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(index: int):
+        async with slots:
+            started = time.perf_counter()
+            await call(f"/articles?page={index}")
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    return time.perf_counter() - started, latencies
+
+
+async def run(args):
+    server = LocalServer(args.handshake_ms / 1000)
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    host, port = listener.sockets[0].getsockname()[:2]
+    settings.NATTYPAD_BASE_URL = f"http://{host}:{port}"
+    settings.NATTYPAD_HTTP2 = False  # the local server only speaks HTTP/1.1
+
+    print(f"{args.requests} requests, {args.concurrency} concurrent, {args.handshake_ms} ms per new connection")
+    async with listener:
+        for label, call in (("per-call", per_call), ("shared", shared)):
+            server.connections = 0
+            elapsed, latencies = await measure(call, args.requests, args.concurrency)
+            p99 = statistics.quantiles(latencies, n=100, method="inclusive")[-1]
+            print(f"{label:9} {args.requests / elapsed:8,.0f} req/s   p50 {statistics.median(latencies):7.2f} ms   "
+                  f"p99 {p99:7.2f} ms   {server.connections} connections")
+        await nattypad_client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=30)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
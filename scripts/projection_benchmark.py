@@ -0,0 +1,136 @@
+"""Memory and query count per app request: selectinload-hydrated entities against the projection.
+
+    python scripts/projection_benchmark.py --seed 100000 [--runs 5]
+
+--seed inserts one app ("projection-bench", in the first existing
+category) and that many synthetic users subscribed to it through
+user_apps, and deletes them all afterwards; without it, --slug picks an
+existing app. Each run loads the app the way get_app used to (select(App)
+with selectinload on category, users, tags and platforms) and through
+app_projection(), and renders it as AppSchema. Prints the statements
+issued, the Python heap peak (tracemalloc) and the latency per request.
+Uses DATABASE_URL from the environment/.env like the API.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import event, select, text  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from applibry_api.application.v1.apps.projection import app_projection, to_dict  # noqa: E402
+from applibry_api.application.v1.apps.schema import AppSchema  # noqa: E402
+# Every entity module, as migrations/env.py imports them, so string relationships resolve
+from applibry_api.domain.entities import (  # noqa: E402,F401
+    app, app_platform, app_tag, category, counter_delta, permission, platform, review, role, role_permission, tag,
+    user, user_app, user_category,
+)
+from applibry_api.domain.entities.app import App  # noqa: E402
+from applibry_api.infrastructure.persistence.database import async_session, engine  # noqa: E402
+
+SLUG = "projection-bench"
+
+_SEED_SQL = (
+    text("""
+        INSERT INTO apps (id, name, slug, brief, description, trending, status, pricing_model, price,
+                          category_id, is_active, is_deleted, subscribers, created_at, last_updated_at)
+        VALUES (gen_random_uuid(), 'projection-bench', 'projection-bench', 'Benchmark app',
+                repeat('Lorem ipsum dolor sit amet. ', 20), false, 'PUBLISHED', 'FREE', 0,
+                (SELECT id FROM categories ORDER BY created_at LIMIT 1), true, false, :count, now(), now())
+    """),
+    text("""
+        INSERT INTO users (id, username, email, is_active, is_deleted, created_at, last_updated_at)
+        SELECT gen_random_uuid(), 'projection-bench-' || n, 'projection-bench-' || n || '@example.com',
+               true, false, now(), now()
+        FROM generate_series(1, :count) AS n
+    """),
+    text("""
+        INSERT INTO user_apps (user_id, app_id, created_at)
+        SELECT users.id, apps.id, now()
+        FROM users, apps
+        WHERE users.username LIKE 'projection-bench-%' AND apps.slug = 'projection-bench'
+    """),
+    text("ANALYZE users, user_apps"),
+)
+_CLEANUP_SQL = (
+    text("DELETE FROM user_apps WHERE app_id = (SELECT id FROM apps WHERE slug = 'projection-bench')"),
+    text("DELETE FROM users WHERE username LIKE 'projection-bench-%'"),
+    text("DELETE FROM apps WHERE slug = 'projection-bench'"),
+)
+
+
+async def _execute(statements, **params):
+    async with async_session() as session:
+        for statement in statements:
+            await session.execute(statement, params)
+        await session.commit()
+
+
+async def hydrated(session, slug: str) -> AppSchema:
+    """get_app before the projection: the entity plus every subscriber row."""
+    stmt = select(App).filter(App.slug == slug).options(
+        selectinload(App.category), selectinload(App.users), selectinload(App.tags), selectinload(App.platforms)
+    )
+    return AppSchema.model_validate((await session.execute(stmt)).scalar_one())
+
+
+async def projected(session, slug: str) -> AppSchema:
+    row = (await session.execute(app_projection().filter(App.slug == slug))).one()
+    return AppSchema.model_validate(to_dict(row))
+
+
+async def measure(load, slug: str, runs: int) -> tuple[int, float, list[float]]:
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    peaks, latencies = [], []
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        for _ in range(runs):
+            async with async_session() as session:
+                await session.connection()  # check out before measuring
+                tracemalloc.start()
+                started = time.perf_counter()
+                await load(session, slug)
+                latencies.append((time.perf_counter() - started) * 1000)
+                peaks.append(tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+                tracemalloc.stop()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return statements // runs, max(peaks), latencies
+
+
+async def run(args):
+    if args.seed:
+        await _execute(_SEED_SQL, count=args.seed)
+    try:
+        slug = SLUG if args.seed else args.slug
+        print(f"app {slug!r}, {args.runs} runs")
+        for label, load in (("selectinload", hydrated), ("projection", projected)):
+            statements, peak, latencies = await measure(load, slug, args.runs)
+            print(f"{label:12} {statements} statements   heap peak {peak:8.2f} MiB   "
+                  f"p50 {statistics.median(latencies):8.2f} ms")
+    finally:
+        if args.seed:
+            await _execute(_CLEANUP_SQL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--slug", default=SLUG)
+    parser.add_argument("--runs", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
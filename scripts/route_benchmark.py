@@ -0,0 +1,82 @@
+"""Requests/sec of routes that never query the database, with and without a session per request.
+
+    python scripts/route_benchmark.py [--requests 2000] [--concurrency 20]
+
+Drives "/" and a public categories cache hit in-process (httpx ASGI
+transport) against the API as it is, then against a copy of its routes
+that opens a get_db session on every request, as the app-wide
+dependencies=[Depends(get_db)] used to. Prints requests/s, p50/p99 latency
+and pooled connection checkouts per request. Needs the API's .env; no
+database is contacted, since neither route queries it.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+
+from applibry_api.domain.utilities.json_response import FastJSONResponse  # noqa: E402
+from applibry_api.infrastructure.cache.public_cache import PUBLIC_CATEGORIES_NAMESPACE, public_cache  # noqa: E402
+from applibry_api.infrastructure.cache.result_cache import cache_key  # noqa: E402
+from applibry_api.infrastructure.persistence import database  # noqa: E402
+from main import app  # noqa: E402
+
+ROUTES = ("/", "/api/v1/public/categories")
+
+
+def session_per_request_app() -> FastAPI:
+    legacy = FastAPI(dependencies=[Depends(database.get_db)], default_response_class=FastJSONResponse)
+    legacy.include_router(app.router)
+    return legacy
+
+
+async def measure(asgi_app, route: str, requests: int, concurrency: int) -> tuple[float, list[float], int]:
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+    checkouts = database.engine.sync_engine.pool.checkouts
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://bench") as client:
+        async def one():
+            async with slots:
+                started = time.perf_counter()
+                (await client.get(route)).raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        await one()  # warm-up
+        latencies.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies, database.engine.sync_engine.pool.checkouts - checkouts
+
+
+async def run(args):
+    cached = {"data": [], "next_cursor": None, "total": 0, "success": True, "message": "Success"}
+    await public_cache.set(PUBLIC_CATEGORIES_NAMESPACE, cache_key(search=None, cursor=None, limit=20), cached, ttl=3600)
+
+    print(f"{args.requests} requests per route, {args.concurrency} concurrent")
+    for label, asgi_app in (("per-request session", session_per_request_app()), ("on demand", app)):
+        for route in ROUTES:
+            elapsed, latencies, checkouts = await measure(asgi_app, route, args.requests, args.concurrency)
+            p99 = statistics.quantiles(latencies, n=100, method="inclusive")[-1]
+            print(f"{label:20} {route:28} {args.requests / elapsed:8,.0f} req/s   "
+                  f"p50 {statistics.median(latencies):6.2f} ms   p99 {p99:6.2f} ms   "
+                  f"{checkouts / args.requests:.2f} checkouts/request")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
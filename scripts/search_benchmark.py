@@ -0,0 +1,116 @@
+"""App search latency: the previous name ILIKE scan against the tsvector/trigram path.
+
+    python scripts/search_benchmark.py --seed 200000 [--runs 50] [--terms notes "task plan" cal]
+
+--seed inserts that many synthetic apps (named "search-bench-N", in the
+first existing category) with names, keywords and descriptions drawn from a
+small vocabulary, fills their search_vector and ANALYZEs apps before the
+run; they are deleted afterwards. Each term runs the first page of both
+queries --runs times and prints the p50/p95 latency and the rows matched.
+Uses DATABASE_URL from the environment/.env like the API.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import func, select, text  # noqa: E402
+
+from applibry_api.application.v1.apps.search import refresh_search_vectors, search_filter, search_rank  # noqa: E402
+# Every entity module, as migrations/env.py imports them, so string relationships resolve
+from applibry_api.domain.entities import (  # noqa: E402,F401
+    app, app_platform, app_tag, category, counter_delta, permission, platform, review, role, role_permission, tag,
+    user, user_app, user_category,
+)
+from applibry_api.domain.entities.app import App  # noqa: E402
+from applibry_api.infrastructure.persistence.database import async_session  # noqa: E402
+
+PAGE = 21
+TERMS = ("notes", "task plan", "cal", "zzz")
+
+_SEED_SQL = text("""
+    WITH words AS (
+        SELECT ARRAY['notes', 'tasks', 'calendar', 'planner', 'mail', 'chat', 'budget', 'design',
+                     'tracker', 'focus', 'journal', 'wiki', 'kanban', 'crm', 'invoice', 'habit'] AS w
+    )
+    INSERT INTO apps (id, name, slug, brief, description, meta_keywords, trending, status, pricing_model,
+                      price, category_id, is_active, is_deleted, subscribers, created_at, last_updated_at)
+    SELECT gen_random_uuid(), 'search-bench-' || w[1 + n % 16] || '-' || n, 'search-bench-' || n,
+           initcap(w[1 + n % 16]) || ' and ' || w[1 + (n / 16) % 16] || ' in one place',
+           repeat(w[1 + (n / 7) % 16] || ' ' || w[1 + (n / 11) % 16] || ' workflow for teams. ', 10),
+           w[1 + n % 16] || ',' || w[1 + (n / 3) % 16], false, 'PUBLISHED', 'FREE', 0,
+           (SELECT id FROM categories ORDER BY created_at LIMIT 1), true, false, 0, now(), now()
+    FROM generate_series(1, :count) AS n, words
+""")
+_CLEANUP_SQL = text("DELETE FROM apps WHERE name LIKE 'search-bench-%'")
+
+
+def ilike_query(term: str):
+    """The listing's search before the tsvector index: an unanchored ILIKE on the name."""
+    return select(App.id).filter(App.name.ilike(f"%{term}%")).order_by(App.name).limit(PAGE)
+
+
+def indexed_query(term: str):
+    """The filter and ordering AppService._search_apps uses."""
+    return select(App.id).filter(search_filter(term)).order_by(search_rank(term).desc(), App.name).limit(PAGE)
+
+
+async def seed(count: int):
+    async with async_session() as session:
+        await session.execute(_SEED_SQL, {"count": count})
+        await session.execute(refresh_search_vectors(App.name.startswith("search-bench-")))
+        await session.execute(text("ANALYZE apps"))
+        await session.commit()
+
+
+async def cleanup():
+    async with async_session() as session:
+        await session.execute(_CLEANUP_SQL)
+        await session.commit()
+
+
+async def timings(session, stmt, runs: int) -> tuple[list[float], int]:
+    rows = len((await session.execute(stmt)).all())  # warm-up
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        (await session.execute(stmt)).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, rows
+
+
+def summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1] if len(samples) > 1 else samples[0]
+    return f"p50 {statistics.median(samples):8.2f} ms  p95 {p95:8.2f} ms"
+
+
+async def run(args):
+    if args.seed:
+        await seed(args.seed)
+    try:
+        async with async_session() as session:
+            apps = (await session.execute(select(func.count()).select_from(App))).scalar_one()
+            print(f"{apps} apps, first page of {PAGE - 1}, {args.runs} runs per query")
+            for term in args.terms:
+                for label, stmt in (("ilike", ilike_query(term)), ("indexed", indexed_query(term))):
+                    samples, rows = await timings(session, stmt, args.runs)
+                    print(f"{term!r:14} {label:8} {summary(samples)}  {rows} rows")
+    finally:
+        if args.seed:
+            await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--terms", nargs="+", default=list(TERMS))
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Micro-benchmark: rendering a 100-app RouteResponseSchemaExt[AppSchema] page.
+
+Compares the previous controller path (model_validate per app, then FastAPI
+re-validating against response_model, jsonable-style dump and stdlib json)
+with model_response/validate_list from domain/utilities/json_response.py.
+
+    python scripts/serialization_benchmark.py [--apps 100] [--runs 500]
+
+Needs the same environment (.env) as the API, since importing the schemas
+imports their application packages.
+"""
+import argparse
+import datetime
+import json
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from applibry_api.application.v1.apps.schema import AppSchema  # noqa: E402
+from applibry_api.domain.schemas.common_schema import RouteResponseSchemaExt  # noqa: E402
+from applibry_api.domain.utilities.json_response import model_response, type_adapter, validate_list  # noqa: E402
+
+
+def _related(name: str) -> dict:
+    now = datetime.datetime(2026, 1, 1)
+    return {"id": uuid.uuid4(), "name": name, "description": f"{name} description", "is_active": True,
+            "created_at": now, "last_updated_at": now}
+
+
+def sample_rows(count: int) -> list[dict]:
+    """Rows shaped like apps/projection.py output."""
+    now = datetime.datetime(2026, 1, 1)
+    category = {**_related("Productivity"), "icon": None, "app_count": count, "subscribers": 1000}
+    return [
+        {
+            "id": uuid.uuid4(), "name": f"App {index}", "slug": f"app-{index}", "description": "A" * 600,
+            "brief": "B" * 120, "price": 9.99, "website": "https://example.com", "meta_title": f"App {index}",
+            "meta_keywords": "notes,tasks", "meta_description": "C" * 160, "icon": None, "banner": None,
+            "status": "Published", "pricing_model": "Freemium", "category_id": category["id"],
+            "subscribers": 100_000, "ratings": 4, "reviews": 120, "shares": 40, "rank": index,
+            "published_at": now, "created_at": now, "last_updated_at": now, "category": category,
+            "tags": [_related(f"Tag {tag}") for tag in range(3)],
+            "platforms": [_related(f"Platform {platform}") for platform in range(2)],
+        }
+        for index in range(count)
+    ]
+
+
+def legacy(rows: list[dict]) -> bytes:
+    response = RouteResponseSchemaExt[AppSchema](
+        data=[AppSchema.model_validate(row) for row in rows], next_cursor="abc", success=True, message="Success",
+    )
+    # What FastAPI does with a returned model when response_model is set
+    adapter = type_adapter(RouteResponseSchemaExt[AppSchema])
+    validated = adapter.validate_python(response.model_dump())
+    payload = adapter.dump_python(validated, mode="json")
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def fast(rows: list[dict]) -> bytes:
+    return model_response(RouteResponseSchemaExt[AppSchema](
+        data=validate_list(AppSchema, rows), next_cursor="abc", success=True, message="Success",
+    )).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = sample_rows(args.apps)
+    assert json.loads(legacy(rows)) == json.loads(fast(rows))
+
+    for name, render in (("legacy", legacy), ("fast", fast)):
+        best = min(timeit.repeat(lambda: render(rows), number=args.runs, repeat=5)) / args.runs
+        print(f"{name:>8}: {best * 1000:.3f} ms per {args.apps}-app page")
+
+
+if __name__ == "__main__":
+    main()
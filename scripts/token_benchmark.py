@@ -0,0 +1,61 @@
+"""Mint/verify throughput of the token key ring per signing algorithm.
+
+    python scripts/token_benchmark.py [--runs 2000] [--algorithms HS256 RS256 ES256]
+
+Keys are generated in memory; nothing is read from JWT_KEYS_DIR. EdDSA is
+absent because python-jose cannot sign with it.
+"""
+import argparse
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, rsa  # noqa: E402
+
+from applibry_api.domain.utilities import token_service  # noqa: E402
+from applibry_api.domain.utilities.config import settings  # noqa: E402
+
+ALGORITHMS = ("HS256", "RS256", "PS256", "ES256", "ES384")
+_CURVES = {"ES256": ec.SECP256R1(), "ES384": ec.SECP384R1(), "ES512": ec.SECP521R1()}
+
+
+def ring_for(algorithm: str) -> token_service.KeyRing:
+    if algorithm.startswith("HS"):
+        return token_service.KeyRing([token_service.hmac_key("x" * 64, algorithm, kid="bench")], "bench")
+
+    if algorithm.startswith("ES"):
+        private_key = ec.generate_private_key(_CURVES[algorithm])
+    else:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        settings.JWT_RSA_ALGORITHM = algorithm
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    return token_service.KeyRing([token_service.load_pem_key("bench", pem)], "bench")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS)
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    claims = {"sub": "bench", "sid": "00000000-0000-0000-0000-000000000000", "iat": now, "nbf": now,
+              "exp": now + timedelta(hours=1), "type": "access"}
+
+    print(f"{'algorithm':10} {'mint/s':>10} {'verify/s':>10} {'token bytes':>12}")
+    for algorithm in args.algorithms:
+        ring = ring_for(algorithm)
+        token = ring.encode(claims)
+        mint = timeit.timeit(lambda: ring.encode(claims), number=args.runs)
+        verify = timeit.timeit(lambda: ring.decode(token), number=args.runs)
+        print(f"{algorithm:10} {args.runs / mint:10,.0f} {args.runs / verify:10,.0f} {len(token):12}")
+
+
+if __name__ == "__main__":
+    main()
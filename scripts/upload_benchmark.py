@@ -0,0 +1,93 @@
+"""Event-loop lag while images upload, with the upload inline on the loop and on the upload pool.
+
+    python scripts/upload_benchmark.py [--uploads 16] [--size-kb 2048] [--latency-ms 80]
+
+S3 is replaced by a stub client whose upload_fileobj reads the stream and
+blocks for --latency-ms, as boto3 does while it waits on the network. A
+ticker coroutine wakes every 5 ms during the run; its lateness is the
+stall every other request on the loop would see. "inline" decodes and
+uploads on the loop like upload_to_s3 used to, "pooled" goes through
+upload_images_to_s3. Needs AWS__BUCKET_NAME and AWS__REGION set to any
+value; nothing is sent to S3.
+"""
+import argparse
+import asyncio
+import base64
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from applibry_api.domain.utilities import file_manager  # noqa: E402
+
+TICK = 0.005
+
+
+class StubS3Client:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def upload_fileobj(self, stream, bucket, key, ExtraArgs=None):
+        stream.read()
+        time.sleep(self.latency)
+
+
+def sample_image(size_kb: int) -> str:
+    png = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * (size_kb * 4)
+    return "data:image/png;base64," + base64.b64encode(png).decode()
+
+
+async def inline_uploads(images: list[str]):
+    for image in images:
+        file_manager._upload_image(image)
+        await asyncio.sleep(0)
+
+
+async def pooled_uploads(images: list[str]):
+    await file_manager.upload_images_to_s3(*images)
+
+
+async def measure(upload, images: list[str]) -> tuple[float, list[float]]:
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            expected = time.perf_counter() + TICK
+            await asyncio.sleep(TICK)
+            lags.append(max(time.perf_counter() - expected, 0) * 1000)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK)
+    started = time.perf_counter()
+    await upload(images)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticking
+    return elapsed, lags
+
+
+async def run(args):
+    file_manager.get_s3_client = lambda: StubS3Client(args.latency_ms / 1000)
+    images = [sample_image(args.size_kb)] * args.uploads
+    print(f"{args.uploads} uploads of {args.size_kb} KiB, {args.latency_ms} ms S3 latency, "
+          f"S3_UPLOAD_CONCURRENCY={file_manager.S3_UPLOAD_CONCURRENCY}")
+    for label, upload in (("inline", inline_uploads), ("pooled", pooled_uploads)):
+        elapsed, lags = await measure(upload, images)
+        p99 = statistics.quantiles(lags, n=100, method="inclusive")[-1] if len(lags) > 1 else max(lags)
+        print(f"{label:7} {elapsed:6.2f}s   loop lag p50 {statistics.median(lags):7.1f} ms   "
+              f"p99 {p99:7.1f} ms   max {max(lags):7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=16)
+    parser.add_argument("--size-kb", type=int, default=2048)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,20 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from starlette import status
 
-from applibry_api.infrastructure.persistence.database import get_db, verify_token
+from applibry_api.infrastructure.persistence.database import verify_token
 from applibry_api.domain.schemas.common_schema import RouteResponseSchema
-from applibry_api.application.v1.analytics.schema import DashboardStatisticSchema, EntityStatisticSchema
+from applibry_api.application.v1.analytics.schema import DashboardStatisticSchema, EntityStatisticSchema, OverviewStatisticSchema
 from applibry_api.application.v1.analytics.service import AnalyticsService, analytics_service
 
 router = APIRouter(
     prefix="/analytics",
     tags=["Analytics"],
-    dependencies=[Depends(get_db), Depends(verify_token)]
+    dependencies=[Depends(verify_token)]
 )
 
 @router.get("/dashboard", response_model=RouteResponseSchema[DashboardStatisticSchema], status_code=status.HTTP_200_OK)
-async def get_dashboard_statistics(service: AnalyticsService = Depends(analytics_service)):
-    data = await service.get_dashboard_statistics()
+async def get_dashboard_statistics(token: dict[str, str] = Depends(verify_token), service: AnalyticsService = Depends(analytics_service)):
+    data = await service.get_dashboard_statistics(token)
 
     return RouteResponseSchema[DashboardStatisticSchema](
         data= DashboardStatisticSchema.model_validate(data),
@@ -25,6 +25,16 @@ async def get_dashboard_statistics(service: AnalyticsService = Depends(analytics
         message="Dashboard statistics fetched successfully"
     )
 
+@router.get("/overview", response_model=RouteResponseSchema[OverviewStatisticSchema], status_code=status.HTTP_200_OK)
+async def get_overview_statistics(service: AnalyticsService = Depends(analytics_service)):
+    data = await service.get_overview_statistics()
+
+    return RouteResponseSchema[OverviewStatisticSchema](
+        data= OverviewStatisticSchema.model_validate(data),
+        success=True,
+        message="Overview statistics fetched successfully"
+    )
+
 @router.get("/category", response_model=RouteResponseSchema[EntityStatisticSchema], status_code=status.HTTP_200_OK)
 async def get_category_statistics(service: AnalyticsService = Depends(analytics_service)):
     data = await service.get_category_statistics()
@@ -27,6 +27,17 @@ class EntityStatisticSchema(BaseModel):
     TotalCount: int
 
 
+class OverviewStatisticSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    Category: EntityStatisticSchema
+    App: EntityStatisticSchema
+    User: EntityStatisticSchema
+    Role: EntityStatisticSchema
+    Permission: EntityStatisticSchema
+    Platform: EntityStatisticSchema
+    Tag: EntityStatisticSchema
+
+
 class CategoryStatisticSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     name: str
@@ -1,5 +1,5 @@
 from fastapi import Depends
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.domain.entities.app import App
@@ -11,7 +11,41 @@ from applibry_api.domain.entities.tag import Tag
 from applibry_api.domain.entities.user import User
 from applibry_api.domain.entities.user_app import user_apps
 from applibry_api.domain.entities.user_category import user_categories
-from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.cache.result_cache import MemoryResultCache
+from applibry_api.infrastructure.persistence.database import get_read_db
+
+
+ENTITY_STATISTICS = {
+    "Category": Category,
+    "App": App,
+    "User": User,
+    "Role": Role,
+    "Permission": Permission,
+    "Platform": Platform,
+    "Tag": Tag,
+}
+
+OVERVIEW_CACHE_KEY = "overview"
+
+# Admin dashboards poll these counts; a short in-process TTL absorbs the bursts
+analytics_cache = MemoryResultCache(max_entries=8, default_ttl=settings.ANALYTICS_CACHE_TTL)
+
+
+def _entity_statistics_stmt(name: str, entity):
+    return select(
+        literal(name).label("entity"),
+        func.count().filter(entity.is_active == True).label("active"),
+        func.count().filter(entity.is_active == False).label("inactive"),
+    ).select_from(entity)
+
+
+def _to_statistics(active: int, inactive: int):
+    return {
+        "ActiveCount": active,
+        "InactiveCount": inactive,
+        "TotalCount": active + inactive,
+    }
 
 
 class AnalyticsService:
@@ -21,13 +55,12 @@ class AnalyticsService:
     async def get_dashboard_statistics(self, decoded_token: dict[str, str]):
         user_id = decoded_token.get("sid")
 
-        my_libry_app_count_stmt = select(func.count()).where(user_apps.c.user_id == user_id)
-        my_libry_app_count_result = await self.db.execute(my_libry_app_count_stmt)
-        my_libry_app_count = my_libry_app_count_result.scalar_one()
-
-        preference_count_stmt = select(func.count()).where(user_categories.c.user_id == user_id)
-        preference_count_result = await self.db.execute(preference_count_stmt)
-        preference_count = preference_count_result.scalar_one()
+        stmt = select(
+            select(func.count()).select_from(user_apps).where(user_apps.c.user_id == user_id).scalar_subquery(),
+            select(func.count()).select_from(user_categories).where(user_categories.c.user_id == user_id).scalar_subquery(),
+        )
+        result = await self.db.execute(stmt)
+        my_libry_app_count, preference_count = result.one()
 
         return {
             "MylibryAppCount": my_libry_app_count,
@@ -37,19 +70,21 @@ class AnalyticsService:
         }
 
     async def _get_entity_statistics(self, entity):
-        active_stmt = select(func.count()).where(entity.is_active == True)
-        active_result = await self.db.execute(active_stmt)
-        active_count = active_result.scalar_one()
+        result = await self.db.execute(_entity_statistics_stmt(entity.__name__, entity))
+        _, active_count, inactive_count = result.one()
+        return _to_statistics(active_count, inactive_count)
 
-        inactive_stmt = select(func.count()).where(entity.is_active == False)
-        inactive_result = await self.db.execute(inactive_stmt)
-        inactive_count = inactive_result.scalar_one()
+    async def get_overview_statistics(self):
+        """Statistics for every entity in a single UNION ALL round trip."""
+        if (cached := await analytics_cache.get("analytics", OVERVIEW_CACHE_KEY)) is not None:
+            return cached
 
-        return {
-            "ActiveCount": active_count,
-            "InactiveCount": inactive_count,
-            "TotalCount": active_count + inactive_count,
-        }
+        stmt = union_all(*(_entity_statistics_stmt(name, entity) for name, entity in ENTITY_STATISTICS.items()))
+        result = await self.db.execute(stmt)
+        overview = {name: _to_statistics(active, inactive) for name, active, inactive in result.all()}
+
+        await analytics_cache.set("analytics", OVERVIEW_CACHE_KEY, overview)
+        return overview
 
     async def get_category_statistics(self):
         return await self._get_entity_statistics(Category)
@@ -73,5 +108,5 @@ class AnalyticsService:
         return await self._get_entity_statistics(Tag)
 
 
-def analytics_service(db: AsyncSession = Depends(get_db)) -> AnalyticsService:
+def analytics_service(db: AsyncSession = Depends(get_read_db)) -> AnalyticsService:
     return AnalyticsService(db)
\ No newline at end of file
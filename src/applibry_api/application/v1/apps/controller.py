@@ -1,16 +1,21 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Query, UploadFile
 from starlette import status
+from starlette.responses import StreamingResponse
 
+from applibry_api.application.v1.apps.importer import AppImportService, app_import_service
 from applibry_api.application.v1.apps.schema import (
     AppSchema,
     CreateAppSchema,
+    ImportReportSchema,
     UpdateAppSchema,
 )
+from applibry_api.application.v1.apps.export import EXPORT_FORMATS, csv_lines, ndjson_lines, stream_apps
 from applibry_api.application.v1.apps.service import AppService, app_service
 from applibry_api.domain.schemas.common_schema import RouteResponseSchema, RouteResponseSchemaExt
+from applibry_api.domain.utilities.json_response import model_response, validate_list
 from applibry_api.infrastructure.persistence.database import verify_token
 
 router = APIRouter(
@@ -42,12 +47,12 @@ async def get_apps(
         search=search,
         category=category,
     )
-    return RouteResponseSchemaExt[AppSchema](
-        data=[AppSchema.model_validate(app) for app in data["data"]],
+    return model_response(RouteResponseSchemaExt[AppSchema](
+        data=validate_list(AppSchema, data["data"]),
         next_cursor=data["next_cursor"],
         success=True,
         message="Success",
-    )
+    ))
 
 
 @router.get(
@@ -62,11 +67,27 @@ async def get_trending_apps(
     service: AppService = Depends(app_service),
 ):
     data = await service.get_trending_apps(limit=page_size, category=category, cursor=cursor)
-    return RouteResponseSchemaExt[AppSchema](
-        data=[AppSchema.model_validate(app) for app in data["data"]],
+    return model_response(RouteResponseSchemaExt[AppSchema](
+        data=validate_list(AppSchema, data["data"]),
         next_cursor=data["next_cursor"],
         success=True,
         message="Success",
+    ))
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_apps(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    search: Optional[str] = None,
+    category: Optional[UUID] = None,
+):
+    # category is parsed here, so a bad id is a 422 before the 200 and headers are sent
+    batches = stream_apps(search=search, category=category)
+    body = ndjson_lines(batches) if format == "ndjson" else csv_lines(batches)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="apps.{format}"'},
     )
 
 
@@ -80,9 +101,9 @@ async def get_app(
     service: AppService = Depends(app_service),
 ):
     data = await service.get_app(slug)
-    return RouteResponseSchema[AppSchema](
+    return model_response(RouteResponseSchema[AppSchema](
         data=AppSchema.model_validate(data), success=True, message="Success"
-    )
+    ))
 
 
 @router.post(
@@ -101,6 +122,23 @@ async def create_app(
     )
 
 
+@router.post(
+    "/import",
+    response_model=RouteResponseSchema[ImportReportSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def import_apps(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(jsonl|ndjson|csv)$"),
+    token: dict[str, str] = Depends(verify_token),
+    service: AppImportService = Depends(app_import_service),
+):
+    data = await service.import_apps(token, file, format)
+    return RouteResponseSchema[ImportReportSchema](
+        data=data, success=True, message=f"Imported {data.created} of {data.total} apps"
+    )
+
+
 @router.put(
     "/{_id}",
     response_model=RouteResponseSchema[AppSchema],
@@ -0,0 +1,86 @@
+import csv
+import io
+from enum import Enum
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from applibry_api.application.v1.apps.projection import app_projection
+from applibry_api.application.v1.apps.schema import AppSchema
+from applibry_api.application.v1.apps.search import search_filter
+from applibry_api.domain.entities.app import App
+from applibry_api.domain.utilities.config import settings
+from applibry_api.domain.utilities.json_response import type_adapter
+from applibry_api.infrastructure.persistence.database import async_session
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_COLUMNS = (
+    "id", "name", "slug", "brief", "description", "website", "price", "pricing_model", "status",
+    "category", "tags", "platforms", "subscribers", "ratings", "reviews", "shares", "rank",
+    "published_at", "created_at", "last_updated_at",
+)
+
+
+async def stream_apps(
+    search: Optional[str] = None,
+    category: Optional[UUID] = None,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+) -> AsyncIterator[list[dict]]:
+    """Yields the catalogue in batches from a server-side cursor, so memory stays flat.
+
+    Opens its own session: a StreamingResponse body keeps running after the
+    request's dependencies (and their session) have been torn down.
+    """
+    stmt = app_projection()
+    if category:
+        stmt = stmt.filter(App.category_id == category)
+    if search:
+        stmt = stmt.filter(search_filter(search))
+    stmt = stmt.order_by(App.name).execution_options(yield_per=batch_size)
+
+    async with async_session(info={"read_only": True}) as session:
+        result = await session.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+
+async def ndjson_lines(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    adapter = type_adapter(AppSchema)
+    async for batch in batches:
+        yield b"".join(adapter.dump_json(adapter.validate_python(row)) + b"\n" for row in batch)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_row(row: dict) -> list:
+    values = []
+    for column in CSV_COLUMNS:
+        value = row[column]
+        if column == "category":
+            value = value["name"] if value else None
+        elif column in ("tags", "platforms"):
+            value = "|".join(item["name"] for item in value)
+        values.append(_csv_value(value))
+    return values
+
+
+async def csv_lines(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue().encode()
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_csv_row(row) for row in batch)
+        yield buffer.getvalue().encode()
@@ -0,0 +1,264 @@
+import csv
+import io
+import json
+import uuid
+from collections import Counter
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Union
+from uuid import UUID
+
+from fastapi import Depends, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applibry_api.application.v1.apps.schema import ImportAppSchema, ImportReportSchema, ImportRowErrorSchema
+from applibry_api.application.v1.apps.search import refresh_search_vectors
+from applibry_api.domain.entities.app import App
+from applibry_api.domain.entities.app_platform import app_platforms
+from applibry_api.domain.entities.app_tag import app_tags
+from applibry_api.domain.entities.category import Category
+from applibry_api.domain.entities.platform import Platform
+from applibry_api.domain.entities.tag import Tag
+from applibry_api.domain.enums.app_status import AppStatus
+from applibry_api.domain.exceptions.base_exception import AppBadRequestException
+from applibry_api.domain.utilities.config import settings
+from applibry_api.domain.utilities.json_response import type_adapter
+from applibry_api.infrastructure.cache.public_cache import invalidate_public_apps
+from applibry_api.infrastructure.persistence.counters import CATEGORY_APP_COUNT, record_deltas
+from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.slug_allocator import allocate_slugs
+
+IMPORT_FORMATS = {"jsonl": "jsonl", "ndjson": "jsonl", "csv": "csv"}
+SLUG_ATTEMPTS = 3
+
+# (line number, parsed row) or (line number, parse error)
+ParsedRow = tuple[int, Union[dict, str]]
+
+
+def _parse_jsonl(stream: Iterable[str]) -> Iterator[ParsedRow]:
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as exc:
+            yield line, f"Invalid JSON: {exc.msg}"
+            continue
+        yield line, data if isinstance(data, dict) else "Each line must be a JSON object"
+
+
+def _parse_csv(stream: Iterable[str]) -> Iterator[ParsedRow]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        data = {key: value for key, value in row.items() if key and value not in (None, "")}
+        for key in ("tags", "platforms"):
+            if key in data:
+                data[key] = [item.strip() for item in data[key].split("|") if item.strip()]
+        yield reader.line_num, data
+
+
+def _next_batch(rows: Iterator[ParsedRow]) -> list[ParsedRow]:
+    return list(islice(rows, settings.IMPORT_BATCH_SIZE))
+
+
+def _as_uuid(value: str) -> Optional[UUID]:
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
+
+def import_format(filename: Optional[str], format: Optional[str] = None) -> str:
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    resolved = IMPORT_FORMATS.get((format or extension).lower())
+    if resolved is None:
+        raise AppBadRequestException("Import file must be JSONL or CSV")
+    return resolved
+
+
+class AppImportService:
+    """Bulk counterpart of AppService.create_app, working a batch of rows per round trip.
+
+    Icons and banners are taken as URLs; nothing is uploaded to S3.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_apps(
+        self, decoded_token: dict[str, str], file: UploadFile, format: Optional[str] = None
+    ) -> ImportReportSchema:
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        rows = _parse_csv(stream) if import_format(file.filename, format) == "csv" else _parse_jsonl(stream)
+
+        report = ImportReportSchema()
+        # Reading the spooled upload and parsing it is blocking work, so each batch is pulled on a worker thread
+        while batch := await run_in_threadpool(_next_batch, rows):
+            await self._import_batch(decoded_token.get("sid"), batch, report)
+
+        if report.created:
+            await invalidate_public_apps()
+        return report
+
+    @staticmethod
+    def _fail(report: ImportReportSchema, line: int, name: Optional[str], *errors: str):
+        report.failed += 1
+        report.errors.append(ImportRowErrorSchema(line=line, name=name, errors=list(errors)))
+
+    def _validate(self, batch: list[ParsedRow], report: ImportReportSchema) -> list[tuple[int, ImportAppSchema]]:
+        adapter = type_adapter(ImportAppSchema)
+        valid, names = [], set()
+        for line, data in batch:
+            report.total += 1
+            if isinstance(data, str):
+                self._fail(report, line, None, data)
+                continue
+
+            try:
+                row = adapter.validate_python(data)
+            except ValidationError as exc:
+                self._fail(report, line, data.get("name"), *(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+                ))
+                continue
+
+            if row.name in names:
+                self._fail(report, line, row.name, "Duplicate name in import file")
+                continue
+            names.add(row.name)
+            valid.append((line, row))
+        return valid
+
+    async def _resolve(self, entity, refs: set[str], *columns) -> dict[str, UUID]:
+        """Maps every id, name (or other ``columns``) reference in ``refs`` to an id, in one query."""
+        if not refs:
+            return {}
+
+        ids = {ref_id for ref in refs if (ref_id := _as_uuid(ref))}
+        columns = (entity.name, *columns)
+        stmt = select(entity.id, *columns).where(or_(entity.id.in_(ids), *(column.in_(refs) for column in columns)))
+        result = await self.db.execute(stmt)
+
+        resolved = {}
+        for row in result:
+            resolved[str(row[0])] = row[0]
+            for value in row[1:]:
+                resolved[value] = row[0]
+        return {ref: resolved[key] for ref in refs if (key := str(_as_uuid(ref) or ref)) in resolved}
+
+    async def _import_batch(self, user_id: Optional[str], batch: list[ParsedRow], report: ImportReportSchema):
+        rows = self._validate(batch, report)
+        if not rows:
+            return
+
+        categories = await self._resolve(Category, {row.category for _, row in rows}, Category.slug)
+        tags = await self._resolve(Tag, {tag for _, row in rows for tag in row.tags})
+        platforms = await self._resolve(Platform, {platform for _, row in rows for platform in row.platforms})
+
+        resolved = []
+        for line, row in rows:
+            errors = [f"Category not found: {row.category}"] if row.category not in categories else []
+            errors += [f"Tag not found: {tag}" for tag in row.tags if tag not in tags]
+            errors += [f"Platform not found: {platform}" for platform in row.platforms if platform not in platforms]
+            if errors:
+                self._fail(report, line, row.name, *errors)
+            else:
+                resolved.append((line, row))
+        if not resolved:
+            return
+
+        try:
+            created = await self._insert(user_id, resolved, categories, tags, platforms)
+            await self.db.commit()
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            for line, row in resolved:
+                self._fail(report, line, row.name, f"Batch failed: {exc.__class__.__name__}")
+            return
+
+        report.created += len(created)
+        for line, row in resolved:
+            if row.name not in created:
+                self._fail(report, line, row.name, "App with same name exists")
+
+    async def _insert(self, user_id, rows, categories, tags, platforms) -> set[str]:
+        """Inserts one batch and returns the names that were actually created."""
+        now = datetime.utcnow()
+
+        values = [
+            {
+                "id": uuid.uuid4(),
+                "name": row.name,
+                "description": row.description,
+                "brief": row.brief,
+                "trending": False,
+                "website": row.website,
+                "icon": row.icon,
+                "banner": row.banner,
+                "meta_title": row.meta_title,
+                "meta_description": row.meta_description,
+                "meta_keywords": row.meta_keywords,
+                "status": row.status,
+                "published_at": now if row.status == AppStatus.PUBLISHED else None,
+                "pricing_model": row.pricing_model,
+                "price": row.price,
+                "category_id": categories[row.category],
+                "api_available": False,
+                "ratings": 0.0,
+                "reviews": 0,
+                "subscribers": 0,
+                "shares": 0,
+                "rank": 0,
+                "is_active": True,
+                "is_deleted": False,
+                "created_at": now,
+                "created_by_id": user_id,
+                "last_updated_at": now,
+            }
+            for _, row in rows
+        ]
+
+        # Names that already exist are skipped rather than failing the batch. A slug taken by a
+        # concurrent writer since it was allocated fails the savepoint instead, and is re-allocated
+        stmt = pg_insert(App).on_conflict_do_nothing(index_elements=[App.name]).returning(App.id)
+        for attempt in range(SLUG_ATTEMPTS):
+            slugs = await allocate_slugs(self.db, App.slug, [row.name for _, row in rows])
+            for value, (_, row) in zip(values, rows):
+                value["slug"] = slugs[row.name]
+            try:
+                async with self.db.begin_nested():
+                    result = await self.db.execute(stmt.values(values))
+                    inserted = set(result.scalars().all())
+                break
+            except IntegrityError as exc:
+                if attempt == SLUG_ATTEMPTS - 1 or App.slug.key not in str(exc.orig):
+                    raise
+        if not inserted:
+            return set()
+
+        created = [(value, row) for value, (_, row) in zip(values, rows) if value["id"] in inserted]
+        tag_rows = [
+            {"app_id": value["id"], "tag_id": tag_id, "created_at": now}
+            for value, row in created for tag_id in {tags[tag] for tag in row.tags}
+        ]
+        platform_rows = [
+            {"app_id": value["id"], "platform_id": platform_id, "created_at": now}
+            for value, row in created for platform_id in {platforms[platform] for platform in row.platforms}
+        ]
+        if tag_rows:
+            await self.db.execute(insert(app_tags).values(tag_rows))
+        if platform_rows:
+            await self.db.execute(insert(app_platforms).values(platform_rows))
+
+        await record_deltas(self.db, CATEGORY_APP_COUNT, Counter(value["category_id"] for value, _ in created))
+        await self.db.execute(refresh_search_vectors(App.id.in_(inserted)))
+        return {row.name for _, row in created}
+
+
+def app_import_service(db: AsyncSession = Depends(get_db)) -> AppImportService:
+    return AppImportService(db)
@@ -0,0 +1,87 @@
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.orm import aliased
+
+from applibry_api.domain.entities.app import App
+from applibry_api.domain.entities.app_platform import app_platforms
+from applibry_api.domain.entities.app_tag import app_tags
+from applibry_api.domain.entities.category import Category
+from applibry_api.domain.entities.platform import Platform
+from applibry_api.domain.entities.tag import Tag
+
+# Exactly the columns AppSchema renders; subscriber rows (App.users) and the
+# search vector are never loaded.
+APP_COLUMNS = (
+    App.id,
+    App.name,
+    App.slug,
+    App.description,
+    App.brief,
+    App.price,
+    App.website,
+    App.meta_title,
+    App.meta_keywords,
+    App.meta_description,
+    App.icon,
+    App.banner,
+    App.status,
+    App.pricing_model,
+    App.category_id,
+    App.subscribers,
+    App.ratings,
+    App.reviews,
+    App.shares,
+    App.rank,
+    App.published_at,
+    App.created_at,
+    App.last_updated_at,
+)
+
+
+def _json_object(*columns):
+    pairs = []
+    for column in columns:
+        pairs.extend((literal_column(f"'{column.key}'"), column))
+    return func.json_build_object(*pairs, type_=JSON)
+
+
+def _category_json():
+    category = aliased(Category)
+    return (
+        select(_json_object(
+            category.id, category.name, category.description, category.is_active, category.icon,
+            category.app_count, category.subscribers, category.created_at, category.last_updated_at,
+        ))
+        .where(category.id == App.category_id)
+        .correlate(App)
+        .scalar_subquery()
+    )
+
+
+def _collection_json(entity, association, foreign_key: str):
+    target = aliased(entity)
+    item = _json_object(
+        target.id, target.name, target.description, target.is_active, target.created_at, target.last_updated_at,
+    )
+    return (
+        select(func.coalesce(func.json_agg(aggregate_order_by(item, target.name)), literal_column("'[]'::json"), type_=JSON))
+        .select_from(association.join(target, target.id == association.c[foreign_key]))
+        .where(association.c.app_id == App.id)
+        .correlate(App)
+        .scalar_subquery()
+    )
+
+
+def app_projection(*extra_columns):
+    """One SELECT yielding AppSchema-shaped rows: app columns plus category, tags and platforms as JSON."""
+    return select(
+        *APP_COLUMNS,
+        _category_json().label("category"),
+        _collection_json(Tag, app_tags, "tag_id").label("tags"),
+        _collection_json(Platform, app_platforms, "platform_id").label("platforms"),
+        *extra_columns,
+    ).select_from(App)
+
+
+def to_dict(row) -> dict:
+    return dict(row._mapping)
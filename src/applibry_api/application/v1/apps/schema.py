@@ -59,3 +59,35 @@ class AppSchema(BaseAppSchema):
     published_at: Optional[datetime]
     created_at: datetime
     last_updated_at: datetime
+
+
+# One JSONL/CSV row of a bulk import; category, tags and platforms are ids or names
+class ImportAppSchema(BaseModel):
+    name: str
+    description: str
+    brief: str
+    price: float
+    website: str
+    meta_title: str
+    meta_keywords: str
+    meta_description: str
+    icon: Optional[str] = None
+    banner: Optional[str] = None
+    status: AppStatus = AppStatus.DRAFT
+    pricing_model: PricingModel = PricingModel.FREE
+    category: str
+    tags: list[str] = []
+    platforms: list[str] = []
+
+
+class ImportRowErrorSchema(BaseModel):
+    line: int
+    name: Optional[str] = None
+    errors: list[str]
+
+
+class ImportReportSchema(BaseModel):
+    total: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[ImportRowErrorSchema] = []
@@ -0,0 +1,183 @@
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import Text, and_, cast, func, literal_column, or_, select, update
+
+from applibry_api.domain.entities.app import App
+from applibry_api.domain.entities.app_tag import app_tags
+from applibry_api.domain.entities.tag import Tag
+
+# The "simple" configuration keeps app names such as "Notion" or "Jira" intact
+# instead of stemming them with an English dictionary.
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+# Same weights Postgres applies by default in ts_rank for A/B/C/D labels.
+SEARCH_WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+
+# Runs of letters and digits, accents kept: to_tsvector('simple', ...) only
+# lowercases, so "Café" is indexed as "café" and the query must say so too.
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _weighted(value, weight: str):
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, func.coalesce(cast(value, Text), "")),
+        literal_column(f"'{weight}'"),
+    )
+
+
+def search_vector_expression():
+    """Weighted tsvector over name, tag names, keywords, brief and description of the current apps row."""
+    tag_names = (
+        select(func.string_agg(Tag.name, " "))
+        .select_from(app_tags.join(Tag, Tag.id == app_tags.c.tag_id))
+        .where(app_tags.c.app_id == App.id)
+        .scalar_subquery()
+    )
+    return (
+        _weighted(App.name, "A")
+        .op("||")(_weighted(tag_names, "B"))
+        .op("||")(_weighted(App.meta_keywords, "B"))
+        .op("||")(_weighted(App.brief, "C"))
+        .op("||")(_weighted(App.description, "D"))
+    )
+
+
+def refresh_search_vectors(*criteria):
+    """UPDATE statement recomputing apps.search_vector for the apps matching ``criteria``."""
+    return (
+        update(App)
+        .where(*criteria)
+        .values(search_vector=search_vector_expression())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def build_search_query(search: str):
+    """Prefix tsquery (``note:* & tak:*``) so results keep up with every keystroke."""
+    tokens = tokenize(search)
+    if not tokens:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, cast(" & ".join(f"{token}:*" for token in tokens), Text))
+
+
+def search_filter(search: str):
+    """Match on the GIN tsvector index, falling back to the trigram index for infix name matches."""
+    name_match = App.name.icontains(search, autoescape=True)
+    query = build_search_query(search)
+    if query is None:
+        return name_match
+    return or_(App.search_vector.op("@@")(query), name_match)
+
+
+def search_rank(search: str):
+    query = build_search_query(search)
+    similarity = func.similarity(App.name, cast(search, Text))
+    if query is None:
+        return similarity
+    return func.coalesce(func.ts_rank_cd(App.search_vector, query), 0) + similarity
+
+
+def after_rank_cursor(rank_expr, rank: float, name: str):
+    return or_(rank_expr < rank, and_(rank_expr == rank, App.name > name))
+
+
+class InMemoryAppSearchIndex:
+    """Pure-Python counterpart of the Postgres search index.
+
+    Tokenisation, prefix matching, AND semantics between query terms and the
+    A/B/C/D weighting mirror the SQL path, so it can stand in for Postgres in
+    tests or when running against a database without full-text search.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[object, float]] = defaultdict(dict)
+        self._vocabulary: list[str] = []
+        self._documents: dict[object, dict[str, float]] = {}
+        self._names: dict[object, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(
+        self,
+        app_id,
+        name: str,
+        brief: Optional[str] = None,
+        description: Optional[str] = None,
+        meta_keywords: Optional[str] = None,
+        tag_names: Iterable[str] = (),
+    ):
+        self.remove(app_id)
+
+        weights: dict[str, float] = defaultdict(float)
+        fields = (
+            (name, "A"),
+            (" ".join(tag_names), "B"),
+            (meta_keywords, "B"),
+            (brief, "C"),
+            (description, "D"),
+        )
+        for text, label in fields:
+            for token in tokenize(text):
+                weights[token] += SEARCH_WEIGHTS[label]
+
+        for token, weight in weights.items():
+            if token not in self._postings:
+                insort(self._vocabulary, token)
+            self._postings[token][app_id] = weight
+
+        self._documents[app_id] = dict(weights)
+        self._names[app_id] = name
+
+    def remove(self, app_id):
+        weights = self._documents.pop(app_id, None)
+        self._names.pop(app_id, None)
+        if not weights:
+            return
+
+        for token in weights:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(app_id, None)
+            if not postings:
+                del self._postings[token]
+                index = bisect_left(self._vocabulary, token)
+                if index < len(self._vocabulary) and self._vocabulary[index] == token:
+                    self._vocabulary.pop(index)
+
+    def _prefix_matches(self, prefix: str) -> dict[object, float]:
+        scores: dict[object, float] = defaultdict(float)
+        index = bisect_left(self._vocabulary, prefix)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(prefix):
+            for app_id, weight in self._postings[self._vocabulary[index]].items():
+                scores[app_id] += weight
+            index += 1
+        return scores
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[object, float]]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores: Optional[dict[object, float]] = None
+        for token in tokens:
+            matches = self._prefix_matches(token)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {app_id: score + matches[app_id] for app_id, score in scores.items() if app_id in matches}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._names[item[0]]))
+        return ranked[:limit]
@@ -1,4 +1,3 @@
-import base64
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -6,9 +5,16 @@ from uuid import UUID
 from fastapi import Depends
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm import aliased
 
+from applibry_api.application.v1.apps.projection import app_projection, to_dict
 from applibry_api.application.v1.apps.schema import CreateAppSchema, UpdateAppSchema
+from applibry_api.application.v1.apps.search import (
+    after_rank_cursor,
+    refresh_search_vectors,
+    search_filter,
+    search_rank,
+)
 from applibry_api.domain.entities.app import App
 from applibry_api.domain.enums.app_status import AppStatus
 from applibry_api.domain.entities.category import Category
@@ -18,20 +24,18 @@ from applibry_api.domain.entities.user import User
 from applibry_api.domain.entities.user_app import user_apps
 from applibry_api.domain.exceptions.base_exception import AppBadRequestException, AppNotFoundException
 from applibry_api.domain.utilities import file_manager
-from applibry_api.domain.utilities.slugify import generate_slug
-from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.cache.public_cache import invalidate_public_apps
+from applibry_api.infrastructure.persistence.counters import CATEGORY_APP_COUNT, record_delta, record_deltas
+from applibry_api.infrastructure.persistence.cursor import APP_NAME_CURSOR, APP_SEARCH_CURSOR, USER_APP_CURSOR
+from applibry_api.infrastructure.persistence.database import get_db, read_only
+from applibry_api.infrastructure.persistence.slug_allocator import add_with_unique_slug, update_with_unique_slug
 
 
-def encode_cursor(value: str) -> str:
-    return base64.urlsafe_b64encode(value.encode()).decode()
-
-def decode_cursor(cursor: str) -> str:
-    return base64.urlsafe_b64decode(cursor.encode()).decode()
-
 class AppService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @read_only
     async def get_apps(
         self,
         decoded_token: dict[str, str],
@@ -42,7 +46,7 @@ class AppService:
         category: Optional[str] = None
     ):
         user_id = decoded_token.get("sid")
-        stmt = select(App).options(selectinload(App.category), selectinload(App.users), selectinload(App.tags), selectinload(App.platforms))
+        stmt = app_projection()
 
         if personalised and user_id:
             stmt = (
@@ -52,49 +56,73 @@ class AppService:
                 .filter(~App.users.any(User.id == user_id))
             )
 
-        if search:
-            stmt = stmt.filter(App.name.ilike(f"%{search}%"))
-
         if category:
             stmt = stmt.filter(App.category_id == UUID(category))
 
+        if search:
+            return await self._search_apps(stmt, search, limit, cursor)
+
         if cursor:
-            cursor_value = decode_cursor(cursor)
-            stmt = stmt.filter(App.name > cursor_value)
+            (name_cursor,) = APP_NAME_CURSOR.decode(cursor)
+            stmt = stmt.filter(App.name > name_cursor)
 
         stmt = stmt.order_by(App.name).limit(limit + 1)
         result = await self.db.execute(stmt)
-        results = result.scalars().all()
+        results = [to_dict(row) for row in result]
 
         next_cursor = None
         if len(results) > limit:
-            next_cursor = encode_cursor(results[-2].name)
+            next_cursor = APP_NAME_CURSOR.encode(results[-2]["name"])
             results.pop()
 
         return {"data": results, "next_cursor": next_cursor}
 
+    async def _search_apps(self, stmt, search: str, limit: int, cursor: Optional[str] = None):
+        rank = search_rank(search)
+        stmt = stmt.add_columns(rank.label("search_rank")).filter(search_filter(search))
+
+        if cursor:
+            rank_cursor, name_cursor = APP_SEARCH_CURSOR.decode(cursor)
+            stmt = stmt.filter(after_rank_cursor(rank, rank_cursor, name_cursor))
+
+        stmt = stmt.order_by(rank.desc(), App.name).limit(limit + 1)
+        result = await self.db.execute(stmt)
+        rows = [to_dict(row) for row in result]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_row = rows[-2]
+            next_cursor = APP_SEARCH_CURSOR.encode(last_row["search_rank"], last_row["name"])
+            rows.pop()
+
+        for row in rows:
+            del row["search_rank"]
+        return {"data": rows, "next_cursor": next_cursor}
+
+    @read_only
     async def get_trending_apps(
         self,
         limit: int,
         category: Optional[str] = None,
         cursor: Optional[str] = None,
     ):
-        stmt = select(App).filter(App.trending == True).options(selectinload(App.category), selectinload(App.users), selectinload(App.tags), selectinload(App.platforms))
+        # Matches the ix_apps_trending_name partial index predicate
+        stmt = app_projection().filter(App.trending.is_(True), App.is_deleted.is_not(True))
 
         if category:
             stmt = stmt.filter(App.category_id == UUID(category))
 
         if cursor:
-            cursor_value = decode_cursor(cursor)
-            stmt = stmt.filter(App.name > cursor_value)
+            (name_cursor,) = APP_NAME_CURSOR.decode(cursor)
+            stmt = stmt.filter(App.name > name_cursor)
 
         stmt = stmt.order_by(App.name).limit(limit + 1)
         result = await self.db.execute(stmt)
-        apps = result.scalars().all()
+        apps = [to_dict(row) for row in result]
 
         next_cursor = None
         if len(apps) > limit:
-            next_cursor = encode_cursor(apps[-2].name)
+            next_cursor = APP_NAME_CURSOR.encode(apps[-2]["name"])
             apps.pop()
 
         return {"data": apps, "next_cursor": next_cursor}
@@ -114,7 +142,7 @@ class AppService:
         user_app_alias = aliased(user_apps)
 
         stmt = (
-            select(App, user_app_alias.c.created_at)
+            app_projection(user_app_alias.c.created_at.label("subscribed_at"))
             .join(
                 user_app_alias,
                 and_(
@@ -125,53 +153,46 @@ class AppService:
         )
 
         if search:
-            stmt = stmt.filter(App.name.ilike(f"%{search}%"))
+            stmt = stmt.filter(search_filter(search))
 
         if category:
             stmt = stmt.filter(App.category_id == category)
 
         if cursor:
-            created_at_cursor, name_cursor = decode_cursor(cursor)
+            created_at_cursor, app_id_cursor = USER_APP_CURSOR.decode(cursor)
+            # The redundant upper bound gives the planner an index condition on
+            # (user_id, created_at DESC, app_id); the OR alone is only a filter
             stmt = stmt.filter(
+                user_app_alias.c.created_at <= created_at_cursor,
                 or_(
                     user_app_alias.c.created_at < created_at_cursor,
-                    and_(
-                        user_app_alias.c.created_at == created_at_cursor,
-                        App.name > name_cursor,
-                    ),
-                )
+                    user_app_alias.c.app_id > app_id_cursor,
+                ),
             )
 
-        stmt = stmt.order_by(user_app_alias.c.created_at.desc(), App.name.asc()).limit(limit + 1)
+        stmt = stmt.order_by(user_app_alias.c.created_at.desc(), user_app_alias.c.app_id).limit(limit + 1)
         result = await self.db.execute(stmt)
-        rows = result.all()  # List[Tuple[App, created_at]]
+        apps = [to_dict(row) for row in result]
 
-        apps = [row[0] for row in rows]
         next_cursor = None
         if len(apps) > limit:
-            last_row = rows[-2]
-            next_cursor = encode_cursor((last_row[1].isoformat(), last_row[0].name))
+            last_app = apps[-2]
+            next_cursor = USER_APP_CURSOR.encode(last_app["subscribed_at"], last_app["id"])
             apps.pop()
 
         return {"data": apps, "next_cursor": next_cursor}
 
-
-
-
-
-
     async def get_apps_lookup(self):
-        stmt = select(App).filter(and_(not App.is_deleted, App.is_active))
+        stmt = select(App).filter(and_(App.is_deleted.is_not(True), App.is_active))
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
-    async def get_app(self, slug: str) -> App:
-        stmt = select(App).filter(App.slug == slug).options(selectinload(App.category), selectinload(App.users), selectinload(App.tags), selectinload(App.platforms))
-        result = await self.db.execute(stmt)
-        entity = result.scalar_one_or_none()
-        if entity is None:
+    async def get_app(self, slug: str) -> dict:
+        result = await self.db.execute(app_projection().filter(App.slug == slug))
+        row = result.one_or_none()
+        if row is None:
             raise AppNotFoundException("App not found")
-        return entity
+        return to_dict(row)
 
     async def get_app_by_id(self, _id: UUID) -> App:
         stmt = select(App).filter(App.id == _id)
@@ -195,14 +216,12 @@ class AppService:
         if not category:
             raise AppNotFoundException("Category not found")
 
-        icon_url = await file_manager.upload_to_s3(data.icon)
-        banner_url = await file_manager.upload_to_s3(data.banner)
+        icon_url, banner_url = await file_manager.upload_images_to_s3(data.icon, data.banner)
 
         entity = App(
             name=data.name,
             description=data.description,
             category_id=data.category_id,
-            slug=await self.get_unique_slug(data.name),
             website=data.website,
             pricing_model=data.pricing_model,
             price=data.price,
@@ -224,10 +243,13 @@ class AppService:
             platforms_result = await self.db.execute(select(Platform).where(Platform.id.in_(data.platforms)))
             entity.platforms = platforms_result.scalars().all()
 
-        self.db.add(entity)
-        category.app_count += 1
+        await add_with_unique_slug(self.db, entity, App.slug, data.name)
+        await record_delta(self.db, CATEGORY_APP_COUNT, category.id, 1)
+        await self.db.flush()
+        await self.db.execute(refresh_search_vectors(App.id == entity.id))
         await self.db.commit()
         await self.db.refresh(entity)
+        await invalidate_public_apps()
         return entity
 
     async def update_app(
@@ -250,16 +272,19 @@ class AppService:
         old_category_id = entity.category_id
         update_category_count = data.category_id != old_category_id
 
-        if data.icon and data.icon != entity.icon:
-            entity.icon = await file_manager.upload_to_s3(data.icon)
+        icon_url, banner_url = await file_manager.upload_images_to_s3(
+            data.icon if data.icon != entity.icon else None,
+            data.banner if data.banner != entity.banner else None,
+        )
+        if icon_url:
+            entity.icon = icon_url
 
-        if data.banner and data.banner != entity.banner:
-            entity.banner = await file_manager.upload_to_s3(data.banner)
+        if banner_url:
+            entity.banner = banner_url
 
         entity.name = data.name
         entity.description = data.description
         entity.category_id = data.category_id
-        entity.slug = await self.get_unique_slug(entity.name, _id)
         entity.website = data.website
         entity.pricing_model = data.pricing_model
         entity.price = data.price
@@ -281,15 +306,13 @@ class AppService:
             entity.platforms = platforms_result.scalars().all()
 
         if update_category_count:
-            category.app_count += 1
-            old_category_result = await self.db.execute(
-                select(Category).filter(Category.id == old_category_id)
-            )
-            if old_category := old_category_result.scalar_one_or_none():
-                old_category.app_count -= 1
+            await record_deltas(self.db, CATEGORY_APP_COUNT, {category.id: 1, old_category_id: -1})
 
+        await update_with_unique_slug(self.db, entity, App.slug, data.name)
+        await self.db.execute(refresh_search_vectors(App.id == _id))
         await self.db.commit()
         await self.db.refresh(entity)
+        await invalidate_public_apps()
         return entity
 
     async def publish_app(self, decoded_token: dict[str, str], _id: UUID):
@@ -300,6 +323,7 @@ class AppService:
         entity.last_updated_at = datetime.utcnow()
         await self.db.commit()
         await self.db.refresh(entity)
+        await invalidate_public_apps()
         return entity
 
     async def revert_to_draft(self, decoded_token: dict[str, str], _id: UUID):
@@ -310,6 +334,7 @@ class AppService:
             entity.last_updated_at = datetime.utcnow()
             await self.db.commit()
             await self.db.refresh(entity)
+            await invalidate_public_apps()
         return entity
 
     async def agentic_app_generation(self, entity: App):
@@ -317,20 +342,6 @@ class AppService:
         await self.db.refresh(entity)
         return entity
 
-    async def get_unique_slug(self, name: str, app_id: UUID | None = None):
-        slug = generate_slug(name)
-        counter = 1
-        while True:
-            stmt = select(App).filter(App.slug == slug)
-            if app_id:
-                stmt = stmt.filter(App.id != app_id)
-            result = await self.db.execute(stmt)
-            if not result.scalar_one_or_none():
-                break
-            slug = f"{slug}-{counter}"
-            counter += 1
-        return slug
-
 
 def app_service(db: AsyncSession = Depends(get_db)) -> AppService:
     return AppService(db)
\ No newline at end of file
@@ -2,15 +2,15 @@ import datetime
 from datetime import timedelta
 from typing import Annotated
 
-from decouple import config
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from starlette import status
 
 from applibry_api.domain.entities.user import User
 from applibry_api.domain.utilities import token_service
-from applibry_api.infrastructure.persistence.database import get_db, oauth2_scheme, verify_token
+from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.persistence.database import oauth2_scheme, verify_token
 from applibry_api.domain.exceptions.base_exception import AppBadRequestException
 from applibry_api.application.v1.auth.schema import (
     AuthResponseSchema,
@@ -38,9 +38,11 @@ from applibry_api.domain.utilities.tokenizer import generate_secure_number
 router = APIRouter(
     prefix="/auth",
     tags=["Auth"],
-    dependencies=[Depends(get_db)]
 )
 
+# Mounted at the site root, outside /api/v1
+well_known_router = APIRouter(tags=["Auth"])
+
 
 @router.post("/register", response_model=AuthResponseSchema, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -224,7 +226,7 @@ async def refresh(
 def get_auth_response(data: User):
     access_token = token_service.create_access_token(data)
     refresh_token = token_service.create_refresh_token(data)
-    access_token_lifetime = config("ACCESS_TOKEN_EXPIRES_IN_MINS", cast=int)
+    access_token_lifetime = settings.ACCESS_TOKEN_EXPIRES_IN_MINS
     expiration_time = datetime.datetime.utcnow() + datetime.timedelta(
         minutes=access_token_lifetime
     )
@@ -238,4 +240,11 @@ def get_auth_response(data: User):
         expires_in=expiration_time,
         success=True,
         message="Login successful",
-    ) 
\ No newline at end of file
+    ) 
+
+
+@well_known_router.get("/.well-known/jwks.json", status_code=status.HTTP_200_OK)
+async def jwks(response: Response):
+    """Public keys of the token key ring, so other services can verify tokens locally."""
+    response.headers["Cache-Control"] = f"public, max-age={settings.JWKS_MAX_AGE}"
+    return token_service.jwks()
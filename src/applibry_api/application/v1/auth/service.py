@@ -1,17 +1,17 @@
+import asyncio
 import datetime
 import uuid
-from datetime import timedelta
 
-from decouple import config
 from fastapi import Depends
-from jose import jwt
+from jose import JWTError
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.application.v1.auth.schema import RegisterSchema
 from applibry_api.domain.entities.user import User
 from applibry_api.domain.exceptions.base_exception import AppBadRequestException
-from applibry_api.domain.utilities.cryptography import verify_password, hash_password
+from applibry_api.domain.utilities import token_service
+from applibry_api.domain.utilities.cryptography import hash_password_async, verify_password_async
 from applibry_api.infrastructure.persistence.database import get_db
 
 
@@ -20,20 +20,20 @@ class AuthService:
         self.db = db
 
     async def register(self, data: RegisterSchema, code: str):
-        result = await self.db.execute(
-            select(User).filter(func.lower(User.email) == data.email.lower())
-        )
-        if result.scalar_one_or_none():
+        if await self.get_user_by_email(data.email):
             raise AppBadRequestException("User with this email exists")
 
+        password_hash, verification_code = await asyncio.gather(
+            hash_password_async(data.password), hash_password_async(code)
+        )
         entity = User(
             email=data.email,
             username=data.email,
             first_name=data.first_name,
             last_name=data.last_name,
-            password_hash=hash_password(data.password),
+            password_hash=password_hash,
             public_key=str(uuid.uuid4()),
-            verification_code=hash_password(code),
+            verification_code=verification_code,
             account_type=data.account_type,
             is_admin=False,
             is_active=True,
@@ -73,7 +73,7 @@ class AuthService:
             raise AppBadRequestException("Account with the provided email does not exist")
 
         entity.password_reset_requested = True
-        entity.password_reset_code = hash_password(code)
+        entity.password_reset_code = await hash_password_async(code)
         if not entity.public_key:
             entity.public_key = str(uuid.uuid4())
         await self.db.commit()
@@ -85,7 +85,7 @@ class AuthService:
         if not user:
             raise AppBadRequestException("User not found")
 
-        if not verify_password(code, user.password_reset_code):
+        if not await verify_password_async(code, user.password_reset_code):
             raise AppBadRequestException("Incorrect code")
         return user
 
@@ -95,7 +95,7 @@ class AuthService:
             raise AppBadRequestException("User not found")
 
         user.password_reset_requested = False
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         await self.db.commit()
         await self.db.refresh(user)
         return user
@@ -105,10 +105,10 @@ class AuthService:
         if not user:
             raise AppBadRequestException("User not found")
 
-        if not verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, user.password_hash):
             raise AppBadRequestException("Incorrect password")
 
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         await self.db.commit()
         await self.db.refresh(user)
         return user
@@ -118,15 +118,16 @@ class AuthService:
         if not user:
             raise AppBadRequestException("Invalid credentials")
 
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             raise AppBadRequestException("Invalid credentials")
 
         return user
 
     async def refresh(self, refresh_token: str) -> User:
-        payload = jwt.decode(
-            refresh_token, config("SECRET_KEY"), algorithms=[config("ALGORITHM")]
-        )
+        try:
+            payload = token_service.decode(refresh_token)
+        except JWTError:
+            raise AppBadRequestException("Invalid credentials")
         if payload.get("type") != "refresh":
             raise AppBadRequestException("Invalid credentials")
 
@@ -141,7 +142,7 @@ class AuthService:
         if not user:
             raise AppBadRequestException("User not found")
 
-        if not verify_password(code, user.verification_code):
+        if not await verify_password_async(code, user.verification_code):
             raise AppBadRequestException("Incorrect code")
 
         user.email_confirmed = True
@@ -166,23 +167,11 @@ class AuthService:
         if not entity:
             raise AppBadRequestException("User not found")
 
-        entity.verification_code = hash_password(code)
+        entity.verification_code = await hash_password_async(code)
         await self.db.commit()
         await self.db.refresh(entity)
         return entity
 
 
-    async def generate_token(self, data: User, expires_delta: timedelta, _type: str = "access"):
-        encode = {
-            "sub": data.username,
-            "sid": str(data.id),  # user id
-            "exp": datetime.datetime.utcnow() + expires_delta,  # expiration time
-            "iat": datetime.datetime.utcnow(),  # issued at time
-            "nbf": datetime.datetime.utcnow(),  # not before time
-            "type": _type,
-        }
-        return jwt.encode(encode, config("SECRET_KEY"), algorithm=config("ALGORITHM"))
-
-
 def auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     return AuthService(db)
\ No newline at end of file
@@ -14,6 +14,7 @@ from applibry_api.domain.schemas.common_schema import (
     RouteResponseSchemaExt,
 )
 from applibry_api.infrastructure.persistence.database import verify_token
+from applibry_api.infrastructure.persistence.pagination import TotalMode
 
 router = APIRouter(
     prefix="/categories",
@@ -29,7 +30,8 @@ router = APIRouter(
 )
 async def get_categories(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
+    total: TotalMode = "estimated",
     per_page: int = 20,
     lookup: bool = False,
     service: CategoryService = Depends(category_service),
@@ -42,13 +44,11 @@ async def get_categories(
             message="Success",
         )
 
-    skip = (page - 1) * per_page
-    data = await service.get_categories(skip=skip, limit=per_page, search=search)
+    data = await service.get_categories(limit=per_page, cursor=cursor, search=search, total=total)
     return RouteResponseSchemaExt[CategorySchema](
         data=[CategorySchema.model_validate(category) for category in data["data"]],
         success=True,
-        current_page=page,
-        page_size=per_page,
+        next_cursor=data["next_cursor"],
         total=data["total"],
         message="Success",
     )
@@ -2,7 +2,7 @@ from typing import Optional, Dict
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.application.v1.categories.schema import (
@@ -15,29 +15,32 @@ from applibry_api.domain.exceptions.base_exception import (
     AppBadRequestException,
     AppNotFoundException,
 )
-from applibry_api.domain.utilities.slugify import generate_slug
-from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.cache.public_cache import invalidate_public_categories
+from applibry_api.infrastructure.persistence.database import get_db, read_only
+from applibry_api.infrastructure.persistence.pagination import TotalMode, paginate
+from applibry_api.infrastructure.persistence.slug_allocator import add_with_unique_slug, update_with_unique_slug
 
 
 class CategoryService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @read_only
     async def get_categories(
-        self, skip: int, limit: int, search: Optional[str] = None
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        total: TotalMode = "estimated",
     ):
         stmt = select(Category)
         if search:
             stmt = stmt.filter(Category.name.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(Category.name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(
+            self.db, stmt, Category.name, Category.id, limit, cursor, total,
+            estimate_table=None if search else Category.__tablename__,
+        )
 
     async def get_categories_lookup(self):
         stmt = select(Category).filter(
@@ -56,27 +59,21 @@ class CategoryService:
     async def get_user_categories(
         self,
         decoded_token: dict[str, str],
-        skip: int,
         limit: int,
+        cursor: Optional[str] = None,
         search: Optional[str] = None,
+        total: TotalMode = "estimated",
     ):
         user_id = decoded_token.get("sid")
         if not user_id:
-            return {"total": 0, "data": []}
+            return {"total": 0, "data": [], "next_cursor": None}
 
         stmt = select(Category).join(Category.users).filter(User.id == user_id)
 
         if search:
             stmt = stmt.filter(Category.name.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(Category.name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(self.db, stmt, Category.name, Category.id, limit, cursor, total)
 
     async def create_category(
         self, decoded_token: Dict[str, str], data: CreateCategorySchema
@@ -89,11 +86,11 @@ class CategoryService:
 
         entity = Category(**data.model_dump())
         entity.created_by_id = decoded_token.get("sid")
-        entity.slug = await self.get_unique_slug(entity.name)
 
-        self.db.add(entity)
+        await add_with_unique_slug(self.db, entity, Category.slug, entity.name)
         await self.db.commit()
         await self.db.refresh(entity)
+        await invalidate_public_categories()
         return entity
 
     async def update_category(
@@ -110,10 +107,11 @@ class CategoryService:
         for key, value in update_data.items():
             setattr(entity, key, value)
 
-        entity.slug = await self.get_unique_slug(entity.name, _id)
         entity.last_updated_by_id = decoded_token.get("sid")
+        await update_with_unique_slug(self.db, entity, Category.slug, entity.name)
         await self.db.commit()
         await self.db.refresh(entity)
+        await invalidate_public_categories()
         return entity
 
     async def change_status(self, _id: UUID):
@@ -121,27 +119,15 @@ class CategoryService:
         entity.is_active = not entity.is_active
         await self.db.commit()
         await self.db.refresh(entity)
+        await invalidate_public_categories()
         return entity
 
     async def delete_category(self, _id: UUID):
         entity = await self.get_category(_id)
         await self.db.delete(entity)
         await self.db.commit()
+        await invalidate_public_categories()
         return True
 
-    async def get_unique_slug(self, name: str, category_id: Optional[UUID] = None):
-        slug = generate_slug(name)
-        counter = 1
-        while True:
-            stmt = select(Category).filter(Category.slug == slug)
-            if category_id:
-                stmt = stmt.filter(Category.id != category_id)
-            result = await self.db.execute(stmt)
-            if not result.scalar_one_or_none():
-                break
-            slug = f"{slug}-{counter}"
-            counter += 1
-        return slug
-
 def category_service(db: AsyncSession = Depends(get_db)) -> CategoryService:
     return CategoryService(db)
\ No newline at end of file
@@ -0,0 +1 @@
+from . import controller
\ No newline at end of file
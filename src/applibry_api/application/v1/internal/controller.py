@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from applibry_api.infrastructure.persistence.database import pool_metrics, verify_token
+from applibry_api.domain.schemas.common_schema import RouteResponseSchema
+from applibry_api.application.v1.internal.schema import PoolMetricsSchema
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    dependencies=[Depends(verify_token)],
+    include_in_schema=False,
+)
+
+@router.get("/pool-metrics", response_model=RouteResponseSchema[PoolMetricsSchema], status_code=status.HTTP_200_OK)
+async def get_pool_metrics():
+    return RouteResponseSchema[PoolMetricsSchema](
+        data=PoolMetricsSchema.model_validate(pool_metrics()),
+        success=True,
+        message="Pool metrics fetched successfully"
+    )
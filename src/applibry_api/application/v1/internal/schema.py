@@ -0,0 +1,16 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PoolMetricsSchema(BaseModel):
+    profile: str
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: Optional[int] = None
+    checkout_timeouts: Optional[int] = None
+    wait_avg_ms: Optional[float] = None
+    wait_max_ms: Optional[float] = None
@@ -17,6 +17,7 @@ from applibry_api.domain.schemas.common_schema import (
     RouteResponseSchema,
 )
 from applibry_api.infrastructure.persistence.database import verify_token
+from applibry_api.infrastructure.persistence.pagination import TotalMode
 
 router = APIRouter(
     prefix="/permissions",
@@ -32,7 +33,8 @@ router = APIRouter(
 )
 async def get_permissions(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
+    total: TotalMode = "estimated",
     per_page: int = 20,
     lookup: bool = False,
     service: PermissionService = Depends(permission_service),
@@ -45,13 +47,11 @@ async def get_permissions(
             message="Success",
         )
 
-    skip = (page - 1) * per_page
-    data = await service.get_permissions(skip=skip, limit=per_page, search=search)
+    data = await service.get_permissions(limit=per_page, cursor=cursor, search=search, total=total)
     return RouteResponseSchemaExt[PermissionSchema](
         data=[PermissionSchema.model_validate(permission) for permission in data["data"]],
         success=True,
-        current_page=page,
-        page_size=per_page,
+        next_cursor=data["next_cursor"],
         total=data["total"],
         message="Success",
     )
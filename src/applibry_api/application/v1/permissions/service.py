@@ -2,7 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.application.v1.permissions.schema import (
@@ -14,8 +14,9 @@ from applibry_api.domain.exceptions.base_exception import (
     AppBadRequestException,
     AppNotFoundException,
 )
-from applibry_api.domain.utilities.slugify import generate_slug
 from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.pagination import TotalMode, paginate
+from applibry_api.infrastructure.persistence.slug_allocator import add_with_unique_slug, update_with_unique_slug
 
 
 class PermissionService:
@@ -23,20 +24,20 @@ class PermissionService:
         self.db = db
 
     async def get_permissions(
-        self, skip: int, limit: int, search: Optional[str] = None
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        total: TotalMode = "estimated",
     ):
         stmt = select(Permission)
         if search:
             stmt = stmt.filter(Permission.name.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(Permission.name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(
+            self.db, stmt, Permission.name, Permission.id, limit, cursor, total,
+            estimate_table=None if search else Permission.__tablename__,
+        )
 
     async def get_permissions_lookup(self):
         stmt = select(Permission).filter(
@@ -62,9 +63,8 @@ class PermissionService:
             raise AppBadRequestException("Permission with same name exists")
 
         entity = Permission(**data.model_dump())
-        entity.code = await self.get_unique_code(entity.name)
         entity.created_by_id = decoded_token.get("sid")
-        self.db.add(entity)
+        await add_with_unique_slug(self.db, entity, Permission.code, entity.name)
         await self.db.commit()
         await self.db.refresh(entity)
         return entity
@@ -83,7 +83,7 @@ class PermissionService:
         for key, value in update_data.items():
             setattr(entity, key, value)
             
-        entity.code = await self.get_unique_code(entity.name, _id)
+        await update_with_unique_slug(self.db, entity, Permission.code, entity.name)
         await self.db.commit()
         await self.db.refresh(entity)
         return entity
@@ -101,19 +101,5 @@ class PermissionService:
         await self.db.commit()
         return True
 
-    async def get_unique_code(self, name: str, permission_id: Optional[UUID] = None):
-        code = generate_slug(name)
-        counter = 1
-        while True:
-            stmt = select(Permission).filter(Permission.code == code)
-            if permission_id:
-                stmt = stmt.filter(Permission.id != permission_id)
-            result = await self.db.execute(stmt)
-            if not result.scalar_one_or_none():
-                break
-            code = f"{code}-{counter}"
-            counter += 1
-        return code
-
 def permission_service(db: AsyncSession = Depends(get_db)) -> PermissionService:
     return PermissionService(db)
\ No newline at end of file
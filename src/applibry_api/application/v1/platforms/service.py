@@ -2,7 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.application.v1.platforms.schema import (
@@ -15,6 +15,7 @@ from applibry_api.domain.exceptions.base_exception import (
     AppNotFoundException,
 )
 from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.pagination import TotalMode, paginate
 
 
 class PlatformService:
@@ -22,20 +23,20 @@ class PlatformService:
         self.db = db
 
     async def get_platforms(
-        self, skip: int, limit: int, search: Optional[str] = None
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        total: TotalMode = "estimated",
     ):
         stmt = select(Platform)
         if search:
             stmt = stmt.filter(Platform.name.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(Platform.name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(
+            self.db, stmt, Platform.name, Platform.id, limit, cursor, total,
+            estimate_table=None if search else Platform.__tablename__,
+        )
 
     async def get_platforms_lookup(self):
         stmt = select(Platform).filter(
@@ -2,7 +2,6 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, UploadFile, File
-from sqlalchemy.orm import Session
 from starlette import status
 
 from applibry_api.application.v1.apps.schema import AppSchema
@@ -11,54 +10,63 @@ from applibry_api.application.v1.categories.schema import CategorySchema
 from applibry_api.application.v1.categories.service import CategoryService, category_service
 from applibry_api.domain.enums.lookup_type import LookupType
 from applibry_api.domain.schemas.common_schema import LookupSchema, RouteResponseSchemaExt
-from applibry_api.infrastructure.persistence.database import get_db, verify_token
+from applibry_api.domain.utilities.json_response import FastJSONResponse, validate_list
+from applibry_api.infrastructure.cache.public_cache import (
+    PUBLIC_APPS_NAMESPACE,
+    PUBLIC_CATEGORIES_NAMESPACE,
+    public_cache,
+)
+from applibry_api.infrastructure.cache.result_cache import cache_key
+from applibry_api.infrastructure.persistence.database import verify_token
 from applibry_api.infrastructure.providers.nattypad.schemas.app_schema import AppResponseSchemaExt
 
 
 router = APIRouter(
     prefix="/public",
     tags=["public"],
-    dependencies=[Depends(get_db)]
 )
 
 
 @router.get("/apps", response_model=RouteResponseSchemaExt[AppSchema], status_code=status.HTTP_200_OK)
-async def get_apps(category: Optional[str] = None, page: int = 1, per_page: int = 20, db: Session = Depends(get_db), _app_service: AppService = Depends(app_service)):
-    if page <= 0:
-        page = 1
-
+async def get_apps(category: Optional[str] = None, cursor: Optional[str] = None, per_page: int = 20, _app_service: AppService = Depends(app_service)):
     if per_page <= 0:
         per_page = 20
 
-    skip = (page - 1) * per_page
     limit = per_page
-    data = await _app_service.get_trending_apps(limit=limit, category=category)
-    return RouteResponseSchemaExt[AppSchema](
-        data=[AppSchema.model_validate(app) for app in data["data"]],
+    key = cache_key(category=category, cursor=cursor, limit=limit)
+    if (cached := await public_cache.get(PUBLIC_APPS_NAMESPACE, key)) is not None:
+        return FastJSONResponse(cached)
+
+    data = await _app_service.get_trending_apps(limit=limit, category=category, cursor=cursor)
+    response = RouteResponseSchemaExt[AppSchema](
+        data=validate_list(AppSchema, data["data"]),
         next_cursor=data["next_cursor"],
         success=True,
         message="Success",
-    )
+    ).model_dump(mode="json")
+    await public_cache.set(PUBLIC_APPS_NAMESPACE, key, response)
+    return FastJSONResponse(response)
 
 @router.get("/categories", response_model=RouteResponseSchemaExt[CategorySchema], status_code=status.HTTP_200_OK)
-async def get_categories(search: str = None, page: int = 1, per_page: int = 20, db: Session = Depends(get_db), _category_service: CategoryService = Depends(category_service)):
-    if page <= 0:
-        page = 1
-
+async def get_categories(search: str = None, cursor: Optional[str] = None, per_page: int = 20, _category_service: CategoryService = Depends(category_service)):
     if per_page <= 0:
         per_page = 20
 
-    skip = (page - 1) * per_page
     limit = per_page
-    data = await _category_service.get_categories(skip=skip, limit=limit, search=search)
-    return RouteResponseSchemaExt[CategorySchema](
-        data=[CategorySchema.model_validate(category) for category in data["data"]],
+    key = cache_key(search=search, cursor=cursor, limit=limit)
+    if (cached := await public_cache.get(PUBLIC_CATEGORIES_NAMESPACE, key)) is not None:
+        return FastJSONResponse(cached)
+
+    data = await _category_service.get_categories(limit=limit, cursor=cursor, search=search)
+    response = RouteResponseSchemaExt[CategorySchema](
+        data=validate_list(CategorySchema, data["data"]),
+        next_cursor=data["next_cursor"],
         success=True,
-        current_page=page,
-        page_size=per_page,
         total=data["total"],
         message="Success",
-    )
+    ).model_dump(mode="json")
+    await public_cache.set(PUBLIC_CATEGORIES_NAMESPACE, key, response)
+    return FastJSONResponse(response)
 
 # @router.get("", response_model=AppResponseSchemaExt[LookupSchema], status_code=status.HTTP_200_OK)
 # async def get_lookups(_type: LookupType, _token:dict[str, str]=Depends(verify_token), db: Session = Depends(get_db)):
@@ -15,6 +15,7 @@ from applibry_api.domain.schemas.common_schema import (
     RouteResponseSchema,
 )
 from applibry_api.infrastructure.persistence.database import verify_token
+from applibry_api.infrastructure.persistence.pagination import TotalMode
 
 router = APIRouter(
     prefix="/roles",
@@ -30,7 +31,8 @@ router = APIRouter(
 )
 async def get_roles(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
+    total: TotalMode = "estimated",
     per_page: int = 20,
     lookup: bool = False,
     service: RoleService = Depends(role_service),
@@ -43,13 +45,11 @@ async def get_roles(
             message="Success",
         )
 
-    skip = (page - 1) * per_page
-    data = await service.get_roles(skip=skip, limit=per_page, search=search)
+    data = await service.get_roles(limit=per_page, cursor=cursor, search=search, total=total)
     return RouteResponseSchemaExt[RoleSchema](
         data=[RoleSchema.model_validate(role) for role in data["data"]],
         success=True,
-        current_page=page,
-        page_size=per_page,
+        next_cursor=data["next_cursor"],
         total=data["total"],
         message="Success",
     )
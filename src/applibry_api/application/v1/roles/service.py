@@ -2,7 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.application.v1.roles.schema import CreateRoleSchema, UpdateRoleSchema
@@ -12,27 +12,30 @@ from applibry_api.domain.exceptions.base_exception import (
     AppBadRequestException,
     AppNotFoundException,
 )
-from applibry_api.domain.utilities.slugify import generate_slug
 from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.pagination import TotalMode, paginate
+from applibry_api.infrastructure.persistence.slug_allocator import add_with_unique_slug, update_with_unique_slug
 
 
 class RoleService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_roles(self, skip: int, limit: int, search: Optional[str] = None):
+    async def get_roles(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        total: TotalMode = "estimated",
+    ):
         stmt = select(Role)
         if search:
             stmt = stmt.filter(Role.name.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(Role.name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(
+            self.db, stmt, Role.name, Role.id, limit, cursor, total,
+            estimate_table=None if search else Role.__tablename__,
+        )
 
     async def get_roles_lookup(self):
         stmt = select(Role).filter(
@@ -58,7 +61,6 @@ class RoleService:
             description=data.description,
             is_system_role=data.is_system_role,
             created_by_id=decoded_token.get("sid"),
-            code=await self.get_unique_code(data.name),
         )
 
         if data.permissions:
@@ -67,7 +69,7 @@ class RoleService:
             )
             entity.permissions = permissions_result.scalars().all()
 
-        self.db.add(entity)
+        await add_with_unique_slug(self.db, entity, Role.code, data.name)
         await self.db.commit()
         await self.db.refresh(entity)
         return entity
@@ -84,8 +86,6 @@ class RoleService:
         for key, value in update_data.items():
             if key != "permissions":
                 setattr(entity, key, value)
-        
-        entity.code = await self.get_unique_code(entity.name, _id)
 
         if data.permissions:
             permissions_result = await self.db.execute(
@@ -93,6 +93,7 @@ class RoleService:
             )
             entity.permissions = permissions_result.scalars().all()
 
+        await update_with_unique_slug(self.db, entity, Role.code, entity.name)
         await self.db.commit()
         await self.db.refresh(entity)
         return entity
@@ -110,19 +111,5 @@ class RoleService:
         await self.db.commit()
         return True
 
-    async def get_unique_code(self, name: str, role_id: Optional[UUID] = None):
-        code = generate_slug(name)
-        counter = 1
-        while True:
-            stmt = select(Role).filter(Role.code == code)
-            if role_id:
-                stmt = stmt.filter(Role.id != role_id)
-            result = await self.db.execute(stmt)
-            if not result.scalar_one_or_none():
-                break
-            code = f"{code}-{counter}"
-            counter += 1
-        return code
-
 def role_service(db: AsyncSession = Depends(get_db)) -> RoleService:
     return RoleService(db)
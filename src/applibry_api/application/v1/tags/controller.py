@@ -10,6 +10,7 @@ from applibry_api.domain.schemas.common_schema import (
     RouteResponseSchema,
 )
 from applibry_api.infrastructure.persistence.database import verify_token
+from applibry_api.infrastructure.persistence.pagination import TotalMode
 
 router = APIRouter(
     prefix="/tags",
@@ -25,7 +26,8 @@ router = APIRouter(
 )
 async def get_tags(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
+    total: TotalMode = "estimated",
     per_page: int = 20,
     lookup: bool = False,
     service: TagService = Depends(tag_service),
@@ -38,13 +40,11 @@ async def get_tags(
             message="Success",
         )
 
-    skip = (page - 1) * per_page
-    data = await service.get_tags(skip=skip, limit=per_page, search=search)
+    data = await service.get_tags(limit=per_page, cursor=cursor, search=search, total=total)
     return RouteResponseSchemaExt[TagSchema](
         data=[TagSchema.model_validate(tag) for tag in data["data"]],
         success=True,
-        current_page=page,
-        page_size=per_page,
+        next_cursor=data["next_cursor"],
         total=data["total"],
         message="Success",
     )
@@ -2,35 +2,41 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from applibry_api.application.v1.apps.search import refresh_search_vectors
 from applibry_api.application.v1.tags.schema import CreateTagSchema, UpdateTagSchema
+from applibry_api.domain.entities.app import App
+from applibry_api.domain.entities.app_tag import app_tags
 from applibry_api.domain.entities.tag import Tag
 from applibry_api.domain.exceptions.base_exception import (
     AppBadRequestException,
     AppNotFoundException,
 )
 from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.pagination import TotalMode, paginate
 
 
 class TagService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_tags(self, skip: int, limit: int, search: Optional[str] = None):
+    async def get_tags(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        total: TotalMode = "estimated",
+    ):
         stmt = select(Tag)
         if search:
             stmt = stmt.filter(Tag.name.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(Tag.name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(
+            self.db, stmt, Tag.name, Tag.id, limit, cursor, total,
+            estimate_table=None if search else Tag.__tablename__,
+        )
 
     async def get_tags_lookup(self):
         stmt = select(Tag).filter(and_(Tag.is_deleted != True, Tag.is_active))
@@ -64,10 +70,18 @@ class TagService:
             raise AppBadRequestException("Tag with same name exists")
 
         entity = await self.get_tag(_id)
+        renamed = entity.name != data.name
         update_data = data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(entity, key, value)
 
+        if renamed:
+            # Tag names are part of every tagged app's search document
+            await self.db.flush()
+            await self.db.execute(
+                refresh_search_vectors(App.id.in_(select(app_tags.c.app_id).where(app_tags.c.tag_id == _id)))
+            )
+
         await self.db.commit()
         await self.db.refresh(entity)
         return entity
@@ -9,16 +9,21 @@ from applibry_api.application.v1.categories.schema import CategorySchema
 from applibry_api.application.v1.categories.service import CategoryService, category_service
 from applibry_api.application.v1.users.schema import (
     InviteUserSchema,
+    UpdateUserLibrySchema,
     UpdateUserProfileSchema,
     UpdateUserSchema,
+    UserLibryChangesSchema,
     UserSchema,
 )
+from applibry_api.application.v1.users.principal import current_user
 from applibry_api.application.v1.users.service import UserService, user_service
 from applibry_api.domain.schemas.common_schema import (
     RouteResponseSchemaExt,
     RouteResponseSchema,
 )
+from applibry_api.domain.utilities.json_response import model_response, validate_list
 from applibry_api.infrastructure.persistence.database import verify_token
+from applibry_api.infrastructure.persistence.pagination import TotalMode
 
 router = APIRouter(
     prefix="/users",
@@ -34,7 +39,8 @@ router = APIRouter(
 )
 async def get_users(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
+    total: TotalMode = "estimated",
     per_page: int = 20,
     lookup: bool = False,
     service: UserService = Depends(user_service),
@@ -47,13 +53,11 @@ async def get_users(
             message="Success",
         )
 
-    skip = (page - 1) * per_page
-    data = await service.get_users(skip=skip, limit=per_page, search=search)
+    data = await service.get_users(limit=per_page, cursor=cursor, search=search, total=total)
     return RouteResponseSchemaExt[UserSchema](
         data=[UserSchema.model_validate(user) for user in data["data"]],
         success=True,
-        current_page=page,
-        page_size=per_page,
+        next_cursor=data["next_cursor"],
         total=data["total"],
         message="Success",
     )
@@ -64,13 +68,9 @@ async def get_users(
     response_model=RouteResponseSchema[UserSchema],
     status_code=status.HTTP_200_OK,
 )
-async def profile(
-    token: dict[str, str] = Depends(verify_token),
-    service: UserService = Depends(user_service),
-):
-    data = await service.get_current_user(token)
+async def profile(user: UserSchema = Depends(current_user)):
     return RouteResponseSchema[UserSchema](
-        data=UserSchema.model_validate(data), success=True, message="User details"
+        data=user, success=True, message="User details"
     )
 
 
@@ -81,23 +81,20 @@ async def profile(
 )
 async def get_user_libry(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
     per_page: int = 20,
     token: dict[str, str] = Depends(verify_token),
     service: AppService = Depends(app_service),
 ):
-    skip = (page - 1) * per_page
     data = await service.get_user_apps(
-        decoded_token=token, limit=per_page, search=search
+        decoded_token=token, limit=per_page, cursor=cursor, search=search
     )
-    return RouteResponseSchemaExt[AppSchema](
-        data=[AppSchema.model_validate(app) for app in data["data"]],
+    return model_response(RouteResponseSchemaExt[AppSchema](
+        data=validate_list(AppSchema, data["data"]),
+        next_cursor=data["next_cursor"],
         success=True,
-        current_page=page,
-        page_size=per_page,
-        total=data["total"],
         message="Success",
-    )
+    ))
 
 
 @router.get(
@@ -107,20 +104,19 @@ async def get_user_libry(
 )
 async def get_user_preference(
     search: str | None = None,
-    page: int = 1,
+    cursor: str | None = None,
+    total: TotalMode = "estimated",
     per_page: int = 20,
     token: dict[str, str] = Depends(verify_token),
     service: CategoryService = Depends(category_service),
 ):
-    skip = (page - 1) * per_page
     data = await service.get_user_categories(
-        decoded_token=token, skip=skip, limit=per_page, search=search
+        decoded_token=token, limit=per_page, cursor=cursor, search=search, total=total
     )
     return RouteResponseSchemaExt[CategorySchema](
         data=[CategorySchema.model_validate(app) for app in data["data"]],
         success=True,
-        current_page=page,
-        page_size=per_page,
+        next_cursor=data["next_cursor"],
         total=data["total"],
         message="Success",
     )
@@ -138,6 +134,22 @@ async def get_user(_id: UUID, service: UserService = Depends(user_service)):
     )
 
 
+@router.post(
+    "/libry/batch",
+    response_model=RouteResponseSchema[UserLibryChangesSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def update_user_libry(
+    request: UpdateUserLibrySchema,
+    token: dict[str, str] = Depends(verify_token),
+    service: UserService = Depends(user_service),
+):
+    data = await service.update_user_libry(token, request)
+    return RouteResponseSchema[UserLibryChangesSchema](
+        data=data, success=True, message="Libry updated"
+    )
+
+
 @router.post(
     "/libry/{app_id}/add",
     response_model=RouteResponseSchema[str],
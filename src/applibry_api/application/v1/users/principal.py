@@ -0,0 +1,60 @@
+from fastapi import Depends
+from sqlalchemy import event, inspect
+
+from applibry_api.application.v1.users.schema import UserSchema
+from applibry_api.application.v1.users.service import UserService, user_service
+from applibry_api.domain.entities.user import User
+from applibry_api.domain.exceptions.base_exception import AppAuthorizationException
+from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.cache.result_cache import MemoryResultCache
+from applibry_api.infrastructure.persistence.database import RoutingSession, verify_token
+
+# username -> UserSchema snapshot. Process-local, so another worker may serve
+# a profile up to PRINCIPAL_CACHE_TTL seconds old after a write.
+_principals = MemoryResultCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES, default_ttl=settings.PRINCIPAL_CACHE_TTL)
+_PRINCIPALS_NAMESPACE = "auth:principals"
+
+
+async def current_user(
+    token: dict[str, str] = Depends(verify_token),
+    service: UserService = Depends(user_service),
+) -> UserSchema:
+    """The authenticated user, loaded at most once per request.
+
+    FastAPI resolves a dependency once per request, and the snapshot is then
+    reused across requests for PRINCIPAL_CACHE_TTL seconds.
+    """
+    username = token.get("sub")
+    if username is None:
+        raise AppAuthorizationException("Could not validate credentials")
+
+    principal = await _principals.get(_PRINCIPALS_NAMESPACE, username)
+    if principal is None:
+        principal = UserSchema.model_validate(await service.get_current_user(token))
+        await _principals.set(_PRINCIPALS_NAMESPACE, username, principal)
+    return principal
+
+
+def _usernames(user: User) -> set[str]:
+    # Old and new value, so a rename also evicts the entry under the old name
+    history = inspect(user).attrs.username.history
+    return {name for name in (user.username, *history.deleted) if name}
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _collect_user_writes(session, flush_context):
+    users = [obj for obj in (*session.new, *session.dirty, *session.deleted) if isinstance(obj, User)]
+    if users:
+        session.info.setdefault("written_usernames", set()).update(*(_usernames(user) for user in users))
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _evict_written_users(session):
+    for username in session.info.pop("written_usernames", ()):
+        _principals.discard(_PRINCIPALS_NAMESPACE, username)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_user_writes(session):
+    session.info.pop("written_usernames", None)
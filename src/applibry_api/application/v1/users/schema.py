@@ -69,6 +69,17 @@ class UpdateUserProfileSchema(BaseModel):
     profession: Optional[str]
     country: Optional[str]
 
+
+class UpdateUserLibrySchema(BaseModel):
+    add: list[uuid.UUID] = []
+    remove: list[uuid.UUID] = []
+
+
+class UserLibryChangesSchema(BaseModel):
+    # Only the apps whose membership actually changed
+    added: list[uuid.UUID]
+    removed: list[uuid.UUID]
+
 # class UserResponseSchemaExt(BaseModel):
 #     data: Optional[list[UserSchema]]
 #     current_page: int = 0
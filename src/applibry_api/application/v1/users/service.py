@@ -3,15 +3,18 @@ from uuid import UUID
 
 from fastapi import Depends
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy import and_, delete, func, literal, select, update
+from sqlalchemy import and_, delete, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from applibry_api.application.v1.users.schema import (
     CreateUserSchema,
     InviteUserSchema,
+    UpdateUserLibrySchema,
     UpdateUserProfileSchema,
     UpdateUserSchema,
+    UserLibryChangesSchema,
 )
+from applibry_api.domain.entities.user_app import user_apps
 from applibry_api.domain.entities.user_category import user_categories
 from applibry_api.domain.entities.app import App
 from applibry_api.domain.entities.category import Category
@@ -21,26 +24,35 @@ from applibry_api.domain.exceptions.base_exception import (
     AppBadRequestException,
     AppNotFoundException,
 )
+from applibry_api.infrastructure.persistence.counters import (
+    APP_SUBSCRIBERS,
+    CATEGORY_SUBSCRIBERS,
+    record_delta,
+    record_deltas,
+)
 from applibry_api.infrastructure.persistence.database import get_db
+from applibry_api.infrastructure.persistence.pagination import TotalMode, paginate
 
 
 class UserService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_users(self, skip: int, limit: int, search: Optional[str] = None):
+    async def get_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        total: TotalMode = "estimated",
+    ):
         stmt = select(User)
         if search:
             stmt = stmt.filter(User.email.ilike(f"%{search}%"))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
-
-        data_stmt = stmt.order_by(User.last_name).offset(skip).limit(limit)
-        data_result = await self.db.execute(data_stmt)
-        data = data_result.scalars().all()
-        return {"total": total, "data": data}
+        return await paginate(
+            self.db, stmt, User.email, User.id, limit, cursor, total,
+            estimate_table=None if search else User.__tablename__,
+        )
 
     async def get_users_lookup(self):
         stmt = select(User).filter(and_(User.is_deleted == False, User.is_active == True))
@@ -72,38 +84,70 @@ class UserService:
         await self.db.refresh(entity)
         return entity
 
-    async def add_to_user_libry(self, decoded_token: dict[str, str], app_id: UUID):
-        user = await self.get_user(decoded_token["sid"])
-        result = await self.db.execute(select(App).filter(App.id == app_id))
-        app = result.scalar_one_or_none()
+    async def _add_apps(self, user_id: str, app_ids: list[UUID]) -> list[UUID]:
+        """Subscribes to every existing app in ``app_ids`` in one statement; returns the ones that were new."""
+        rows = select(literal(UUID(user_id)).label("user_id"), App.id.label("app_id")).where(App.id.in_(app_ids))
+        result = await self.db.execute(
+            insert(user_apps)
+            .from_select(["user_id", "app_id"], rows)
+            .on_conflict_do_nothing(index_elements=[user_apps.c.user_id, user_apps.c.app_id])
+            .returning(user_apps.c.app_id)
+        )
+        added = list(result.scalars().all())
+        await record_deltas(self.db, APP_SUBSCRIBERS, {app_id: 1 for app_id in added})
+        return added
+
+    async def _remove_apps(self, user_id: str, app_ids: list[UUID]) -> list[UUID]:
+        result = await self.db.execute(
+            delete(user_apps)
+            .where(user_apps.c.user_id == user_id, user_apps.c.app_id.in_(app_ids))
+            .returning(user_apps.c.app_id)
+        )
+        removed = list(result.scalars().all())
+        # The compactor floors the total at 0
+        await record_deltas(self.db, APP_SUBSCRIBERS, {app_id: -1 for app_id in removed})
+        return removed
 
-        if not app:
-            raise AppNotFoundException("App not found")
-        if app in user.apps:
-            raise AppBadRequestException("App already in preference")
+    async def _app_exists(self, app_id: UUID) -> bool:
+        exists_stmt = select(literal(True)).select_from(App).where(App.id == app_id).limit(1)
+        return bool((await self.db.execute(exists_stmt)).scalar())
+
+    async def add_to_user_libry(self, decoded_token: dict[str, str], app_id: UUID):
+        if not await self._add_apps(decoded_token["sid"], [app_id]):
+            # Nothing inserted: tell a missing app from one already in the libry
+            if not await self._app_exists(app_id):
+                raise AppNotFoundException("App not found")
+            raise AppBadRequestException("App already in libry")
 
-        user.apps.append(app)
-        app.subscribers += 1
         await self.db.commit()
         return {"message": "App successfully added", "app_id": str(app_id)}
 
     async def remove_from_user_libry(
         self, decoded_token: dict[str, str], app_id: UUID
     ):
-        user = await self.get_user(decoded_token["sid"])
-        result = await self.db.execute(select(App).filter(App.id == app_id))
-        app = result.scalar_one_or_none()
+        if not await self._remove_apps(decoded_token["sid"], [app_id]):
+            if not await self._app_exists(app_id):
+                raise AppNotFoundException("App not found")
+            raise AppBadRequestException("App not in libry")
 
-        if not app:
-            raise AppNotFoundException("App not found")
-        if app not in user.apps:
-            raise AppBadRequestException("App not in preference")
-
-        user.apps.remove(app)
-        app.subscribers -= 1
         await self.db.commit()
         return {"message": "App successfully removed", "app_id": str(app_id)}
 
+    async def update_user_libry(self, decoded_token: dict[str, str], data: UpdateUserLibrySchema):
+        """Adds and removes many apps in one transaction, one statement each way.
+
+        Unknown apps, apps already present and apps not in the libry are
+        skipped rather than failing the batch.
+        """
+        if set(data.add) & set(data.remove):
+            raise AppBadRequestException("An app cannot be both added and removed")
+
+        user_id = decoded_token["sid"]
+        added = await self._add_apps(user_id, data.add) if data.add else []
+        removed = await self._remove_apps(user_id, data.remove) if data.remove else []
+        await self.db.commit()
+        return UserLibryChangesSchema(added=added, removed=removed)
+
     async def add_to_user_preference(self, decoded_token: dict[str, str], category_id: UUID):
         user_id = decoded_token["sid"]
 
@@ -122,12 +166,8 @@ class UserService:
         if res.rowcount == 0:
             raise AppBadRequestException("Preference already added")
 
-        # Atomic counter increment
-        await self.db.execute(
-            update(Category)
-            .where(Category.id == category_id)
-            .values(subscribers=Category.__table__.c.subscribers + 1)
-        )
+        # Counter delta, rolled up by the compactor so hot categories don't serialise on one row
+        await record_delta(self.db, CATEGORY_SUBSCRIBERS, category_id, 1)
         await self.db.commit()
         return {"message": "Preference successfully added", "category_id": str(category_id)}
 
@@ -147,12 +187,8 @@ class UserService:
         if del_res.rowcount == 0:
             raise AppBadRequestException("Category not in preference")
 
-        # Atomic counter decrement (floor at 0)
-        await self.db.execute(
-            update(Category)
-            .where(Category.id == category_id, Category.subscribers > 0)
-            .values(subscribers=Category.__table__.c.subscribers - 1)
-        )
+        # Counter delta (the compactor floors the total at 0)
+        await record_delta(self.db, CATEGORY_SUBSCRIBERS, category_id, -1)
         await self.db.commit()
         return {"message": "Preference successfully removed", "category_id": str(category_id)}
 
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Text, UUID, ForeignKey, Float, Integer, Boolean, TIMESTAMP, Enum
+from sqlalchemy import Column, String, Text, UUID, ForeignKey, Float, Integer, Boolean, TIMESTAMP, Enum, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
 
 from applibry_api.domain.enums.app_status import AppStatus
@@ -24,6 +25,7 @@ class App(RootModel):
     meta_description = Column(Text, nullable=True)
     meta_keywords = Column(String(255), nullable=True)
     status = Column(Enum(AppStatus), default=AppStatus.DRAFT)
+    search_vector = Column(TSVECTOR, nullable=True)  # Maintained by AppService, see apps/search.py
 
     published_at = Column(TIMESTAMP)
 
@@ -51,3 +53,18 @@ class App(RootModel):
     tags = relationship('Tag', secondary=app_tags, back_populates='apps')
     platforms = relationship('Platform', secondary=app_platforms, back_populates='apps')
     users = relationship('User', secondary=user_apps, back_populates='apps')
+
+
+# Full-text and trigram indexes backing AppService search
+Index("ix_apps_search_vector", App.search_vector, postgresql_using="gin")
+Index("ix_apps_name_trgm", App.name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"})
+
+# Category listings page by name; trending is a small, hot subset served by a partial index
+Index("ix_apps_category_id_name", App.category_id, App.name)
+Index(
+    "ix_apps_trending_name", App.name,
+    postgresql_where=App.trending.is_(True) & App.is_deleted.is_not(True),
+)
+
+# allocate_slug's "slug LIKE 'base-%'" scan; the unique index cannot serve LIKE under a non-C collation
+Index("ix_apps_slug_pattern", App.slug, postgresql_ops={"slug": "text_pattern_ops"})
@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Column, UUID, ForeignKey, Table, TIMESTAMP
+from sqlalchemy import Column, UUID, ForeignKey, Index, Table, TIMESTAMP
 
 from applibry_api.infrastructure.persistence.database import Base
 
@@ -8,3 +8,7 @@ app_platforms = Table('app_platforms', Base.metadata,
         Column('app_id', UUID, ForeignKey('apps.id', use_alter=True)),
         Column('platform_id', UUID, ForeignKey('platforms.id', use_alter=True)),
         Column('created_at', TIMESTAMP, default=datetime.datetime.utcnow))
+
+# The app projection aggregates by app_id; platform deletes look rows up by platform_id
+Index("ix_app_platforms_app_id_platform_id", app_platforms.c.app_id, app_platforms.c.platform_id)
+Index("ix_app_platforms_platform_id", app_platforms.c.platform_id)
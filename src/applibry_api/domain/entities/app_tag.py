@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Column, UUID, ForeignKey, Table, TIMESTAMP
+from sqlalchemy import Column, UUID, ForeignKey, Index, Table, TIMESTAMP
 
 from applibry_api.infrastructure.persistence.database import Base
 
@@ -8,3 +8,7 @@ app_tags = Table('app_tags', Base.metadata,
         Column('app_id', UUID, ForeignKey('apps.id', use_alter=True)),
         Column('tag_id', UUID, ForeignKey('tags.id', use_alter=True)),
         Column('created_at', TIMESTAMP, default=datetime.datetime.utcnow))
+
+# The app projection aggregates by app_id; tag renames and deletes look rows up by tag_id
+Index("ix_app_tags_app_id_tag_id", app_tags.c.app_id, app_tags.c.tag_id)
+Index("ix_app_tags_tag_id", app_tags.c.tag_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Text
+from sqlalchemy import Column, Index, String, Integer, Text
 from sqlalchemy.orm import relationship
 
 from applibry_api.domain.entities.root import RootModel
@@ -15,3 +15,7 @@ class Category(RootModel):
     subscribers = Column(Integer, default=0)
 
     users = relationship('User', secondary=user_categories, back_populates='categories')
+
+
+# For allocate_slug's prefix LIKE scan, like ix_apps_slug_pattern
+Index("ix_categories_slug_pattern", Category.slug, postgresql_ops={"slug": "text_pattern_ops"})
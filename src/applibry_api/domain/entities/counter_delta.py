@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, Identity, Index, Integer, String, Table, TIMESTAMP, UUID, func
+
+from applibry_api.infrastructure.persistence.database import Base
+
+# Append-only log of engagement counter changes (apps.subscribers, categories.app_count, ...).
+# Writers insert deltas instead of updating hot rows; the compactor in
+# infrastructure/persistence/counters.py rolls them up into the denormalised columns.
+counter_deltas = Table(
+    "counter_deltas", Base.metadata,
+    Column("id", BigInteger, Identity(), primary_key=True),
+    Column("counter", String(50), nullable=False),
+    Column("entity_id", UUID(as_uuid=True), nullable=False),
+    Column("delta", Integer, nullable=False),
+    Column("created_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+)
+
+Index("ix_counter_deltas_counter_entity_id", counter_deltas.c.counter, counter_deltas.c.entity_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Column, String, Text, ForeignKey, Enum
+from sqlalchemy import UUID, Column, Index, String, Text, ForeignKey, Enum
 from sqlalchemy.orm import relationship
 
 from applibry_api.domain.enums.modules import Modules
@@ -14,3 +14,7 @@ class Permission(RootModel):
     module = Column(Enum(Modules), default=Modules.CORE)
 
     roles = relationship('Role', secondary=role_permissions, back_populates='permissions')
+
+
+# For allocate_slug's prefix LIKE scan on code
+Index("ix_permissions_code_pattern", Permission.code, postgresql_ops={"code": "text_pattern_ops"})
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean
+from sqlalchemy import Boolean, Column, Index, String, Text
 from sqlalchemy.orm import relationship
 
 from applibry_api.domain.entities.role_permission import role_permissions
@@ -13,3 +13,7 @@ class Role(RootModel):
     is_system_role = Column(Boolean, default=False)
 
     permissions = relationship('Permission', secondary=role_permissions, back_populates='roles')
+
+
+# For allocate_slug's prefix LIKE scan on code
+Index("ix_roles_code_pattern", Role.code, postgresql_ops={"code": "text_pattern_ops"})
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, TIMESTAMP, UUID, Boolean, Integer, ForeignKey, Enum
+from sqlalchemy import Column, String, TIMESTAMP, UUID, Boolean, Integer, ForeignKey, Enum, Index, func
 from sqlalchemy.orm import relationship
 
 from applibry_api.domain.enums.account_type import AccountType
@@ -43,3 +43,11 @@ class User(RootModel):
 
     apps = relationship('App', secondary=user_apps, back_populates='users')
     categories = relationship('Category', secondary=user_categories, back_populates='users')
+
+
+# Case-insensitive login/registration lookups and the admin email search
+Index("ix_users_lower_email", func.lower(User.email))
+Index("ix_users_lower_username", func.lower(User.username))
+Index("ix_users_email_trgm", User.email, postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"})
+# Foreign key check when a role is deleted
+Index("ix_users_role_id", User.role_id)
@@ -1,10 +1,17 @@
 import datetime
 
-from sqlalchemy import Column, UUID, ForeignKey, Table, DateTime, TIMESTAMP
+from sqlalchemy import Column, UUID, ForeignKey, Index, PrimaryKeyConstraint, Table, DateTime, TIMESTAMP, func
 
 from applibry_api.infrastructure.persistence.database import Base
 
 user_apps = Table('user_apps', Base.metadata,
-      Column('user_id', UUID, ForeignKey('users.id', use_alter=True)),
-      Column('app_id', UUID, ForeignKey('apps.id', use_alter=True)),
-      Column('created_at', TIMESTAMP, default=datetime.datetime.utcnow))
+      Column('user_id', UUID, ForeignKey('users.id', use_alter=True), nullable=False),
+      Column('app_id', UUID, ForeignKey('apps.id', use_alter=True), nullable=False),
+      Column('created_at', TIMESTAMP, nullable=False, default=datetime.datetime.utcnow, server_default=func.now()),
+      # One row per membership; the ON CONFLICT target of UserService library writes
+      PrimaryKeyConstraint('user_id', 'app_id', name='pk_user_apps'))
+
+# Covers the library listing: newest subscriptions first, app_id as tie-breaker
+Index("ix_user_apps_user_id_created_at_app_id", user_apps.c.user_id, user_apps.c.created_at.desc(), user_apps.c.app_id)
+# "Not yet subscribed" anti-join in AppService.get_apps probes by app first
+Index("ix_user_apps_app_id_user_id", user_apps.c.app_id, user_apps.c.user_id)
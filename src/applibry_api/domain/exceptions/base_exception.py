@@ -37,3 +37,11 @@ class AppAuthorizationException(AppBaseException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=msg
         )
+
+
+class AppTooManyRequestsException(AppBaseException):
+    def __init__(self, msg: str):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=msg
+        )
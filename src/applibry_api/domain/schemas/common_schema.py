@@ -39,6 +39,7 @@ class RouteResponseSchemaExt(BaseModel, Generic[T]):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
     data: Optional[list[T]] = None
     next_cursor: Optional[str] = None
+    total: Optional[int] = None
     success: bool = True
     message: str = ""
     status_code: int = 200
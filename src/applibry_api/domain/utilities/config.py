@@ -9,18 +9,43 @@ from pathlib import Path
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = config("DATABASE_URL", default="")
+    DATABASE_READ_URL: str = config("DATABASE_READ_URL", default="")  # replica, empty reads from the primary
+    READ_YOUR_WRITES_WINDOW: int = config("READ_YOUR_WRITES_WINDOW", default=5, cast=int)  # seconds on the primary after a write
+    # uvicorn | lambda | batch; see POOL_PROFILES in persistence/database.py
+    DB_POOL_PROFILE: str = config(
+        "DB_POOL_PROFILE", default="lambda" if config("AWS_LAMBDA_FUNCTION_NAME", default="") else "uvicorn")
+    DB_POOL_SIZE: Optional[int] = config(
+        "DB_POOL_SIZE", default="", cast=lambda v: int(v) if v else None)  # overrides the profile
+    DB_MAX_OVERFLOW: Optional[int] = config(
+        "DB_MAX_OVERFLOW", default="", cast=lambda v: int(v) if v else None)  # overrides the profile
+    DB_ECHO: bool = config("DB_ECHO", default=not config("IS_PROD", default=True, cast=bool), cast=bool)
+    DB_STATEMENT_CACHE_SIZE: int = config(
+        "DB_STATEMENT_CACHE_SIZE", default=100, cast=int)  # asyncpg prepared statements, 0 behind pgbouncer
+    DB_STATEMENT_TIMEOUT_MS: int = config("DB_STATEMENT_TIMEOUT_MS", default=30000, cast=int)  # 0 disables
 
     # Environment
     IS_PROD: bool = config("IS_PROD", default=True, cast=bool)
     BASE_DOMAIN: str = config("BASE_DOMAIN", default="phareztech.com")
+    # Set by the AWS Lambda runtime
+    IS_LAMBDA: bool = bool(config("AWS_LAMBDA_FUNCTION_NAME", default=""))
 
     # Security
     SECRET_KEY: str = config("SECRET_KEY", default="your-secret-key-here")
-    ALGORITHM: str = config("ALGORITHM", default="HS256")
+    ALGORITHM: str = config("ALGORITHM", default="HS256")  # of SECRET_KEY, the legacy (kid-less) key
+    # Key ring: <kid>.pem signing keys and <kid>.pub.pem retired public keys; empty signs with SECRET_KEY
+    JWT_KEYS_DIR: str = config("JWT_KEYS_DIR", default="")
+    JWT_ACTIVE_KID: str = config("JWT_ACTIVE_KID", default="")  # empty uses the last signing key by name
+    JWT_RSA_ALGORITHM: str = config("JWT_RSA_ALGORITHM", default="RS256")  # RS* or PS* for RSA keys
+    JWT_LEGACY_HMAC: bool = config(
+        "JWT_LEGACY_HMAC", default=not config("JWT_KEYS_DIR", default=""), cast=bool)  # still accept kid-less HS tokens
+    JWKS_MAX_AGE: int = config("JWKS_MAX_AGE", default=300, cast=int)  # seconds edge caches may keep the JWKS
     ACCESS_TOKEN_EXPIRES_IN_MINS: int = config(
         "ACCESS_TOKEN_EXPIRES_IN_MINS", default=30, cast=int)
     REFRESH_TOKEN_EXPIRES_IN_MINS: int = config(
         "REFRESH_TOKEN_EXPIRES_IN_MINS", default=60 * 24 * 7, cast=int)  # 7 days
+    TOKEN_CACHE_MAX_ENTRIES: int = config("TOKEN_CACHE_MAX_ENTRIES", default=4096, cast=int)  # verified claims, 0 disables
+    PRINCIPAL_CACHE_TTL: int = config("PRINCIPAL_CACHE_TTL", default=30, cast=int)  # seconds, 0 disables
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = config("PRINCIPAL_CACHE_MAX_ENTRIES", default=1024, cast=int)
 
     # AWS
     AWS__BUCKET_NAME: str = config("AWS__BUCKET_NAME", default="")
@@ -38,6 +63,15 @@ class Settings(BaseSettings):
     NATTYPAD_BASE_URL: str = config("NATTYPAD_BASE_URL", default="")
     NATTYPAD_CLIENT_ID: str = config("NATTYPAD_CLIENT_ID", default="")
     NATTYPAD_CLIENT_SECRET: str = config("NATTYPAD_CLIENT_SECRET", default="")
+    NATTYPAD_HTTP2: bool = config("NATTYPAD_HTTP2", default=True, cast=bool)
+    NATTYPAD_MAX_CONNECTIONS: int = config("NATTYPAD_MAX_CONNECTIONS", default=20, cast=int)
+    NATTYPAD_MAX_KEEPALIVE_CONNECTIONS: int = config(
+        "NATTYPAD_MAX_KEEPALIVE_CONNECTIONS", default=10, cast=int)
+    NATTYPAD_KEEPALIVE_EXPIRY: float = config("NATTYPAD_KEEPALIVE_EXPIRY", default=30.0, cast=float)  # seconds
+    NATTYPAD_CONNECT_TIMEOUT: float = config("NATTYPAD_CONNECT_TIMEOUT", default=5.0, cast=float)  # seconds
+    NATTYPAD_CACHE_FRESH_TTL: int = config("NATTYPAD_CACHE_FRESH_TTL", default=300, cast=int)  # seconds
+    NATTYPAD_CACHE_STALE_TTL: int = config("NATTYPAD_CACHE_STALE_TTL", default=3600, cast=int)  # seconds
+    NATTYPAD_CACHE_MAX_ENTRIES: int = config("NATTYPAD_CACHE_MAX_ENTRIES", default=512, cast=int)
 
     # Frontend
     FRONTEND_URL: str = config("FRONTEND_URL", default="http://localhost:3000")
@@ -48,6 +82,11 @@ class Settings(BaseSettings):
     VERIFICATION_TOKEN_EXPIRE_HOURS: int = config(
         "VERIFICATION_TOKEN_EXPIRE_HOURS", default=24, cast=int)
 
+    # Password Hashing
+    PASSWORD_HASH_EXECUTOR: str = config("PASSWORD_HASH_EXECUTOR", default="thread")  # thread | process
+    PASSWORD_HASH_WORKERS: int = config("PASSWORD_HASH_WORKERS", default=2, cast=int)
+    PASSWORD_HASH_MAX_PENDING: int = config("PASSWORD_HASH_MAX_PENDING", default=32, cast=int)
+
     # File Upload
     MAX_FILE_SIZE: int = config(
         "MAX_FILE_SIZE", default=5242880, cast=int)  # 5MB
@@ -55,6 +94,26 @@ class Settings(BaseSettings):
         "ALLOWED_EXTENSIONS", default="jpg,jpeg,png,pdf", cast=lambda v: [s.strip() for s in v.split(',')])
 
 
+    # Result Cache
+    RESULT_CACHE_URL: str = config("RESULT_CACHE_URL", default="memory://")
+    RESULT_CACHE_TTL: int = config("RESULT_CACHE_TTL", default=300, cast=int)  # seconds
+    RESULT_CACHE_MAX_ENTRIES: int = config("RESULT_CACHE_MAX_ENTRIES", default=1024, cast=int)
+
+    # Engagement counters
+    COUNTER_COMPACTOR_INTERVAL: int = config("COUNTER_COMPACTOR_INTERVAL", default=30, cast=int)  # seconds, 0 disables
+
+    # Pagination
+    PAGINATION_EXACT_COUNT_BELOW: int = config("PAGINATION_EXACT_COUNT_BELOW", default=5000, cast=int)  # rows; smaller tables are counted exactly
+
+    # App export
+    EXPORT_BATCH_SIZE: int = config("EXPORT_BATCH_SIZE", default=1000, cast=int)  # rows per server-side cursor fetch
+
+    # App import
+    IMPORT_BATCH_SIZE: int = config("IMPORT_BATCH_SIZE", default=500, cast=int)  # keep rows x columns under asyncpg's 32767 parameters
+
+    # Analytics
+    ANALYTICS_CACHE_TTL: int = config("ANALYTICS_CACHE_TTL", default=30, cast=int)  # seconds, 0 disables
+
     # Rate Limiting Configuration
     RATE_LIMIT_ENABLED: bool = config(
         "RATE_LIMIT_ENABLED", default=True, cast=bool)
@@ -1,13 +1,21 @@
+import asyncio
 import base64
 import secrets
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
 from passlib.context import CryptContext
 
+from applibry_api.domain.exceptions.base_exception import AppTooManyRequestsException
+from applibry_api.domain.utilities.config import settings
+
 bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+_hash_executor: Executor | None = None
+_pending_hashes = 0
+
 def generate_key_pair():
     # Generate the private key
     private_key = rsa.generate_private_key(
@@ -46,3 +54,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     except Exception:
         return False
 
+
+def _get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+        else:
+            # bcrypt releases the GIL while hashing, so threads scale across cores
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+            )
+    return _hash_executor
+
+
+async def _run_hasher(func, *args):
+    global _pending_hashes
+    if _pending_hashes >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise AppTooManyRequestsException("Too many authentication requests, please try again shortly")
+
+    _pending_hashes += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        _pending_hashes -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hasher(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hasher(verify_password, plain_password, hashed_password)
@@ -1,24 +1,41 @@
+import asyncio
 import imghdr
 import os
 
 import base64
-import io
+import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
 
-import boto3
 from decouple import config
 from fastapi import APIRouter, HTTPException
 
-# Initialize Boto3 S3 Client
-s3_client = boto3.client(
-    "s3",
-    region_name=config("AWS__REGION"),
-    aws_access_key_id=config("AWS__ACCESS_KEY"),
-    aws_secret_access_key=config("AWS__SECRET_KEY"),
-)
 AWS_BUCKET_NAME = config("AWS__BUCKET_NAME")
 AWS_REGION = config("AWS__REGION")
 
+# boto3 is blocking, so uploads run on a dedicated, bounded thread pool
+S3_UPLOAD_CONCURRENCY = config("S3_UPLOAD_CONCURRENCY", default=4, cast=int)
+BASE64_CHUNK_SIZE = 64 * 1024  # Multiple of 4 so every chunk decodes on its own
+UPLOAD_SPOOL_MAX_SIZE = 1024 * 1024  # Larger payloads spill to a temporary file
+
+_upload_executor = ThreadPoolExecutor(max_workers=S3_UPLOAD_CONCURRENCY, thread_name_prefix="s3-upload")
+_upload_slots = asyncio.Semaphore(S3_UPLOAD_CONCURRENCY)
+
+@lru_cache(maxsize=None)
+def get_s3_client():
+    """Boto3 S3 client, built on first upload; importing boto3 is a large share of cold-start time."""
+    import boto3
+
+    return boto3.client(
+        "s3",
+        region_name=config("AWS__REGION"),
+        aws_access_key_id=config("AWS__ACCESS_KEY"),
+        aws_secret_access_key=config("AWS__SECRET_KEY"),
+    )
+
+
 def save_file(filename: str, content: bytes, upload_dir: str = "uploads") -> str:
     os.makedirs(upload_dir, exist_ok=True)  # Ensure the directory exists
     file_path = os.path.join(upload_dir, filename)
@@ -27,15 +44,27 @@ def save_file(filename: str, content: bytes, upload_dir: str = "uploads") -> str
     return file_path
 
 
-async def upload_to_s3(image_base64: str):
-    try:
-        # Decode Base64 string
-        base64_data = clean_base64(image_base64)
-        image_data = base64.b64decode(base64_data)
-        image_stream = io.BytesIO(image_data)
+def _decode_base64_to_stream(data: str, chunk_size: int = BASE64_CHUNK_SIZE):
+    """Decodes a (data URL or raw) Base64 string chunk by chunk into a spooled file."""
+    stream = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+    start = data.find(",", 0, 256) + 1  # Skip a "data:image/png;base64," prefix without copying
+    carry = ""
+    for offset in range(start, len(data), chunk_size):
+        chunk = carry + "".join(data[offset:offset + chunk_size].split())
+        usable = len(chunk) - len(chunk) % 4
+        stream.write(base64.b64decode(chunk[:usable]))
+        carry = chunk[usable:]
+    if carry:
+        stream.write(base64.b64decode(carry + "=" * (-len(carry) % 4)))
+    stream.seek(0)
+    return stream
 
+
+def _upload_image(image_base64: str) -> str:
+    with _decode_base64_to_stream(image_base64) as image_stream:
         # Detect file format
-        file_format = imghdr.what(None, h=image_data)
+        file_format = imghdr.what(None, h=image_stream.read(32))
+        image_stream.seek(0)
 
         if file_format not in ["jpeg", "png", "gif", "bmp", "webp"]:
             raise HTTPException(status_code=400, detail="Unsupported image format")
@@ -45,22 +74,38 @@ async def upload_to_s3(image_base64: str):
         file_name = f"{uuid.uuid4()}.{file_extension}"
 
         # Upload to S3
-        s3_client.upload_fileobj(
+        get_s3_client().upload_fileobj(
             image_stream,
             AWS_BUCKET_NAME,
             file_name,
             ExtraArgs={"ContentType": f"image/{file_extension}"},
         )
 
-        # Generate S3 URL
-        s3_url = f"https://{AWS_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{file_name}"
+    # Generate S3 URL
+    return f"https://{AWS_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{file_name}"
 
-        return s3_url
 
+async def upload_to_s3(image_base64: str):
+    """Decodes and uploads on the bounded upload pool so the event loop keeps serving requests."""
+    try:
+        async with _upload_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_upload_executor, _upload_image, image_base64)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error uploading image: {str(e)}")
 
 
+async def upload_images_to_s3(*images: Optional[str]) -> list[Optional[str]]:
+    """Uploads several images concurrently; empty entries are passed through as None."""
+
+    async def upload(image: Optional[str]) -> Optional[str]:
+        return await upload_to_s3(image) if image else None
+
+    return list(await asyncio.gather(*(upload(image) for image in images)))
+
+
 def clean_base64(data: str) -> str:
     """Splits the string by ',' and returns the Base64 part if a prefix exists."""
     parts = data.split(",", 1)  # Split only at the first comma
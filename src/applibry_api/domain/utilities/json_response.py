@@ -0,0 +1,47 @@
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, stdlib json is used without it
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: orjson when installed, otherwise Starlette's stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp) -> TypeAdapter:
+    """One TypeAdapter per type, e.g. ``list[AppSchema]`` or ``RouteResponseSchemaExt[AppSchema]``.
+
+    Building an adapter compiles a pydantic-core schema, so it must not happen per request.
+    """
+    return TypeAdapter(tp)
+
+
+def validate_list(tp, items) -> list:
+    """Validates a whole page in one pydantic-core call instead of a model_validate per item."""
+    return type_adapter(list[tp]).validate_python(items, from_attributes=True)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Renders an already validated response model straight to JSON bytes.
+
+    Returning a Response makes FastAPI skip the response_model round trip
+    (re-validation plus jsonable_encoder); response_model stays on the route
+    for the OpenAPI schema only.
+    """
+    return Response(
+        content=type_adapter(type(model)).dump_json(model),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,32 +1,158 @@
+import functools
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from decouple import config
-from jose import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
-from applibry_api.domain.entities.user import User
+from applibry_api.domain.utilities.config import settings
 
+if TYPE_CHECKING:
+    from applibry_api.domain.entities.user import User
 
-def generate_token(data: User, expires_delta: timedelta, _type: str = "access"):
-    encode = {
+_EC_ALGORITHMS = {"secp256r1": "ES256", "secp384r1": "ES384", "secp521r1": "ES512"}
+
+
+@dataclass(frozen=True)
+class RingKey:
+    """One parsed key of the ring; ``signing_key`` is None for retired, verify-only keys."""
+    kid: Optional[str]
+    algorithm: str
+    verifying_key: Key
+    signing_key: Optional[Key] = None
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm.startswith("HS")
+
+    def public_jwk(self) -> dict:
+        return {**self.verifying_key.to_dict(), "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+class KeyRing:
+    """Signs with the active key and verifies with whichever key a token's ``kid`` names.
+
+    Tokens without a ``kid`` were minted before the ring existed and are
+    checked against the legacy SECRET_KEY/ALGORITHM key, if one is allowed.
+    """
+
+    def __init__(self, keys: list[RingKey], active_kid: Optional[str] = None, legacy: Optional[RingKey] = None):
+        self.keys = {key.kid: key for key in keys}
+        self.legacy = legacy
+        self.active = self.keys[active_kid] if active_kid else legacy
+        if self.active is None or self.active.signing_key is None:
+            raise ValueError(f"No private key to sign with (active kid: {active_kid or 'legacy'})")
+
+    def get(self, kid: Optional[str]) -> RingKey:
+        # The header is attacker-controlled; a list or object kid must not reach the dict lookup
+        if kid is not None and not isinstance(kid, str):
+            raise JWTError("Invalid key id")
+        key = self.legacy if kid is None else self.keys.get(kid)
+        if key is None:
+            raise JWTError("Unknown signing key")
+        return key
+
+    def encode(self, claims: dict) -> str:
+        key = self.active
+        headers = {"kid": key.kid} if key.kid else None
+        return jwt.encode(claims, key.signing_key, algorithm=key.algorithm, headers=headers)
+
+    def decode(self, token: str) -> dict:
+        key = self.get(jwt.get_unverified_header(token).get("kid"))
+        # Only the algorithm of the key the token names, so an RSA public key can never be used as an HMAC secret
+        return jwt.decode(token, key.verifying_key, algorithms=[key.algorithm])
+
+    def jwks(self) -> dict:
+        return {"keys": [key.public_jwk() for key in self.keys.values() if not key.is_symmetric]}
+
+
+def _algorithm_for(key) -> str:
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return settings.JWT_RSA_ALGORITHM
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        if key.curve.name not in _EC_ALGORITHMS:
+            raise ValueError(f"Unsupported EC curve: {key.curve.name}")
+        return _EC_ALGORITHMS[key.curve.name]
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey, ed448.Ed448PrivateKey, ed448.Ed448PublicKey)):
+        raise ValueError("EdDSA keys are not supported by python-jose; use an RSA or EC key")
+    raise ValueError(f"Unsupported key type: {type(key).__name__}")
+
+
+def load_pem_key(kid: str, pem: bytes) -> RingKey:
+    """A ring key from a PEM private key, or a public key for verify-only use."""
+    if b"PRIVATE KEY" in pem:
+        private_key = serialization.load_pem_private_key(pem, password=None)
+        algorithm = _algorithm_for(private_key)
+        signing_key = jwk.construct(pem, algorithm)
+        return RingKey(kid, algorithm, signing_key.public_key(), signing_key)
+
+    algorithm = _algorithm_for(serialization.load_pem_public_key(pem))
+    return RingKey(kid, algorithm, jwk.construct(pem, algorithm))
+
+
+def hmac_key(secret: str, algorithm: str, kid: Optional[str] = None) -> RingKey:
+    key = jwk.construct(secret, algorithm)
+    return RingKey(kid, algorithm, key, key)
+
+
+@functools.lru_cache(maxsize=1)
+def key_ring() -> KeyRing:
+    """Parsed once per process; call ``key_ring.cache_clear()`` after rotating keys.
+
+    JWT_KEYS_DIR holds ``<kid>.pem`` private keys and ``<kid>.pub.pem``
+    public keys of retired signers. Without it tokens are signed with
+    SECRET_KEY/ALGORITHM as before; with it, kid-less tokens are only
+    accepted while JWT_LEGACY_HMAC is explicitly enabled.
+    """
+    legacy = None
+    if settings.ALGORITHM.startswith("HS") and (settings.JWT_LEGACY_HMAC or not settings.JWT_KEYS_DIR):
+        legacy = hmac_key(settings.SECRET_KEY, settings.ALGORITHM)
+
+    if not settings.JWT_KEYS_DIR:
+        return KeyRing([], legacy=legacy)
+
+    keys = [
+        load_pem_key(path.name.removesuffix(".pem").removesuffix(".pub"), path.read_bytes())
+        for path in sorted(Path(settings.JWT_KEYS_DIR).glob("*.pem"))
+    ]
+    signers = [key.kid for key in keys if key.signing_key is not None]
+    return KeyRing(keys, settings.JWT_ACTIVE_KID or (signers[-1] if signers else None), legacy)
+
+
+def encode(claims: dict) -> str:
+    return key_ring().encode(claims)
+
+
+def decode(token: str) -> dict:
+    return key_ring().decode(token)
+
+
+def jwks() -> dict:
+    return key_ring().jwks()
+
+
+def generate_token(data: "User", expires_delta: timedelta, _type: str = "access"):
+    now = datetime.utcnow()
+    encode_claims = {
         "sub": data.username,
         "sid": str(data.id),
-        "exp": datetime.utcnow() + expires_delta,
-        "iat": datetime.utcnow(),
-        "nbf": datetime.utcnow(),
+        "exp": now + expires_delta,
+        "iat": now,
+        "nbf": now,
         "type": _type,
     }
-    return jwt.encode(encode, config("SECRET_KEY"), algorithm=config("ALGORITHM"))
+    return encode(encode_claims)
 
 
-def create_access_token(data: User):
-    access_token_expires = timedelta(
-        minutes=int(config("ACCESS_TOKEN_EXPIRES_IN_MINS"))
-    )
+def create_access_token(data: "User"):
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRES_IN_MINS)
     return generate_token(data, expires_delta=access_token_expires)
 
 
-def create_refresh_token(data: User):
-    refresh_token_expires = timedelta(
-        minutes=int(config("REFRESH_TOKEN_EXPIRES_IN_MINS"))
-    )
-    return generate_token(data, expires_delta=refresh_token_expires, _type="refresh") 
\ No newline at end of file
+def create_refresh_token(data: "User"):
+    refresh_token_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRES_IN_MINS)
+    return generate_token(data, expires_delta=refresh_token_expires, _type="refresh")
@@ -0,0 +1,18 @@
+from applibry_api.infrastructure.cache.result_cache import create_result_cache
+
+PUBLIC_APPS_NAMESPACE = "public:apps"
+PUBLIC_CATEGORIES_NAMESPACE = "public:categories"
+
+# Shared by the anonymous landing-page endpoints; invalidated by AppService and
+# CategoryService whenever an app or category they render changes.
+public_cache = create_result_cache()
+
+
+async def invalidate_public_apps():
+    await public_cache.invalidate(PUBLIC_APPS_NAMESPACE)
+    # Category cards show app_count, so they go stale with app changes too
+    await public_cache.invalidate(PUBLIC_CATEGORIES_NAMESPACE)
+
+
+async def invalidate_public_categories():
+    await public_cache.invalidate(PUBLIC_CATEGORIES_NAMESPACE)
@@ -0,0 +1,117 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+from applibry_api.domain.utilities.config import settings
+
+
+def cache_key(**parts: Any) -> str:
+    """Stable key from keyword parts, e.g. ``category=...|cursor=...|limit=20``."""
+    return "|".join(f"{name}={'' if value is None else value}" for name, value in sorted(parts.items()))
+
+
+class ResultCache(Protocol):
+    async def get(self, namespace: str, key: str) -> Optional[Any]: ...
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None: ...
+
+    async def invalidate(self, namespace: str) -> None: ...
+
+
+class MemoryResultCache:
+    """Process-local LRU cache with a per-entry TTL.
+
+    Values are stored as-is, so callers should cache immutable,
+    JSON-compatible payloads (e.g. ``model_dump(mode="json")`` output).
+    A ttl of 0 stores nothing.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[(namespace, key)]
+            return None
+
+        self._entries.move_to_end((namespace, key))
+        return value
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        expires_at = time.monotonic() + ttl
+        self._entries[(namespace, key)] = (expires_at, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, namespace: str) -> None:
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == namespace]:
+            del self._entries[entry_key]
+
+    def discard(self, namespace: str, key: str) -> None:
+        """Drops one entry. Synchronous, since nothing leaves the process, so session event hooks can call it."""
+        self._entries.pop((namespace, key), None)
+
+
+class RedisResultCache:
+    """Redis-backed cache shared by every worker.
+
+    Invalidation bumps a per-namespace generation counter instead of scanning
+    keys; entries written under an older generation simply age out.
+    """
+
+    def __init__(self, url: str, default_ttl: int = 300, prefix: str = "applibry:cache"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError("RESULT_CACHE_URL points to Redis but the 'redis' package is not installed") from exc
+
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+        self._redis = redis_asyncio.from_url(url)
+
+    async def _generation(self, namespace: str) -> int:
+        value = await self._redis.get(f"{self.prefix}:{namespace}:generation")
+        return int(value) if value else 0
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        generation = await self._generation(namespace)
+        value = await self._redis.get(f"{self.prefix}:{namespace}:{generation}:{key}")
+        return json.loads(value) if value is not None else None
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        generation = await self._generation(namespace)
+        await self._redis.set(f"{self.prefix}:{namespace}:{generation}:{key}", json.dumps(value), ex=ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        await self._redis.incr(f"{self.prefix}:{namespace}:generation")
+
+
+def create_result_cache(
+    url: Optional[str] = None,
+    default_ttl: Optional[int] = None,
+    max_entries: Optional[int] = None,
+) -> ResultCache:
+    url = url or settings.RESULT_CACHE_URL
+    default_ttl = settings.RESULT_CACHE_TTL if default_ttl is None else default_ttl
+    max_entries = settings.RESULT_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+
+    if url.startswith(("redis://", "rediss://")):
+        return RedisResultCache(url, default_ttl=default_ttl)
+    return MemoryResultCache(max_entries=max_entries, default_ttl=default_ttl)
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import sys
+from typing import Mapping
+from uuid import UUID
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applibry_api.domain.entities.counter_delta import counter_deltas
+from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.cache.public_cache import invalidate_public_apps
+from applibry_api.infrastructure.persistence.database import async_session
+
+logger = logging.getLogger(__name__)
+
+APP_SUBSCRIBERS = "apps.subscribers"
+CATEGORY_APP_COUNT = "categories.app_count"
+CATEGORY_SUBSCRIBERS = "categories.subscribers"
+
+# Shared by the compactor and the reconciliation job so they never overlap
+COUNTER_LOCK_ID = 7_402_118
+
+# A single statement, so the deltas that are applied and the deltas that are
+# deleted always come from the same snapshot.
+_COMPACT_SQL = text("""
+    WITH moved AS (
+        DELETE FROM counter_deltas RETURNING counter, entity_id, delta
+    ),
+    app_totals AS (
+        UPDATE apps
+        SET subscribers = GREATEST(COALESCE(apps.subscribers, 0) + totals.subscribers, 0)
+        FROM (
+            SELECT entity_id, SUM(delta) AS subscribers
+            FROM moved WHERE counter = :app_subscribers
+            GROUP BY entity_id
+        ) AS totals
+        WHERE apps.id = totals.entity_id
+    ),
+    category_totals AS (
+        UPDATE categories
+        SET app_count = GREATEST(COALESCE(categories.app_count, 0) + totals.app_count, 0),
+            subscribers = GREATEST(COALESCE(categories.subscribers, 0) + totals.subscribers, 0)
+        FROM (
+            SELECT entity_id,
+                   COALESCE(SUM(delta) FILTER (WHERE counter = :category_app_count), 0) AS app_count,
+                   COALESCE(SUM(delta) FILTER (WHERE counter = :category_subscribers), 0) AS subscribers
+            FROM moved WHERE counter IN (:category_app_count, :category_subscribers)
+            GROUP BY entity_id
+        ) AS totals
+        WHERE categories.id = totals.entity_id
+    )
+    SELECT COUNT(*) FROM moved
+""")
+
+_RECONCILE_SQL = (
+    text("DELETE FROM counter_deltas"),
+    text("""
+        UPDATE apps SET subscribers = totals.subscribers
+        FROM (
+            SELECT apps.id, COUNT(user_apps.app_id) AS subscribers
+            FROM apps LEFT JOIN user_apps ON user_apps.app_id = apps.id
+            GROUP BY apps.id
+        ) AS totals
+        WHERE apps.id = totals.id AND apps.subscribers IS DISTINCT FROM totals.subscribers
+    """),
+    text("""
+        UPDATE categories SET app_count = totals.app_count, subscribers = totals.subscribers
+        FROM (
+            SELECT categories.id,
+                   (SELECT COUNT(*) FROM apps WHERE apps.category_id = categories.id) AS app_count,
+                   (SELECT COUNT(*) FROM user_categories WHERE user_categories.category_id = categories.id) AS subscribers
+            FROM categories
+        ) AS totals
+        WHERE categories.id = totals.id
+          AND (categories.app_count IS DISTINCT FROM totals.app_count
+               OR categories.subscribers IS DISTINCT FROM totals.subscribers)
+    """),
+)
+
+_COMPACT_PARAMS = {
+    "app_subscribers": APP_SUBSCRIBERS,
+    "category_app_count": CATEGORY_APP_COUNT,
+    "category_subscribers": CATEGORY_SUBSCRIBERS,
+}
+
+
+async def record_deltas(db: AsyncSession, counter: str, deltas: Mapping[UUID, int]):
+    """Queues counter changes in the caller's transaction; nothing touches the counted rows."""
+    rows = [
+        {"counter": counter, "entity_id": entity_id, "delta": delta}
+        for entity_id, delta in deltas.items()
+        if delta
+    ]
+    if rows:
+        await db.execute(insert(counter_deltas).values(rows))
+
+
+async def record_delta(db: AsyncSession, counter: str, entity_id: UUID, delta: int = 1):
+    await record_deltas(db, counter, {entity_id: delta})
+
+
+async def _try_lock(db: AsyncSession) -> bool:
+    result = await db.execute(select(func.pg_try_advisory_xact_lock(COUNTER_LOCK_ID)))
+    return bool(result.scalar())
+
+
+async def compact_counters(db: AsyncSession) -> int:
+    """Rolls pending deltas into the denormalised columns; returns how many deltas were applied."""
+    if not await _try_lock(db):
+        await db.rollback()
+        return 0
+
+    result = await db.execute(_COMPACT_SQL, _COMPACT_PARAMS)
+    applied = result.scalar_one()
+    await db.commit()
+    if applied:
+        # Public app and category cards render the compacted counters; the
+        # write that queued the delta invalidated them before it was applied
+        await invalidate_public_apps()
+    return applied
+
+
+async def reconcile_counters(db: AsyncSession):
+    """Recomputes every counter from user_apps, user_categories and apps.
+
+    Runs under REPEATABLE READ so the recount and the discarded deltas share
+    one snapshot; rerun it if it fails with a serialization error.
+    """
+    await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    if not await _try_lock(db):
+        await db.rollback()
+        raise RuntimeError("Counter compaction is in progress, try again shortly")
+
+    for statement in _RECONCILE_SQL:
+        await db.execute(statement)
+    await db.commit()
+    await invalidate_public_apps()
+
+
+async def run_counter_compactor(interval: int = settings.COUNTER_COMPACTOR_INTERVAL):
+    """Background loop started from the application lifespan."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with async_session() as session:
+                applied = await compact_counters(session)
+            if applied:
+                logger.debug("Compacted %s counter deltas", applied)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Counter compaction failed")
+
+
+async def _main(command: str):
+    async with async_session() as session:
+        if command == "reconcile":
+            await reconcile_counters(session)
+        else:
+            print(f"Compacted {await compact_counters(session)} counter deltas")
+
+
+if __name__ == "__main__":
+    # python -m applibry_api.infrastructure.persistence.counters [compact|reconcile]
+    asyncio.run(_main(sys.argv[1] if len(sys.argv) > 1 else "compact"))
@@ -0,0 +1,115 @@
+import base64
+import binascii
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from applibry_api.domain.exceptions.base_exception import AppBadRequestException
+
+# Bumped whenever the wire layout changes; older cursors are then rejected
+# with a 400 rather than being misread.
+CURSOR_VERSION = 1
+
+_HEADER = struct.Struct(">BH")
+_LENGTH = struct.Struct(">H")
+_INT = struct.Struct(">q")
+_FLOAT = struct.Struct(">d")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _encode_value(kind: type, value: Any) -> bytes:
+    if value is None:
+        return b"\x00"
+    if kind is str:
+        raw = value.encode()
+        return b"\x01" + _LENGTH.pack(len(raw)) + raw
+    if kind is int:
+        return b"\x01" + _INT.pack(value)
+    if kind is float:
+        return b"\x01" + _FLOAT.pack(value)
+    if kind is UUID:
+        return b"\x01" + value.bytes
+    if kind is datetime:
+        # The flag byte doubles as the timezone marker: 1 naive, 2 aware (UTC)
+        return (b"\x02" if value.tzinfo is not None else b"\x01") + _INT.pack(_micros(value))
+    raise TypeError(f"Unsupported cursor field type: {kind.__name__}")
+
+
+def _decode_value(kind: type, data: memoryview, offset: int) -> tuple[Any, int]:
+    flag = data[offset]
+    offset += 1
+    if flag == 0:
+        return None, offset
+    if kind is str:
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        raw = bytes(data[offset:offset + length])
+        if len(raw) != length:
+            raise ValueError("truncated")
+        return raw.decode(), offset + length
+    if kind is int:
+        return _INT.unpack_from(data, offset)[0], offset + _INT.size
+    if kind is float:
+        return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+    if kind is UUID:
+        raw = bytes(data[offset:offset + 16])
+        return UUID(bytes=raw), offset + 16
+    if kind is datetime:
+        (micros,) = _INT.unpack_from(data, offset)
+        value = _EPOCH + timedelta(microseconds=micros)
+        return (value.replace(tzinfo=timezone.utc) if flag == 2 else value), offset + _INT.size
+    raise TypeError(f"Unsupported cursor field type: {kind.__name__}")
+
+
+class CursorCodec:
+    """Opaque, typed keyset cursor for one ordering.
+
+    Cursors are a version byte, a 16-bit tag derived from ``name`` and the
+    packed key fields, base64url encoded without padding. The tag stops a
+    cursor from one listing being replayed against another, and every field
+    is decoded back to its declared type so it can be bound as a parameter.
+    """
+
+    def __init__(self, name: str, *fields: type):
+        self.name = name
+        self.fields = fields
+        self._tag = zlib.crc32(name.encode()) & 0xFFFF
+
+    def encode(self, *values) -> str:
+        if len(values) != len(self.fields):
+            raise ValueError(f"{self.name} cursor takes {len(self.fields)} values")
+        payload = _HEADER.pack(CURSOR_VERSION, self._tag) + b"".join(
+            _encode_value(kind, value) for kind, value in zip(self.fields, values)
+        )
+        return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+    def decode(self, cursor: str) -> tuple:
+        try:
+            data = memoryview(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            version, tag = _HEADER.unpack_from(data)
+            if version != CURSOR_VERSION or tag != self._tag:
+                raise ValueError("cursor does not belong to this listing")
+
+            values, offset = [], _HEADER.size
+            for kind in self.fields:
+                value, offset = _decode_value(kind, data, offset)
+                values.append(value)
+            if offset != len(data):
+                raise ValueError("trailing bytes")
+        except (binascii.Error, struct.error, IndexError, OverflowError, UnicodeDecodeError, ValueError):
+            raise AppBadRequestException("Invalid cursor")
+        return tuple(values)
+
+
+APP_NAME_CURSOR = CursorCodec("apps.name", str)
+APP_SEARCH_CURSOR = CursorCodec("apps.search", float, str)
+USER_APP_CURSOR = CursorCodec("user_apps.created_at", datetime, UUID)
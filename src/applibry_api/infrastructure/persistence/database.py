@@ -1,37 +1,254 @@
+import functools
+import hashlib
+import time
+from contextvars import ContextVar
+from typing import Optional
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import CompoundSelect, Select, event, exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from jose import jwt
 
+from applibry_api.domain.utilities import token_service
 from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.cache.result_cache import MemoryResultCache
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-# Ensure the database URL uses asyncpg
-if not settings.DATABASE_URL.startswith("postgresql+asyncpg://"):
-    settings.DATABASE_URL = settings.DATABASE_URL.replace(
-        "postgresql://", "postgresql+asyncpg://")
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True, pool_size=10, max_overflow=20, pool_pre_ping=True, pool_recycle=300, pool_timeout=30)
+def _async_url(url: str) -> str:
+    # Ensure the database URL uses asyncpg
+    if not url.startswith("postgresql+asyncpg://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://")
+    return url
+
+
+settings.DATABASE_URL = _async_url(settings.DATABASE_URL)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that also records how long checkouts wait for a connection.
+
+    The wait includes opening a new connection when the pool has to grow.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+POOL_PROFILES = {
+    # Long-lived API worker: a steady pool with overflow for bursts
+    "uvicorn": {"poolclass": InstrumentedQueuePool, "pool_size": 10, "max_overflow": 20, "pool_timeout": 30, "pool_recycle": 300},
+    # A Lambda container serves one request at a time and can be frozen for long
+    # stretches between them, so pooled connections would only go stale
+    "lambda": {"poolclass": NullPool},
+    # Scripts and jobs (counter compaction, imports): few connections, long waits are fine
+    "batch": {"poolclass": InstrumentedQueuePool, "pool_size": 2, "max_overflow": 0, "pool_timeout": 120, "pool_recycle": 1800},
+}
+
+
+def engine_options(url: str, profile: str = settings.DB_POOL_PROFILE) -> dict:
+    if profile not in POOL_PROFILES:
+        raise ValueError(f"Unknown DB_POOL_PROFILE {profile!r}, expected one of {', '.join(POOL_PROFILES)}")
+
+    options = dict(POOL_PROFILES[profile])
+    if options["poolclass"] is not NullPool:
+        options["pool_pre_ping"] = True
+        if settings.DB_POOL_SIZE is not None:
+            options["pool_size"] = settings.DB_POOL_SIZE
+        if settings.DB_MAX_OVERFLOW is not None:
+            options["max_overflow"] = settings.DB_MAX_OVERFLOW
+
+    options["echo"] = settings.DB_ECHO
+    if url.startswith("postgresql+asyncpg://"):
+        server_settings = {}
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        }
+    return options
+
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+
+if settings.DATABASE_READ_URL:
+    read_engine = create_async_engine(
+        _async_url(settings.DATABASE_READ_URL), **engine_options(_async_url(settings.DATABASE_READ_URL)))
+else:
+    read_engine = engine
+
+# Both are set in the request's context and are visible inside the greenlet
+# AsyncSession runs the ORM in, so get_bind can consult them.
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+current_principal: ContextVar[Optional[str]] = ContextVar("current_principal", default=None)
+
+# principal id -> time.monotonic() until which its reads stay on the primary.
+# Process-local: with several workers, a user may still hit a replica on
+# another worker within the window.
+_sticky_until: dict[str, float] = {}
+
+
+def stick_to_primary(principal_id: Optional[str]):
+    if not principal_id or read_engine is engine:
+        return
+
+    now = time.monotonic()
+    if len(_sticky_until) > 10_000:
+        for key in [key for key, until in _sticky_until.items() if until <= now]:
+            del _sticky_until[key]
+    _sticky_until[principal_id] = now + settings.READ_YOUR_WRITES_WINDOW
+
+
+def is_sticky(principal_id: Optional[str]) -> bool:
+    return bool(principal_id) and _sticky_until.get(principal_id, 0) > time.monotonic()
+
+
+class RoutingSession(Session):
+    """Sends SELECTs of read-only sessions or methods to the replica, everything else to the primary.
+
+    A session stays on the primary once it has written in the current
+    transaction, and so does a principal for READ_YOUR_WRITES_WINDOW seconds
+    after committing a write.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            read_engine is not engine
+            and (self.info.get("read_only") or _read_only.get())
+            and isinstance(clause, (Select, CompoundSelect))
+            and not self._flushing
+            and not self.info.get("pending_writes")
+            and not is_sticky(current_principal.get())
+        ):
+            return read_engine.sync_engine
+        return engine.sync_engine
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _track_executed_writes(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["pending_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _track_flushed_writes(session, flush_context):
+    session.info["pending_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _stick_after_write(session):
+    if session.info.pop("pending_writes", False):
+        stick_to_primary(current_principal.get())
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_writes(session):
+    session.info.pop("pending_writes", None)
+
+
 async_session = sessionmaker(
-    engine, expire_on_commit=False, class_=AsyncSession, autocommit=False, autoflush=False
+    class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False, autocommit=False, autoflush=False
 )
 
+
+def read_only(method):
+    """Lets the queries of a service method run on the read replica."""
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+    return wrapper
+
 Base = declarative_base()
 
 
+def pool_metrics() -> dict:
+    pool = engine.sync_engine.pool
+    metrics = {"profile": settings.DB_POOL_PROFILE, "pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        metrics.update(
+            checkouts=pool.checkouts,
+            checkout_timeouts=pool.timeouts,
+            wait_avg_ms=round(pool.wait_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+            wait_max_ms=round(pool.wait_max * 1000, 3),
+        )
+    return metrics
+
+
 async def get_db():
+    """Request session, shared by every service in the request (FastAPI caches
+    the dependency); a connection is only checked out on the first query."""
     async with async_session() as session:
         yield session
 
 
+async def get_read_db():
+    """Session whose SELECTs go to the read replica (see RoutingSession)."""
+    async with async_session(info={"read_only": True}) as session:
+        yield session
+
+
+
+# sha256(token) -> verified claims, kept until the token's own exp
+_verified_tokens = MemoryResultCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+_VERIFIED_TOKENS_NAMESPACE = "auth:tokens"
+
+
+async def decode_token(token: str) -> dict[str, str]:
+    """``token_service.decode`` with the verified claims cached until ``exp``.
+
+    Keyed by a digest so raw tokens are not held in memory; tokens without
+    ``exp`` are never cached.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = await _verified_tokens.get(_VERIFIED_TOKENS_NAMESPACE, key)
+    if payload is None:
+        payload = token_service.decode(token)
+        if isinstance(payload.get("exp"), (int, float)):
+            await _verified_tokens.set(_VERIFIED_TOKENS_NAMESPACE, key, payload, payload["exp"] - time.time())
+    return dict(payload)
+
 
-def verify_token(token: str = Depends(oauth2_scheme)) -> dict[str, str]:
+async def verify_token(token: str = Depends(oauth2_scheme)) -> dict[str, str]:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = await decode_token(token)
+        current_principal.set(payload.get("sid"))
         return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(
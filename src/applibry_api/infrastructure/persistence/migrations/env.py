@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 from applibry_api.domain.entities.root import RootModel
-from applibry_api.domain.entities import user, user_app, user_category, category, app, app_tag, app_platform, tag, platform, role, role_permission, permission, review
+from applibry_api.domain.entities import user, user_app, user_category, category, app, app_tag, app_platform, tag, platform, role, role_permission, permission, review, counter_delta
 
 from applibry_api.domain.utilities.config import settings
 from applibry_api.infrastructure.persistence.database import Base
@@ -0,0 +1,49 @@
+"""Add app search index
+
+Revision ID: 111673ec7e4a
+Revises: 4eb7655e1ad0
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '111673ec7e4a'
+down_revision: Union[str, None] = '4eb7655e1ad0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('apps', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Backfill with the same document AppService maintains on create/update
+    op.execute("""
+        UPDATE apps SET search_vector =
+            setweight(to_tsvector('simple'::regconfig, coalesce(apps.name, '')), 'A') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce((
+                SELECT string_agg(tags.name, ' ')
+                FROM app_tags JOIN tags ON tags.id = app_tags.tag_id
+                WHERE app_tags.app_id = apps.id
+            ), '')), 'B') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(apps.meta_keywords, '')), 'B') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(apps.brief, '')), 'C') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(apps.description, '')), 'D')
+    """)
+
+    op.create_index('ix_apps_search_vector', 'apps', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_apps_name_trgm', 'apps', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_apps_name_trgm', table_name='apps')
+    op.drop_index('ix_apps_search_vector', table_name='apps')
+    op.drop_column('apps', 'search_vector')
@@ -0,0 +1,34 @@
+"""Add counter deltas
+
+Revision ID: 7c6eebd4aa39
+Revises: 111673ec7e4a
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c6eebd4aa39'
+down_revision: Union[str, None] = '111673ec7e4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('counter_deltas',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('counter', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.UUID(), nullable=False),
+    sa.Column('delta', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_counter_deltas_counter_entity_id', 'counter_deltas', ['counter', 'entity_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_counter_deltas_counter_entity_id', table_name='counter_deltas')
+    op.drop_table('counter_deltas')
@@ -0,0 +1,32 @@
+"""Add user apps library index
+
+Revision ID: 5b2e9f0c41d7
+Revises: 7c6eebd4aa39
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e9f0c41d7'
+down_revision: Union[str, None] = '7c6eebd4aa39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The library cursor cannot step over NULL subscription times; legacy rows sort last
+    op.execute("UPDATE user_apps SET created_at = 'epoch'::timestamp WHERE created_at IS NULL")
+    op.alter_column('user_apps', 'created_at', existing_type=sa.TIMESTAMP(), nullable=False, server_default=sa.text('now()'))
+    op.create_index(
+        'ix_user_apps_user_id_created_at_app_id', 'user_apps',
+        ['user_id', sa.text('created_at DESC'), 'app_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_apps_user_id_created_at_app_id', table_name='user_apps')
+    op.alter_column('user_apps', 'created_at', existing_type=sa.TIMESTAMP(), nullable=True, server_default=None)
@@ -0,0 +1,42 @@
+"""Add user lookup indexes
+
+Revision ID: 9e4d1a7c2b60
+Revises: 5b2e9f0c41d7
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4d1a7c2b60'
+down_revision: Union[str, None] = '5b2e9f0c41d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY keeps users writable for logins and registrations during
+    # the build; it cannot run inside a transaction, hence the autocommit block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_lower_email', 'users', [sa.text('lower(email)')], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_users_lower_username', 'users', [sa.text('lower(username)')], unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_users_email_trgm', 'users', ['email'], unique=False,
+            postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_trgm', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_lower_username', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_lower_email', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,58 @@
+"""Add foreign key and filter indexes
+
+Revision ID: 2f8c6b3d9a15
+Revises: 9e4d1a7c2b60
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2f8c6b3d9a15'
+down_revision: Union[str, None] = '9e4d1a7c2b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable during the build; it cannot run
+    # inside a transaction, hence the autocommit block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_apps_category_id_name', 'apps', ['category_id', 'name'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_apps_trending_name', 'apps', ['name'], unique=False,
+            postgresql_where=sa.text('trending IS true AND is_deleted IS NOT true'), postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_user_apps_app_id_user_id', 'user_apps', ['app_id', 'user_id'], unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_app_tags_app_id_tag_id', 'app_tags', ['app_id', 'tag_id'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index('ix_app_tags_tag_id', 'app_tags', ['tag_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(
+            'ix_app_platforms_app_id_platform_id', 'app_platforms', ['app_id', 'platform_id'], unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_app_platforms_platform_id', 'app_platforms', ['platform_id'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index('ix_users_role_id', 'users', ['role_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_role_id', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_app_platforms_platform_id', table_name='app_platforms', postgresql_concurrently=True)
+        op.drop_index('ix_app_platforms_app_id_platform_id', table_name='app_platforms', postgresql_concurrently=True)
+        op.drop_index('ix_app_tags_tag_id', table_name='app_tags', postgresql_concurrently=True)
+        op.drop_index('ix_app_tags_app_id_tag_id', table_name='app_tags', postgresql_concurrently=True)
+        op.drop_index('ix_user_apps_app_id_user_id', table_name='user_apps', postgresql_concurrently=True)
+        op.drop_index('ix_apps_trending_name', table_name='apps', postgresql_concurrently=True)
+        op.drop_index('ix_apps_category_id_name', table_name='apps', postgresql_concurrently=True)
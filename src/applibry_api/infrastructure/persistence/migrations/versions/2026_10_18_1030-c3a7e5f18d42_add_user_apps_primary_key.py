@@ -0,0 +1,44 @@
+"""Add user apps primary key
+
+Revision ID: c3a7e5f18d42
+Revises: 2f8c6b3d9a15
+Create Date: 2026-10-18 10:30:00.000000
+
+Duplicate memberships are collapsed to their earliest row first. They were
+counted in apps.subscribers, so run
+``python -m applibry_api.infrastructure.persistence.counters reconcile``
+afterwards.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a7e5f18d42'
+down_revision: Union[str, None] = '2f8c6b3d9a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM user_apps WHERE user_id IS NULL OR app_id IS NULL")
+    op.execute("""
+        DELETE FROM user_apps
+        WHERE ctid IN (
+            SELECT ctid FROM (
+                SELECT ctid, row_number() OVER (PARTITION BY user_id, app_id ORDER BY created_at, ctid) AS n
+                FROM user_apps
+            ) AS ranked
+            WHERE n > 1
+        )
+    """)
+    op.alter_column('user_apps', 'user_id', existing_type=sa.UUID(), nullable=False)
+    op.alter_column('user_apps', 'app_id', existing_type=sa.UUID(), nullable=False)
+    op.create_primary_key('pk_user_apps', 'user_apps', ['user_id', 'app_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('pk_user_apps', 'user_apps', type_='primary')
+    op.alter_column('user_apps', 'app_id', existing_type=sa.UUID(), nullable=True)
+    op.alter_column('user_apps', 'user_id', existing_type=sa.UUID(), nullable=True)
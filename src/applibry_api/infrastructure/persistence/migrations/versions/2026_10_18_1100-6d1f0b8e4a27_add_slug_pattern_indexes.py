@@ -0,0 +1,39 @@
+"""Add slug pattern indexes
+
+Revision ID: 6d1f0b8e4a27
+Revises: c3a7e5f18d42
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6d1f0b8e4a27'
+down_revision: Union[str, None] = 'c3a7e5f18d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column) for the LIKE 'base-%' scans in allocate_slug
+PATTERN_INDEXES = (
+    ('ix_apps_slug_pattern', 'apps', 'slug'),
+    ('ix_categories_slug_pattern', 'categories', 'slug'),
+    ('ix_permissions_code_pattern', 'permissions', 'code'),
+    ('ix_roles_code_pattern', 'roles', 'code'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in PATTERN_INDEXES:
+            op.create_index(
+                name, table, [column], unique=False,
+                postgresql_ops={column: 'text_pattern_ops'}, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(PATTERN_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,90 @@
+import asyncio
+import functools
+from typing import Literal, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applibry_api.domain.exceptions.base_exception import AppBadRequestException
+from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.persistence.cursor import CursorCodec
+from applibry_api.infrastructure.persistence.database import async_session
+
+# none: skip counting; estimated: planner statistics for unfiltered listings;
+# exact: COUNT(*) on a second session, concurrently with the page query
+TotalMode = Literal["none", "estimated", "exact"]
+TOTAL_MODES = ("none", "estimated", "exact")
+
+# reltuples is -1 until the table is first vacuumed or analyzed
+_ESTIMATE_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+
+
+@functools.lru_cache(maxsize=None)
+def _cursor_codec(table: str, column: str) -> CursorCodec:
+    # One tag per listing, so a cursor from one table is rejected by another
+    return CursorCodec(f"{table}.{column}", str, UUID)
+
+
+async def _exact_total(stmt: Select) -> int:
+    # A session of its own, so the count can run while the caller's session fetches the page
+    async with async_session(info={"read_only": True}) as session:
+        result = await session.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+        return result.scalar_one()
+
+
+async def _estimated_total(db: AsyncSession, table: str) -> Optional[int]:
+    result = await db.execute(_ESTIMATE_SQL, {"table": table})
+    return result.scalar_one_or_none()
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    total: TotalMode = "estimated",
+    estimate_table: Optional[str] = None,
+) -> dict:
+    """Keyset page of ``stmt`` ordered by ``(sort_column, id_column)``.
+
+    Each page is an index range scan from the cursor, so deep pages cost the
+    same as the first. ``estimate_table`` enables the pg_class estimate and
+    should only be passed for unfiltered listings; without it, or when the
+    table has never been analyzed or is below PAGINATION_EXACT_COUNT_BELOW
+    rows, "estimated" falls back to an exact count.
+    """
+    if total not in TOTAL_MODES:
+        raise AppBadRequestException(f"total must be one of {', '.join(TOTAL_MODES)}")
+
+    codec = _cursor_codec(sort_column.class_.__tablename__, sort_column.key)
+    page_stmt = stmt
+    if cursor:
+        sort_value, id_value = codec.decode(cursor)
+        page_stmt = page_stmt.filter(tuple_(sort_column, id_column) > tuple_(sort_value, id_value))
+    page_stmt = page_stmt.order_by(sort_column, id_column).limit(limit + 1)
+
+    async def fetch_page():
+        result = await db.execute(page_stmt)
+        return result.scalars().all()
+
+    count, exact = None, total == "exact"
+    if total == "estimated":
+        count = await _estimated_total(db, estimate_table) if estimate_table else None
+        # Counting a small table is cheap, and its estimate is often 0 or -1
+        exact = count is None or count < settings.PAGINATION_EXACT_COUNT_BELOW
+
+    if exact:
+        data, count = await asyncio.gather(fetch_page(), _exact_total(stmt))
+    else:
+        data = await fetch_page()
+
+    next_cursor = None
+    if len(data) > limit:
+        data = data[:limit]
+        last = data[-1]
+        next_cursor = codec.encode(getattr(last, sort_column.key), last.id)
+
+    return {"data": data, "next_cursor": next_cursor, "total": count}
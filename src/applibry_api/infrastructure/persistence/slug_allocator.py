@@ -0,0 +1,96 @@
+import re
+from collections import Counter
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from applibry_api.domain.utilities.slugify import generate_slug
+
+
+def next_free_slug(base: str, taken: Iterable[str]) -> str:
+    """Returns ``base`` or ``base-N`` where N is one past the highest suffix already in use."""
+    taken = set(taken)
+    if base not in taken:
+        return base
+
+    pattern = re.compile(rf"^{re.escape(base)}-(\d+)$")
+    suffixes = {int(match.group(1)) for slug in taken if (match := pattern.match(slug))}
+    return f"{base}-{max(suffixes, default=0) + 1}"
+
+
+async def allocate_slug(db: AsyncSession, column, name: str, exclude_id: Optional[UUID] = None) -> str:
+    """Picks a free slug for ``name`` with a single indexed prefix query on ``column``.
+
+    ``column`` is a unique string attribute such as ``App.slug`` or ``Role.code``;
+    ``exclude_id`` skips the row being updated so it can keep its own slug.
+    """
+    base = generate_slug(name)
+    stmt = select(column).where(or_(column == base, column.startswith(f"{base}-", autoescape=True)))
+    if exclude_id:
+        stmt = stmt.where(column.class_.id != exclude_id)
+
+    result = await db.execute(stmt)
+    return next_free_slug(base, result.scalars().all())
+
+
+async def allocate_slugs(db: AsyncSession, column, names: Iterable[str]) -> dict[str, str]:
+    """Bulk ``allocate_slug`` for a batch of new rows; returns ``{name: slug}``.
+
+    One exact-match query over every base slug, plus one prefix query only for
+    bases that are already taken or repeated within the batch.
+    """
+    bases = {name: generate_slug(name) for name in names}
+    if not bases:
+        return {}
+
+    result = await db.execute(select(column).where(column.in_(set(bases.values()))))
+    taken = set(result.scalars().all())
+
+    repeated = {base for base, count in Counter(bases.values()).items() if count > 1}
+    contested = taken | repeated
+    if contested:
+        result = await db.execute(
+            select(column).where(or_(*(column.startswith(f"{base}-", autoescape=True) for base in contested)))
+        )
+        taken.update(result.scalars().all())
+
+    slugs = {}
+    for name, base in bases.items():
+        slugs[name] = next_free_slug(base, taken)
+        taken.add(slugs[name])
+    return slugs
+
+
+async def add_with_unique_slug(db: AsyncSession, entity, column, name: str, attempts: int = 3):
+    """Adds ``entity`` with a freshly allocated slug, retrying if a concurrent insert takes it first."""
+    for attempt in range(attempts):
+        setattr(entity, column.key, await allocate_slug(db, column, name))
+        try:
+            async with db.begin_nested():
+                db.add(entity)
+            return entity
+        except IntegrityError as exc:
+            if attempt == attempts - 1 or column.key not in str(exc.orig):
+                raise
+
+
+async def update_with_unique_slug(db: AsyncSession, entity, column, name: str, attempts: int = 3):
+    """Re-slugs a persistent ``entity`` for ``name``, retrying like ``add_with_unique_slug``.
+
+    The entity's other pending changes are flushed first, so a savepoint rollback
+    only loses the slug; callers should not read ``entity`` again before committing.
+    """
+    entity_id = entity.id
+    await db.flush()
+    for attempt in range(attempts):
+        slug = await allocate_slug(db, column, name, entity_id)
+        try:
+            async with db.begin_nested():
+                setattr(entity, column.key, slug)
+            return entity
+        except IntegrityError as exc:
+            if attempt == attempts - 1 or column.key not in str(exc.orig):
+                raise
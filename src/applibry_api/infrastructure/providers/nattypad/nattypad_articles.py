@@ -1,69 +1,43 @@
 from uuid import UUID
 
-import httpx
-from decouple import config
-
-from applibry_api.infrastructure.providers.nattypad.nattypad_auth import authenticate
+from applibry_api.infrastructure.providers.nattypad import nattypad_client
+from applibry_api.infrastructure.providers.nattypad.nattypad_cache import stale_while_revalidate
+from applibry_api.infrastructure.providers.nattypad.nattypad_auth import authorized_request
 from applibry_api.infrastructure.providers.nattypad.schemas.app_schema import AppArticleSchema, AppResponseSchemaExt, AppResponseSchema
 
-base_url = config('NATTYPAD_BASE_URL')
 
+@stale_while_revalidate()
 async def get_articles(search: str, page: int, per_page: int) -> AppResponseSchemaExt[AppArticleSchema]:
-    api_url = f"{base_url}/apps/articles?page={page}&per_page={per_page}"
+    params = {"page": page, "per_page": per_page}
 
     if search:
-        api_url = f"{api_url}&search={search}"
-
-    token = await authenticate()
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=40.0) as client:
-            response = await client.get(api_url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-
-            return AppResponseSchemaExt[AppArticleSchema](
-                data=[AppArticleSchema.model_validate(item) for item in data["data"]],
-                success=True,
-                current_page=data["current_page"],
-                page_size=data["page_size"],
-                total=data["total"],
-                message=data["message"]
-            )
-
-    except httpx.HTTPStatusError as http_err:
-        raise
-    except Exception as err:
-        raise
-
-
+        params["search"] = search
+
+    response = await authorized_request(
+        "GET",
+        "/apps/articles",
+        params=params,
+        timeout=nattypad_client.timeout(nattypad_client.ARTICLES_TIMEOUT),
+    )
+    data = response.json()
+
+    return AppResponseSchemaExt[AppArticleSchema](
+        data=[AppArticleSchema.model_validate(item) for item in data["data"]],
+        success=True,
+        current_page=data["current_page"],
+        page_size=data["page_size"],
+        total=data["total"],
+        message=data["message"]
+    )
+
+
+@stale_while_revalidate()
 async def get_article(id: UUID) -> AppResponseSchema[AppArticleSchema]:
-    api_url = f"{base_url}/apps/articles/{id}"
-    token = await authenticate()
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(api_url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-
-            return AppResponseSchema[AppArticleSchema](
-                data=AppArticleSchema.model_validate(data["data"]),
-                success=True,
-                message=data["message"]
-            )
-
-    except httpx.HTTPStatusError as http_err:
-        raise
-    except Exception as err:
-        raise
+    response = await authorized_request("GET", f"/apps/articles/{id}")
+    data = response.json()
+
+    return AppResponseSchema[AppArticleSchema](
+        data=AppArticleSchema.model_validate(data["data"]),
+        success=True,
+        message=data["message"]
+    )
@@ -1,43 +1,126 @@
 import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional
 
 import httpx
-from aiocache import cached, Cache
 from decouple import config
+from jose import jwt, JWTError
+
+from applibry_api.infrastructure.providers.nattypad import nattypad_client
+
+logger = logging.getLogger(__name__)
 
-base_url = config('NATTYPAD_BASE_URL')
 client_id = config('NATTYPAD_CLIENT_ID')
 client_secret = config('NATTYPAD_CLIENT_SECRET')
 
-cache = Cache(Cache.MEMORY)
-auth_lock = asyncio.Lock()
-
-@cached(ttl=3600, key="auth_token")
-async def authenticate():
-    async with auth_lock:
-        cached_token = await cache.get("auth_token")
-        if cached_token:
-            return cached_token
-
-        api_url = f"{base_url}/apps/login"
-        data = {"client_id": client_id, "client_secret": client_secret}
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(api_url, json=data, headers=headers)
-                response.raise_for_status()
-                result = response.json()
-                access_token = result["access_token"]
-
-                # Store the token in the cache
-                await cache.set("auth_token", access_token, ttl=3600)
-
-                return access_token
-        except httpx.HTTPStatusError as http_err:
-            # Handle specific HTTP errors
-            raise http_err
-        except Exception as err:
-            # Handle other possible errors
-            raise err
\ No newline at end of file
+# Used when NattyPad gives no expires_in/expires_at and the token is not a JWT with "exp"
+FALLBACK_TOKEN_TTL = 3600
+# Start a background refresh this many seconds before the token expires
+REFRESH_MARGIN = 60
+
+
+def _parse_expires_at(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def token_expires_at(payload: dict, access_token: str) -> float:
+    """Wall-clock expiry of a login response: expires_in, then expires_at, then the JWT "exp" claim."""
+    if payload.get("expires_in") is not None:
+        return time.time() + float(payload["expires_in"])
+
+    if payload.get("expires_at") is not None:
+        expires_at = _parse_expires_at(payload["expires_at"])
+        if expires_at is not None:
+            return expires_at
+
+    try:
+        exp = jwt.get_unverified_claims(access_token).get("exp")
+    except JWTError:
+        exp = None
+    return float(exp) if exp else time.time() + FALLBACK_TOKEN_TTL
+
+
+class NattyPadTokenManager:
+    """Holds the NattyPad access token and refreshes it ahead of expiry.
+
+    Readers only touch two attributes while the token is valid; a refresh is
+    started in the background once the token enters its refresh margin, and
+    concurrent refreshes (including forced ones after a 401) share one login.
+    """
+
+    def __init__(self, refresh_margin: float = REFRESH_MARGIN):
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0  # time.monotonic() based
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _login(self) -> str:
+        response = await nattypad_client.get_client().post(
+            "/apps/login",
+            json={"client_id": client_id, "client_secret": client_secret},
+            timeout=nattypad_client.timeout(nattypad_client.AUTH_TIMEOUT),
+        )
+        response.raise_for_status()
+        payload = response.json()
+        access_token = payload["access_token"]
+
+        ttl = token_expires_at(payload, access_token) - time.time()
+        self._token = access_token
+        self._expires_at = time.monotonic() + max(ttl, 0)
+        return access_token
+
+    def _refresh(self) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._login())
+            self._refresh_task.add_done_callback(self._log_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("NattyPad login failed: %s", task.exception())
+
+    async def get_token(self, force_refresh: bool = False) -> str:
+        remaining = self._expires_at - time.monotonic()
+        if self._token and remaining > 0 and not force_refresh:
+            if remaining <= self.refresh_margin:
+                self._refresh()
+            return self._token
+        return await asyncio.shield(self._refresh())
+
+    async def refresh_rejected(self, rejected_token: str) -> str:
+        """Forced refresh after a 401, skipped if another caller already replaced ``rejected_token``."""
+        if self._token and self._token != rejected_token and self._expires_at > time.monotonic():
+            return self._token
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return await asyncio.shield(self._refresh_task)
+        return await self.get_token(force_refresh=True)
+
+
+token_manager = NattyPadTokenManager()
+
+
+async def authenticate(force_refresh: bool = False) -> str:
+    return await token_manager.get_token(force_refresh=force_refresh)
+
+
+async def authorized_request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Sends a request with the current token, retrying once with a fresh token on 401."""
+    headers = kwargs.pop("headers", None) or {}
+    token = await authenticate()
+    client = nattypad_client.get_client()
+
+    response = await client.request(method, url, headers={**headers, "Authorization": f"Bearer {token}"}, **kwargs)
+    if response.status_code == httpx.codes.UNAUTHORIZED:
+        token = await token_manager.refresh_rejected(token)
+        response = await client.request(method, url, headers={**headers, "Authorization": f"Bearer {token}"}, **kwargs)
+
+    response.raise_for_status()
+    return response
@@ -0,0 +1,99 @@
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from applibry_api.domain.utilities.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StaleWhileRevalidateCache:
+    """Bounded LRU cache that keeps serving stale values while a refresh runs.
+
+    An entry is fresh for ``fresh_ttl`` seconds and may then be served stale for
+    another ``stale_ttl`` seconds, during which the first hit schedules a
+    background refresh. Concurrent misses for the same key share one upstream
+    call, and a failed refresh keeps the stale value until it expires.
+    """
+
+    def __init__(self, fresh_ttl: float = 300, stale_ttl: float = 3600, max_entries: int = 512):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _store(self, key: Hashable, value: Any, fresh_ttl: float):
+        now = time.monotonic()
+        self._entries[key] = (now + fresh_ttl, now + fresh_ttl + self.stale_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], fresh_ttl: float) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+
+        async def run():
+            value = await fetch()
+            self._store(key, value, fresh_ttl)
+            return value
+
+        def done(finished: asyncio.Task):
+            self._inflight.pop(key, None)
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning("NattyPad fetch for %r failed: %s", key, finished.exception())
+
+        task = asyncio.create_task(run())
+        task.add_done_callback(done)
+        self._inflight[key] = task
+        return task
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        fresh_ttl: Optional[float] = None,
+    ) -> Any:
+        fresh_ttl = self.fresh_ttl if fresh_ttl is None else fresh_ttl
+        entry = self._entries.get(key)
+        if entry is not None:
+            fresh_until, stale_until, value = entry
+            now = time.monotonic()
+            if now < stale_until:
+                self._entries.move_to_end(key)
+                if now >= fresh_until:
+                    self._fetch(key, fetch, fresh_ttl)
+                return value
+            del self._entries[key]
+
+        # Shielded so one cancelled caller does not abort the fetch the others are waiting on
+        return await asyncio.shield(self._fetch(key, fetch, fresh_ttl))
+
+
+nattypad_cache = StaleWhileRevalidateCache(
+    fresh_ttl=settings.NATTYPAD_CACHE_FRESH_TTL,
+    stale_ttl=settings.NATTYPAD_CACHE_STALE_TTL,
+    max_entries=settings.NATTYPAD_CACHE_MAX_ENTRIES,
+)
+
+
+def stale_while_revalidate(fresh_ttl: Optional[float] = None, cache: StaleWhileRevalidateCache = nattypad_cache):
+    """Caches a NattyPad getter keyed by its name and arguments (search, page, per_page, id)."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            return await cache.get_or_fetch(key, lambda: func(*args, **kwargs), fresh_ttl)
+        return wrapper
+    return decorator
@@ -0,0 +1,55 @@
+import importlib.util
+
+import httpx
+
+from applibry_api.domain.utilities.config import settings
+
+# Read timeouts per NattyPad endpoint (seconds); connect timeout is shared
+AUTH_TIMEOUT = 10.0
+ARTICLES_TIMEOUT = 40.0
+QUOTES_TIMEOUT = 30.0
+CATEGORIES_TIMEOUT = 30.0
+DEFAULT_TIMEOUT = 15.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def timeout(read: float) -> httpx.Timeout:
+    return httpx.Timeout(read, connect=settings.NATTYPAD_CONNECT_TIMEOUT)
+
+
+def _http2_enabled() -> bool:
+    # HTTP/2 needs the optional "h2" package (httpx[http2]); fall back to HTTP/1.1 keep-alive without it
+    return settings.NATTYPAD_HTTP2 and importlib.util.find_spec("h2") is not None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Process-wide client so every NattyPad call reuses pooled keep-alive connections."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=settings.NATTYPAD_BASE_URL,
+            http2=_http2_enabled(),
+            limits=httpx.Limits(
+                max_connections=settings.NATTYPAD_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.NATTYPAD_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.NATTYPAD_KEEPALIVE_EXPIRY,
+            ),
+            timeout=timeout(DEFAULT_TIMEOUT),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        )
+    return _client
+
+
+async def start():
+    get_client()
+
+
+async def close():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
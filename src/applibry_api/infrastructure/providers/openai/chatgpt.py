@@ -1,17 +1,23 @@
-from openai import OpenAI
+from functools import lru_cache
 
 from decouple import config
 
-client = OpenAI(
-    api_key=config("OPENAI_API_KEY"),
-    # project=config("ORGANIZATION_ID"),
-    # organization=config("PROJECT_ID"),
-)
+
+@lru_cache(maxsize=None)
+def get_client():
+    # Imported on first use so the OpenAI SDK stays out of the API's startup path
+    from openai import OpenAI
+
+    return OpenAI(
+        api_key=config("OPENAI_API_KEY"),
+        # project=config("ORGANIZATION_ID"),
+        # organization=config("PROJECT_ID"),
+    )
+
 
 def get_content_summary(content: str) -> str:
-    chat_completion = client.chat.completions.create(
+    chat_completion = get_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": f"Summarize this article in not longer than 250 characters \n {content}"}]
     )
     return chat_completion.choices[0].message.content
-
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from applibry_api.infrastructure.cache.public_cache import (
+    PUBLIC_APPS_NAMESPACE,
+    PUBLIC_CATEGORIES_NAMESPACE,
+    public_cache,
+)
+from applibry_api.infrastructure.persistence import counters
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+
+class FakeSession:
+    """Grants the advisory lock and reports ``applied`` compacted deltas."""
+
+    def __init__(self, applied: int):
+        self.results = [FakeResult(True), FakeResult(applied)]
+
+    async def execute(self, *args):
+        return self.results.pop(0)
+
+    async def commit(self):
+        pass
+
+
+NAMESPACES = (PUBLIC_APPS_NAMESPACE, PUBLIC_CATEGORIES_NAMESPACE)
+
+
+@pytest.mark.parametrize("applied, invalidated", [(2, True), (0, False)])
+def test_compaction_invalidates_the_public_listings(applied, invalidated):
+    async def scenario():
+        for namespace in NAMESPACES:
+            await public_cache.set(namespace, "page", {"data": []})
+        assert await counters.compact_counters(FakeSession(applied)) == applied
+        return [await public_cache.get(namespace, "page") for namespace in NAMESPACES]
+
+    cached = asyncio.run(scenario())
+
+    assert cached == ([None, None] if invalidated else [{"data": []}, {"data": []}])
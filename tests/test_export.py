@@ -0,0 +1,50 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from applibry_api.application.v1.apps import controller
+from applibry_api.domain.utilities import token_service
+from main import app
+
+
+def export(query: str) -> httpx.Response:
+    user = SimpleNamespace(username="jane", id=uuid.uuid4())
+    headers = {"Authorization": f"Bearer {token_service.create_access_token(user)}"}
+
+    async def request() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get(f"/api/v1/apps/export?{query}", headers=headers)
+
+    return asyncio.run(request())
+
+
+@pytest.fixture
+def streamed(monkeypatch):
+    calls = []
+
+    async def stream_apps(**filters):
+        calls.append(filters)
+        yield []
+
+    monkeypatch.setattr(controller, "stream_apps", stream_apps)
+    return calls
+
+
+def test_a_malformed_category_is_rejected_before_streaming(streamed):
+    response = export("format=csv&category=not-a-uuid")
+
+    assert response.status_code == 422
+    assert streamed == []
+
+
+def test_the_category_reaches_the_export_as_a_uuid(streamed):
+    category = uuid.uuid4()
+
+    response = export(f"format=ndjson&category={category}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert streamed == [{"search": None, "category": category}]
@@ -0,0 +1,65 @@
+import asyncio
+import base64
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from applibry_api.domain.utilities import file_manager
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 600  # spans several Base64 chunks
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.uploads = []
+
+    def upload_fileobj(self, stream, bucket, key, ExtraArgs):
+        self.uploads.append({
+            "thread": threading.current_thread().name,
+            "body": stream.read(),
+            "bucket": bucket,
+            "key": key,
+            "content_type": ExtraArgs["ContentType"],
+        })
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    client = FakeS3Client()
+    monkeypatch.setattr(file_manager, "get_s3_client", lambda: client)
+    return client
+
+
+def test_base64_is_decoded_in_chunks_across_whitespace_and_prefix():
+    encoded = base64.b64encode(PNG).decode()
+    wrapped = "data:image/png;base64," + "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+
+    with file_manager._decode_base64_to_stream(wrapped, chunk_size=1000) as stream:
+        assert stream.read() == PNG
+
+
+def test_upload_runs_on_the_upload_pool(s3):
+    url = asyncio.run(file_manager.upload_to_s3(base64.b64encode(PNG).decode()))
+
+    (upload,) = s3.uploads
+    assert upload["thread"].startswith("s3-upload")
+    assert upload["body"] == PNG
+    assert upload["content_type"] == "image/png"
+    assert url == f"https://{file_manager.AWS_BUCKET_NAME}.s3.{file_manager.AWS_REGION}.amazonaws.com/{upload['key']}"
+
+
+def test_unsupported_format_is_a_bad_request(s3):
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(file_manager.upload_to_s3(base64.b64encode(b"plain text, not an image").decode()))
+
+    assert raised.value.status_code == 400
+    assert s3.uploads == []
+
+
+def test_images_upload_concurrently_and_skip_empty_entries(s3):
+    icon, banner = asyncio.run(file_manager.upload_images_to_s3(base64.b64encode(PNG).decode(), None))
+
+    assert icon.endswith(".png")
+    assert banner is None
+    assert len(s3.uploads) == 1
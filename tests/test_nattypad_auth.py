@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from jose import jwt
+
+from applibry_api.infrastructure.providers.nattypad import nattypad_auth, nattypad_client
+
+
+class FakeNattyPad:
+    """Issues token-1, token-2, ... and only accepts the latest one."""
+
+    def __init__(self, expires_in: float = 3600):
+        self.expires_in = expires_in
+        self.logins = 0
+        self.calls = 0
+
+    @property
+    def current_token(self) -> str:
+        return f"token-{self.logins}"
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/apps/login":
+            self.logins += 1
+            await asyncio.sleep(0.01)  # long enough for concurrent callers to pile up
+            return httpx.Response(200, json={"access_token": self.current_token, "expires_in": self.expires_in})
+
+        self.calls += 1
+        if request.headers["Authorization"] != f"Bearer {self.current_token}":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"ok": True})
+
+    def revoke(self):
+        """Rotates the token server-side, as a NattyPad restart or key rotation would."""
+        self.logins += 1
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeNattyPad()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server), base_url="http://nattypad.test")
+    monkeypatch.setattr(nattypad_client, "_client", client)
+    monkeypatch.setattr(nattypad_auth, "token_manager", nattypad_auth.NattyPadTokenManager())
+    return server
+
+
+def test_a_401_refreshes_the_token_once_and_retries(server):
+    async def scenario():
+        await nattypad_auth.authenticate()
+        server.revoke()
+        return await nattypad_auth.authorized_request("GET", "/articles")
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 200
+    assert server.logins == 3  # initial, revoked, one refresh
+    assert server.calls == 2
+
+
+def test_concurrent_401s_share_one_login(server):
+    async def scenario():
+        await nattypad_auth.authenticate()
+        server.revoke()
+        return await asyncio.gather(*(nattypad_auth.authorized_request("GET", "/articles") for _ in range(5)))
+
+    responses = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert server.logins == 3
+
+
+def test_a_second_401_is_raised(server, monkeypatch):
+    async def reject(_):
+        return "stale"
+
+    monkeypatch.setattr(nattypad_auth.token_manager, "refresh_rejected", reject)
+
+    async def scenario():
+        await nattypad_auth.authenticate()
+        server.revoke()
+        await nattypad_auth.authorized_request("GET", "/articles")
+
+    with pytest.raises(httpx.HTTPStatusError) as raised:
+        asyncio.run(scenario())
+    assert raised.value.response.status_code == 401
+
+
+def test_token_is_refreshed_in_the_background_within_the_margin(server):
+    server.expires_in = 30  # inside the 60s refresh margin from the start
+
+    async def scenario():
+        first = await nattypad_auth.authenticate()
+        second = await nattypad_auth.authenticate()  # still served, refresh starts behind it
+        await nattypad_auth.token_manager._refresh_task
+        return first, second, await nattypad_auth.authenticate()
+
+    first, second, third = asyncio.run(scenario())
+
+    assert first == second == "token-1"
+    assert third == "token-2"
+
+
+def test_token_expiry_sources_in_order():
+    now = time.time()
+    token = jwt.encode({"exp": int(now) + 120}, "secret")
+
+    assert nattypad_auth.token_expires_at({"expires_in": 60}, token) == pytest.approx(now + 60, abs=5)
+    assert nattypad_auth.token_expires_at({"expires_at": "2030-01-01T00:00:00Z"}, token) == 1893456000
+    assert nattypad_auth.token_expires_at({}, token) == int(now) + 120
+    assert nattypad_auth.token_expires_at({}, "opaque") == pytest.approx(
+        now + nattypad_auth.FALLBACK_TOKEN_TTL, abs=5
+    )
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from applibry_api.domain.utilities.config import settings
+from applibry_api.infrastructure.providers.nattypad import nattypad_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    asyncio.run(nattypad_client.close())
+    yield
+    asyncio.run(nattypad_client.close())
+
+
+def test_calls_share_one_client():
+    assert nattypad_client.get_client() is nattypad_client.get_client()
+
+
+def test_client_is_rebuilt_after_close():
+    first = nattypad_client.get_client()
+    asyncio.run(nattypad_client.close())
+
+    assert first.is_closed
+    assert nattypad_client.get_client() is not first
+
+
+def test_endpoint_timeouts_share_the_connect_timeout():
+    timeout = nattypad_client.timeout(nattypad_client.ARTICLES_TIMEOUT)
+
+    assert timeout.read == nattypad_client.ARTICLES_TIMEOUT
+    assert timeout.connect == settings.NATTYPAD_CONNECT_TIMEOUT
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from applibry_api.domain.exceptions.base_exception import AppTooManyRequestsException
+from applibry_api.domain.utilities import cryptography
+from applibry_api.domain.utilities.config import settings
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(cryptography, "_get_hash_executor", lambda: executor)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 2)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_hashes_beyond_the_pending_limit_are_rejected_with_429(executor):
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.create_task(cryptography._run_hasher(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0)  # let both take a slot
+        assert cryptography._pending_hashes == 2
+
+        with pytest.raises(AppTooManyRequestsException) as raised:
+            await cryptography._run_hasher(release.wait, 5)
+
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        return raised.value
+
+    rejection = asyncio.run(scenario())
+
+    assert rejection.status_code == 429
+    assert cryptography._pending_hashes == 0
+
+
+def test_a_failed_hash_frees_its_slot(executor):
+    def explode():
+        raise RuntimeError("boom")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await cryptography._run_hasher(explode)
+
+    asyncio.run(scenario())
+    assert cryptography._pending_hashes == 0
+
+
+def test_hash_and_verify_round_trip_off_the_loop(executor):
+    async def scenario():
+        hashed = await cryptography.hash_password_async("correct horse")
+        return (
+            await cryptography.verify_password_async("correct horse", hashed),
+            await cryptography.verify_password_async("wrong horse", hashed),
+        )
+
+    assert asyncio.run(scenario()) == (True, False)
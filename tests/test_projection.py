@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import literal_column
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import result_tuple
+
+from applibry_api.application.v1.apps.projection import APP_COLUMNS, app_projection, to_dict
+from applibry_api.application.v1.apps.schema import AppSchema
+from applibry_api.domain.enums.app_status import AppStatus
+from applibry_api.domain.enums.pricing_model import PricingModel
+import main  # noqa: F401  registers every mapped entity before the mappers configure
+
+
+def compiled(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_projection_selects_exactly_the_app_schema_fields():
+    names = [column.key for column in app_projection().selected_columns]
+
+    assert names == [column.key for column in APP_COLUMNS] + ["category", "tags", "platforms"]
+    assert set(names) == set(AppSchema.model_fields)
+
+
+def test_extra_columns_are_appended():
+    names = [column.key for column in app_projection(literal_column("1").label("rank_score")).selected_columns]
+
+    assert names[-1] == "rank_score"
+
+
+def test_relations_are_aggregated_in_the_same_statement():
+    sql = compiled(app_projection())
+
+    assert sql.count("json_build_object(") == 3
+    assert sql.count("json_agg(") == 2
+    assert "search_vector" not in sql
+    assert "users" not in sql
+
+
+def test_projected_rows_validate_as_app_schema():
+    now = datetime.now(timezone.utc)
+    relation = {
+        "id": str(uuid.uuid4()), "name": "Productivity", "description": "Get things done",
+        "is_active": True, "created_at": now.isoformat(), "last_updated_at": now.isoformat(),
+    }
+    values = {
+        "id": uuid.uuid4(), "name": "Notion", "slug": "notion", "description": "Notes and docs",
+        "brief": "Notes", "price": 0.0, "website": "https://notion.so", "meta_title": "Notion",
+        "meta_keywords": "notes", "meta_description": "Notes and docs", "icon": None, "banner": None,
+        "status": AppStatus.PUBLISHED, "pricing_model": PricingModel.FREE, "category_id": uuid.uuid4(),
+        "subscribers": 3, "ratings": 0, "reviews": 0, "shares": 0, "rank": 1, "published_at": now,
+        "created_at": now, "last_updated_at": now,
+        "category": {**relation, "icon": None, "app_count": 1, "subscribers": 3},
+        "tags": [relation],
+        "platforms": [],
+    }
+    row = result_tuple(list(values))(list(values.values()))
+
+    app = AppSchema.model_validate(to_dict(row))
+
+    assert app.category.name == "Productivity"
+    assert [tag.name for tag in app.tags] == ["Productivity"]
+    assert app.platforms == []
@@ -0,0 +1,36 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from explain_queries import QUERIES, explain, scans
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (a migrated Postgres database) is not set"
+)
+
+
+@pytest.fixture(scope="module")
+def plans() -> dict[str, list[tuple[str, str, str]]]:
+    async def explain_all():
+        engine = create_async_engine(TEST_DATABASE_URL)
+        try:
+            async with engine.connect() as connection:
+                # Off, so even a small test database plans an index whenever one can serve the query
+                await connection.execute(text("SET LOCAL enable_seqscan = off"))
+                return {name: scans(await explain(connection, stmt)) for name, stmt in QUERIES.items()}
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(explain_all())
+
+
+@pytest.mark.parametrize("name", list(QUERIES))
+def test_hot_queries_never_plan_a_sequential_scan(plans, name):
+    seq_scans = [table for node, table, _ in plans[name] if node == "Seq Scan"]
+
+    assert seq_scans == [], f"{name} scans {seq_scans} sequentially"
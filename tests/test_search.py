@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import literal_column
+from sqlalchemy.dialects import postgresql
+
+from applibry_api.application.v1.apps.search import (
+    InMemoryAppSearchIndex,
+    after_rank_cursor,
+    build_search_query,
+    tokenize,
+)
+from applibry_api.domain.exceptions.base_exception import AppBadRequestException
+from applibry_api.infrastructure.persistence.cursor import APP_NAME_CURSOR, APP_SEARCH_CURSOR
+
+
+def compile_sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.fixture
+def index():
+    index = InMemoryAppSearchIndex()
+    index.add(1, "Notion", brief="Notes and docs", tag_names=["productivity"])
+    index.add(2, "Obsidian", brief="Markdown notes", description="A notion of linked thinking")
+    index.add(3, "Todoist", brief="Task manager", meta_keywords="tasks todo productivity")
+    index.add(4, "Café Finder", brief="Find coffee nearby")
+    return index
+
+
+def test_tokenize_lowercases_and_keeps_accents():
+    assert tokenize("Café Crème, e-mail & foo_bar 42") == ["café", "crème", "e", "mail", "foo", "bar", "42"]
+    assert tokenize(None) == []
+    assert tokenize("  -- ") == []
+
+
+def test_name_match_outranks_description_match(index):
+    results = index.search("notion")
+
+    assert [app_id for app_id, _ in results] == [1, 2]
+    assert results[0][1] > results[1][1]
+
+
+def test_terms_match_as_prefixes_and_all_must_match(index):
+    assert [app_id for app_id, _ in index.search("not")] == [1, 2]
+    assert [app_id for app_id, _ in index.search("produc")] == [1, 3]
+    assert [app_id for app_id, _ in index.search("notes mark")] == [2]
+    assert index.search("notion task") == []
+
+
+def test_accents_are_matched_as_indexed(index):
+    # The 'simple' text search config keeps accents, so the query has to as well
+    assert [app_id for app_id, _ in index.search("Café")] == [4]
+    assert index.search("cafe") == []
+
+
+def test_equal_ranks_are_ordered_by_name():
+    index = InMemoryAppSearchIndex()
+    index.add("b", "Beta board")
+    index.add("a", "Alpha board")
+
+    assert [app_id for app_id, _ in index.search("board")] == ["a", "b"]
+
+
+def test_removed_apps_stop_matching(index):
+    index.remove(1)
+
+    assert [app_id for app_id, _ in index.search("notion")] == [2]
+    assert [app_id for app_id, _ in index.search("produc")] == [3]
+    assert len(index) == 3
+
+
+def test_search_query_is_a_prefix_conjunction():
+    assert "to_tsquery('simple'::regconfig, CAST('note:* & tak:*' AS TEXT))" in compile_sql(
+        build_search_query("Note, tak")
+    )
+    assert build_search_query("!!") is None
+
+
+def test_search_cursor_round_trips_the_exact_rank():
+    rank = 0.1 + 0.2  # not representable in a shorter decimal form
+    cursor = APP_SEARCH_CURSOR.encode(rank, "Notion")
+
+    assert APP_SEARCH_CURSOR.decode(cursor) == (rank, "Notion")
+
+
+def test_search_cursor_rejects_other_listings_cursors():
+    with pytest.raises(AppBadRequestException):
+        APP_SEARCH_CURSOR.decode(APP_NAME_CURSOR.encode("Notion"))
+    with pytest.raises(AppBadRequestException):
+        APP_SEARCH_CURSOR.decode("not-a-cursor")
+
+
+def test_after_rank_cursor_continues_below_the_rank_then_after_the_name():
+    sql = compile_sql(after_rank_cursor(literal_column("search_rank"), 0.5, "Notion"))
+
+    assert sql == "search_rank < 0.5 OR search_rank = 0.5 AND apps.name > 'Notion'"
@@ -0,0 +1,137 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.util import greenlet_spawn
+
+from applibry_api.application.v1.apps.service import AppService, app_service
+from applibry_api.application.v1.categories.service import CategoryService, category_service
+from applibry_api.domain.entities.category import Category
+from applibry_api.domain.utilities import token_service
+from applibry_api.infrastructure.cache.public_cache import PUBLIC_CATEGORIES_NAMESPACE, public_cache
+from applibry_api.infrastructure.cache.result_cache import cache_key
+from applibry_api.infrastructure.persistence import database
+from main import app
+
+
+def run_in_greenlet(fn):
+    # The async-adapted pool waits through await_only, which needs SQLAlchemy's greenlet context
+    async def runner():
+        return await greenlet_spawn(fn)
+
+    return asyncio.run(runner())
+
+
+def test_pool_counts_checkouts_and_timeouts():
+    pool = database.InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.05)
+
+    def checkouts():
+        first = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        first.close()
+        pool.connect().close()  # reuses the returned connection
+
+    run_in_greenlet(checkouts)
+
+    assert pool.checkouts == 3
+    assert pool.timeouts == 1
+    assert pool.wait_max >= 0.05
+    assert pool.wait_total >= pool.wait_max
+
+
+def test_pool_metrics_report_the_engine_pool():
+    metrics = database.pool_metrics()
+
+    assert metrics["pool_class"] == "InstrumentedQueuePool"
+    assert {"checkouts", "checkout_timeouts", "wait_avg_ms", "wait_max_ms", "checked_out"} <= metrics.keys()
+
+
+def get(asgi_app, path: str, **kwargs) -> httpx.Response:
+    async def request() -> httpx.Response:
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, **kwargs)
+
+    return asyncio.run(request())
+
+
+@pytest.fixture
+def client():
+    return lambda path: get(app, path)
+
+
+def engine_checkouts() -> int:
+    return database.engine.sync_engine.pool.checkouts
+
+
+def test_routes_without_a_service_never_check_out_a_connection(client):
+    before = engine_checkouts()
+
+    assert client("/").status_code == 200
+    assert engine_checkouts() == before
+
+
+def test_public_cache_hits_never_check_out_a_connection(client):
+    cached = {"data": [], "next_cursor": None, "total": 0, "success": True, "message": "Success"}
+    asyncio.run(public_cache.set(PUBLIC_CATEGORIES_NAMESPACE, cache_key(search=None, cursor=None, limit=20), cached))
+    before = engine_checkouts()
+
+    response = client("/api/v1/public/categories")
+
+    assert response.status_code == 200
+    assert response.json() == cached
+    assert engine_checkouts() == before
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    """Points the primary and replica engines at a SQLite file holding a categories table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'api.db'}", poolclass=database.InstrumentedQueuePool)
+
+    async def create_categories():
+        async with engine.begin() as connection:
+            await connection.run_sync(Category.__table__.create)
+
+    asyncio.run(create_categories())
+    engine.sync_engine.pool.checkouts = 0
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "read_engine", engine)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def bearer() -> dict[str, str]:
+    user = SimpleNamespace(username="jane", id=uuid.uuid4())
+    return {"Authorization": f"Bearer {token_service.create_access_token(user)}"}
+
+
+def test_a_db_backed_route_checks_out_one_connection(sqlite_engine):
+    response = get(app, f"/api/v1/categories/{uuid.uuid4()}", headers=bearer())
+
+    assert response.status_code == 404  # the query ran against the empty table
+    assert sqlite_engine.sync_engine.pool.checkouts == 1
+
+
+def test_dependencies_sharing_the_session_check_out_one_connection(sqlite_engine):
+    probe = FastAPI()
+
+    @probe.get("/probe")
+    async def both_services(
+        apps: AppService = Depends(app_service),
+        categories: CategoryService = Depends(category_service),
+    ):
+        await apps.db.execute(text("SELECT 1"))
+        await categories.db.execute(text("SELECT 1"))
+        return {"shared": apps.db is categories.db}
+
+    response = get(probe, "/probe")
+
+    assert response.json() == {"shared": True}
+    assert sqlite_engine.sync_engine.pool.checkouts == 1
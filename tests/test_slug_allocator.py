@@ -0,0 +1,139 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from applibry_api.domain.entities.app import App
+from applibry_api.infrastructure.persistence.slug_allocator import (
+    add_with_unique_slug,
+    allocate_slug,
+    allocate_slugs,
+    next_free_slug,
+    update_with_unique_slug,
+)
+
+
+def unique_violation(constraint: str) -> IntegrityError:
+    return IntegrityError("INSERT INTO apps ...", {}, Exception(
+        f'duplicate key value violates unique constraint "{constraint}"'
+    ))
+
+
+class FakeResult:
+    def __init__(self, values):
+        self._values = values
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._values)
+
+
+class FakeSession:
+    """Answers every slug query with all taken slugs, which is a superset of what the SQL would return.
+
+    ``race`` lists slugs a concurrent writer takes between allocation and the write.
+    """
+
+    def __init__(self, taken=(), race=(), violation="apps_slug_key"):
+        self.taken = set(taken)
+        self.race = list(race)
+        self.violation = violation
+        self.queries = 0
+        self.entity = None
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return FakeResult(sorted(self.taken))
+
+    async def flush(self):
+        pass
+
+    def add(self, entity):
+        self.entity = entity
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+        if self.entity.slug in self.race:
+            self.race.remove(self.entity.slug)
+            self.taken.add(self.entity.slug)
+            raise unique_violation(self.violation)
+        self.taken.add(self.entity.slug)
+
+
+@pytest.mark.parametrize("taken, expected", [
+    (set(), "notion"),
+    ({"notion-1"}, "notion"),
+    ({"notion"}, "notion-1"),
+    ({"notion", "notion-1", "notion-3"}, "notion-4"),
+    # Other slugs sharing the prefix are not numeric suffixes of this base
+    ({"notion", "notion-pro", "notion-2x", "notion-pro-7"}, "notion-1"),
+    # Suffixes never compound into notion-1-1
+    ({"notion", "notion-1", "notion-1-1"}, "notion-2"),
+])
+def test_next_free_slug(taken, expected):
+    assert next_free_slug("notion", taken) == expected
+
+
+def test_allocate_slug_uses_a_single_query():
+    db = FakeSession(taken={"notion", "notion-2"})
+
+    assert asyncio.run(allocate_slug(db, App.slug, "Notion")) == "notion-3"
+    assert db.queries == 1
+
+
+def test_allocate_slugs_separates_names_colliding_within_the_batch():
+    db = FakeSession(taken={"notion"})
+
+    slugs = asyncio.run(allocate_slugs(db, App.slug, ["Notion", "notion!", "Todoist"]))
+
+    assert slugs == {"Notion": "notion-1", "notion!": "notion-2", "Todoist": "todoist"}
+
+
+def test_allocate_slugs_skips_the_prefix_query_without_collisions():
+    db = FakeSession()
+
+    assert asyncio.run(allocate_slugs(db, App.slug, ["Notion", "Todoist"])) == {
+        "Notion": "notion", "Todoist": "todoist"
+    }
+    assert db.queries == 1
+
+
+def test_add_retries_when_a_concurrent_insert_takes_the_slug():
+    db = FakeSession(taken={"notion"}, race={"notion-1"})
+    entity = SimpleNamespace(id=uuid4(), slug=None)
+
+    asyncio.run(add_with_unique_slug(db, entity, App.slug, "Notion"))
+
+    assert entity.slug == "notion-2"
+
+
+def test_add_gives_up_after_the_last_attempt():
+    db = FakeSession(race={"notion", "notion-1", "notion-2"})
+    entity = SimpleNamespace(id=uuid4(), slug=None)
+
+    with pytest.raises(IntegrityError):
+        asyncio.run(add_with_unique_slug(db, entity, App.slug, "Notion", attempts=3))
+
+
+def test_other_unique_violations_are_not_retried():
+    db = FakeSession(race={"notion"}, violation="apps_name_key")
+    entity = SimpleNamespace(id=uuid4(), slug=None)
+
+    with pytest.raises(IntegrityError):
+        asyncio.run(add_with_unique_slug(db, entity, App.slug, "Notion"))
+    assert db.race == []  # failed once, not retried
+
+
+def test_update_retries_when_a_concurrent_write_takes_the_slug():
+    db = FakeSession(taken={"notion"}, race={"notion-1"})
+    db.entity = entity = SimpleNamespace(id=uuid4(), slug="old-name")
+
+    asyncio.run(update_with_unique_slug(db, entity, App.slug, "Notion"))
+
+    assert entity.slug == "notion-2"